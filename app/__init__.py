@@ -12,7 +12,7 @@ configurations. This design supports:
 - Modular architecture with clear component boundaries
 
 Application Architecture:
-- Blueprints: Organize routes by functionality (main routes, error handlers)
+- Blueprints: Organize routes by functionality (main routes, API, error handlers)
 - Context Processors: Inject global template variables (navigation, footer)
 - Configuration: Environment-aware settings management
 - Static Assets: Efficient serving of CSS, JavaScript, and images
@@ -23,9 +23,26 @@ The factory pattern allows this application to be imported by WSGI servers
 
 from flask import Flask
 from .routes import routes
+from .api import api, api_v1
 from .error_handlers import errors
 from .context_processor import inject_nav_links, inject_footer_links
 from .config import apply_config
+from .core.access_log import init_access_log
+from .core.assets import init_assets
+from .core.cache_policy import cache_cli
+from .core.health import init_health
+from .core.images import init_images
+from .core.media import init_media
+from .core.offline import init_offline
+from .core.rate_limit import init_rate_limit
+from .core.render_cache import init_render_cache
+from .core.streaming import init_streaming
+from .core.template_minify import init_template_minify
+from .core.tenants import init_tenants
+from .core.tracing import init_tracing
+from .core.warmup import init_warmup
+from .data.content_store import init_content
+from .build import build_cli
 
 
 def create_app(test_config=None):
@@ -45,9 +62,22 @@ def create_app(test_config=None):
 
     Components Registered:
         - Blueprint routes: Main application endpoints and navigation
+        - Template minification: whitespace/comments stripped at compile time
+        - Image resizing: /img/<width>/<path> with a disk cache (Pillow optional)
+        - Offline support: generated service worker and web app manifest
         - Error handlers: Custom 404, 500 error pages with consistent styling
         - Context processors: Global template variables for navigation and footer
         - Configuration: Environment-aware settings from pyproject.toml and env vars
+        - Content store: app/content snapshot with hot reload
+        - Tenant registry: Host header -> content, shared render cache budget
+        - Streaming render: head and navbar flushed before the content renders
+        - Static assets: Hashed manifest, critical CSS helpers and build commands
+        - Media registry: every static image/video with URL, type and dimensions
+        - Rate limiting: Per-IP/per-route token buckets and load shedding (WSGI)
+        - Access log: JSON line per request through a background writer (WSGI)
+        - Tracing: Sampled request spans exported as OTLP/JSON
+        - Probes: /livez and /readyz answered at the WSGI layer
+        - Warmup: every page and API payload rendered once before serving
     """
     # Create the Flask application instance
     app = Flask(__name__)
@@ -59,13 +89,45 @@ def create_app(test_config=None):
     if test_config:
         app.config.update(test_config)
 
+    # Strip template whitespace/comments once, at compile time
+    init_template_minify(app)
+
     # Register Blueprint modules for modular route organization
     app.register_blueprint(routes)  # Main application routes and pages
+    app.register_blueprint(api)  # Read-only JSON/fragment API under /api
+    app.register_blueprint(api_v1)  # Versioned content API under /api/v1
     app.register_blueprint(errors)  # Error handling (404, 500, etc.)
+    init_images(app)  # /img/<width>/<path> resized content images
+    init_offline(app)  # /sw.js and /site.webmanifest
 
     # Register context processors for global template data
     # These functions run before every template render to inject common variables
     app.context_processor(inject_nav_links)  # Navigation menu items and links
     app.context_processor(inject_footer_links)  # Footer social media and external links
 
+    # Load the default content and the Host -> tenant registry; content
+    # reloads swap a tenant's snapshot and drop its cached renders
+    init_tenants(app, init_content(app))
+    init_render_cache(app)  # Stale-while-revalidate page cache
+    init_streaming(app)  # Page misses flush head + navbar before the content
+
+    # Span the request phases of sampled requests (OTLP/JSON export)
+    init_tracing(app)
+
+    # Load the hashed static manifest and register asset template helpers
+    init_assets(app)
+    init_media(app)  # Media lookups by name/URL, scanned once
+
+    # Register offline build steps (flask build css, ...)
+    app.cli.add_command(build_cli)
+    app.cli.add_command(cache_cli)  # flask cache purge --old ...
+
+    # Reject abusive clients (429) and shed overload (503) before routing
+    init_rate_limit(app)
+    init_access_log(app)  # Logs rejected requests too
+
+    # Startup checks; /livez and /readyz bypass everything above
+    init_health(app)
+    init_warmup(app)  # Pre-render pages; /readyz is 503 until this is done
+
     return app
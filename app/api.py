@@ -0,0 +1,263 @@
+"""
+Flask API Module
+================
+
+Read-only endpoints that serve precomputed portfolio data to scripts and
+other front ends. Resolves the tenant from the Host header like the pages.
+
+Endpoints:
+- /api/slides/<carousel_id>/<index>: one carousel slide as JSON, or as an
+  HTML fragment with ``?format=html`` for lazy carousel loading
+- /api/v1/: index of the versioned content API
+- /api/v1/<collection>: raw content collections (institutions, technologies,
+  certifications, education-programs, social-links)
+- /api/v1/cards/<page>: derived card models as rendered on each page
+- /api/search?q=...: site search results (``&prefix=1`` while typing);
+  /api/search/suggest?q=...: autocomplete for the word being typed
+
+Architecture:
+- Blueprint pattern, mounted under /api and /api/v1
+- Data comes from the cached route view models, never rebuilt per request
+- Rendered slide fragments and serialized v1 payloads (body, ETag, gzip/br)
+  are cached per tenant and dropped together with the view models
+"""
+
+from flask import (
+    Blueprint,
+    abort,
+    jsonify,
+    render_template,
+    request,
+    url_for,
+)
+
+from .core.cache_policy import CAROUSEL_COLLECTIONS, apply_cache_policy, cache_policy
+from .core.http_cache import CachedPayload, payload_response
+from .core.tenants import resolve_tenant, tenant_cache
+from .data.content_store import current_content
+from .data.search import (
+    DEFAULT_LIMIT,
+    MAX_QUERY_LENGTH,
+    SEARCH_COLLECTIONS,
+    get_search_index,
+)
+from .data.view_models import CAROUSELS, get_view_model
+
+api = Blueprint("api", __name__, url_prefix="/api")
+api.before_request(resolve_tenant)
+api.after_request(apply_cache_policy)
+
+api_v1 = Blueprint("api_v1", __name__, url_prefix="/api/v1")
+api_v1.before_request(resolve_tenant)
+api_v1.after_request(apply_cache_policy)
+
+API_VERSION = "v1"
+API_MAX_AGE = 300  # Browser TTL of API responses
+
+# URL name -> collection in the content store snapshot
+COLLECTIONS = {
+    "institutions": "institutions",
+    "technologies": "technologies",
+    "certifications": "certifications",
+    "education-programs": "education_programs",
+    "social-links": "social_links",
+}
+
+# URL name -> card lists derived from a page view model
+CARD_MODELS = {
+    "education": lambda: get_view_model("education")["cards"],
+    "certifications": lambda: get_view_model("certifications")["cards"],
+    "connect": lambda: get_view_model("connect")["cards"],
+    "techstack": lambda: {
+        category: get_view_model("techstack")[f"{category}_cards"]
+        for category in ("frontend", "backend", "infra")
+    },
+    "home": lambda: get_view_model("home")["home_card"],
+}
+
+# URL name -> content collections each card model is built from
+CARD_COLLECTIONS = {
+    "education": ("education_programs", "institutions"),
+    "certifications": ("certifications",),
+    "connect": ("social_links",),
+    "techstack": ("technologies",),
+    "home": ("home_card",),
+}
+
+
+def _get_slides(carousel_id):
+    """Return the slide list for a carousel or abort with 404."""
+    if carousel_id not in CAROUSELS:
+        abort(404)
+    return get_view_model(CAROUSELS[carousel_id])["slides"]
+
+
+def _slide_fragment(carousel_id, index, slide):
+    """Render (once) the HTML fragment for a single slide."""
+    cache = tenant_cache("slide_fragments")
+    key = (carousel_id, index)
+    fragment = cache.get(key)
+    if fragment is None:
+        fragment = cache[key] = render_template(
+            "components/common/carousel_slide.html", slide=slide
+        )
+    return fragment
+
+
+@api.route("/slides/<carousel_id>/<int:index>")
+@cache_policy(*CAROUSEL_COLLECTIONS, layout=False, max_age=API_MAX_AGE)
+def slide(carousel_id, index):
+    """
+    Single carousel slide for lazy loading
+
+    Args:
+        carousel_id (str): Carousel identifier, e.g. ``achievementsCarousel``
+        index (int): Zero-based slide index
+
+    Returns:
+        JSON ``{carousel_id, index, total, slide}`` or, with ``format=html``,
+        the rendered slide body
+    """
+    slides = _get_slides(carousel_id)
+    if index >= len(slides):
+        abort(404)
+
+    if request.args.get("format") == "html":
+        return _slide_fragment(carousel_id, index, slides[index])
+
+    return jsonify(
+        carousel_id=carousel_id,
+        index=index,
+        total=len(slides),
+        slide=slides[index],
+    )
+
+
+@api.route("/search")
+@cache_policy(*SEARCH_COLLECTIONS, layout=False, max_age=API_MAX_AGE)
+def search():
+    """
+    Site search
+
+    Args:
+        q (str): Query; whole words match
+        limit (int): Maximum results (default 20)
+        prefix (bool): ``1`` for results while typing: the last word also
+            matches as a prefix unless the query ends with a space
+
+    Returns:
+        JSON ``{query, results}``; each result has ``title``, ``snippet``,
+        ``section``, ``url`` (page showing it) and ``href`` (external link)
+    """
+    query = request.args.get("q", "")[:MAX_QUERY_LENGTH]
+    limit = min(request.args.get("limit", DEFAULT_LIMIT, type=int), DEFAULT_LIMIT)
+    prefix = request.args.get("prefix", "") in ("1", "true")
+    results = get_search_index().search(query, max(limit, 1), prefix=prefix)
+    return jsonify(query=query, results=list(results))
+
+
+@api.route("/search/suggest")
+@cache_policy(*SEARCH_COLLECTIONS, layout=False, max_age=API_MAX_AGE)
+def search_suggest():
+    """
+    Search autocomplete
+
+    Returns:
+        JSON ``{query, suggestions}``: the query completed with the most
+        frequent indexed words starting with its last word that also occur
+        alongside its earlier words
+    """
+    query = request.args.get("q", "")[:MAX_QUERY_LENGTH]
+    return jsonify(query=query, suggestions=list(get_search_index().suggest(query)))
+
+
+@api.errorhandler(404)
+def api_not_found(error):
+    """Return JSON instead of the HTML error page for API lookups."""
+    return jsonify(error="not_found"), 404
+
+
+def _cached_payload(key, build):
+    """Serialize ``build()`` once and keep the payload for later requests."""
+    cache = tenant_cache("api_payloads")
+    payload = cache.get(key)
+    if payload is None:
+        payload = cache[key] = CachedPayload.json(build())
+    return payload
+
+
+@api_v1.route("/")
+@cache_policy(layout=False, max_age=API_MAX_AGE)
+def index():
+    """
+    Content API index
+
+    Returns:
+        JSON listing every collection and card model with its URL
+    """
+    return payload_response(
+        _cached_payload(
+            "index",
+            lambda: {
+                "version": API_VERSION,
+                "collections": {
+                    name: url_for("api_v1.collection", name=name)
+                    for name in COLLECTIONS
+                },
+                "cards": {
+                    name: url_for("api_v1.cards", name=name) for name in CARD_MODELS
+                },
+            },
+        )
+    )
+
+
+@api_v1.route("/<name>")
+@cache_policy(
+    by=("name", {url: (name,) for url, name in COLLECTIONS.items()}),
+    layout=False,
+    max_age=API_MAX_AGE,
+)
+def collection(name):
+    """
+    Raw content collection
+
+    Args:
+        name (str): Collection name, e.g. ``technologies``
+
+    Returns:
+        Precomputed JSON payload with ETag and compressed variants
+    """
+    if name not in COLLECTIONS:
+        abort(404)
+    return payload_response(
+        _cached_payload(
+            ("collection", name),
+            lambda: {name: current_content().raw[COLLECTIONS[name]]},
+        )
+    )
+
+
+@api_v1.route("/cards/<name>")
+@cache_policy(by=("name", CARD_COLLECTIONS), layout=False, max_age=API_MAX_AGE)
+def cards(name):
+    """
+    Derived card models for a page
+
+    Args:
+        name (str): Page name, e.g. ``certifications``
+
+    Returns:
+        Precomputed JSON payload with ETag and compressed variants
+    """
+    if name not in CARD_MODELS:
+        abort(404)
+    return payload_response(
+        _cached_payload(("cards", name), lambda: {name: CARD_MODELS[name]()})
+    )
+
+
+@api_v1.errorhandler(404)
+def api_v1_not_found(error):
+    """Return JSON instead of the HTML error page for API lookups."""
+    return jsonify(error="not_found"), 404
@@ -0,0 +1,13 @@
+"""
+Build Pipeline Package
+======================
+
+Offline build steps that precompute static artifacts (bundled CSS, critical
+CSS, hashed filenames) so request handling never does that work at runtime.
+Steps are exposed as ``flask build <step>`` commands and record their
+outputs in ``app/static/dist/manifest.json``.
+"""
+
+from .cli import build_cli
+
+__all__ = ["build_cli"]
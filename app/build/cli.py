@@ -0,0 +1,167 @@
+"""
+Build Command Line Interface
+============================
+
+Registers the ``flask build`` command group. Each subcommand is one step of
+the asset pipeline; static outputs go into ``app/static/dist``, the content
+snapshot next to the content files.
+
+Usage:
+    flask --app main build css
+    flask --app main build vendor [--source DIR]
+    flask --app main build media
+    flask --app main build video [--ffmpeg PATH]
+    flask --app main build content
+    flask --app main build refs [--prune]
+"""
+
+import os
+import shutil
+import subprocess
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+
+from ..data.content_store import ContentError, current_content, write_binary_snapshot
+from .css import bundle_css, critical_css_by_layout
+from .media import build_media_index
+from .manifest import update_manifest, write_hashed
+from .references import build_reference_graph, tenant_contents
+from .vendor import build_vendor_assets
+from .video import transcode
+
+build_cli = AppGroup("build", help="Asset build pipeline commands.")
+
+
+@build_cli.command("css")
+def build_css():
+    """Bundle and minify local CSS and extract per-layout critical CSS."""
+    static_folder = current_app.static_folder
+    template_folder = os.path.join(current_app.root_path, current_app.template_folder)
+    bundle = bundle_css(static_folder)
+    bundle_path = write_hashed(static_folder, "css/bundle.css", bundle.encode("utf-8"))
+    critical = critical_css_by_layout(bundle, template_folder)
+    update_manifest(static_folder, "assets", {"css/bundle.css": bundle_path})
+    update_manifest(static_folder, "critical", critical)
+
+    click.echo(f"css/bundle.css -> {bundle_path} ({len(bundle)} bytes)")
+    for layout, css in sorted(critical.items()):
+        click.echo(f"  critical[{layout}]: {len(css)} bytes")
+
+
+@build_cli.command("vendor")
+@click.option(
+    "--source",
+    type=click.Path(exists=True, file_okay=False),
+    help="Directory with pinned vendor files; downloads from the CDN if omitted.",
+)
+def build_vendor(source):
+    """Self-host subset Bootstrap and Font Awesome assets."""
+    static_folder = current_app.static_folder
+    entries = build_vendor_assets(current_app.root_path, static_folder, source)
+    update_manifest(static_folder, "assets", entries)
+
+    for name, path in sorted(entries.items()):
+        size = os.path.getsize(os.path.join(static_folder, path))
+        click.echo(f"{name} -> {path} ({size} bytes)")
+
+
+@build_cli.command("media")
+def build_media():
+    """Index image dimensions, dominant colors and blur-up placeholders."""
+    static_folder = current_app.static_folder
+    index = build_media_index(static_folder)
+    update_manifest(static_folder, "media", index)
+
+    placeholders = sum("placeholder" in meta for meta in index.values())
+    click.echo(f"media: {len(index)} images, {placeholders} placeholders")
+
+
+@build_cli.command("video")
+@click.option(
+    "--ffmpeg",
+    default="ffmpeg",
+    show_default=True,
+    help="ffmpeg executable to transcode with.",
+)
+def build_video(ffmpeg):
+    """Transcode videos and heavy GIFs into posters, previews and HLS/MP4."""
+    executable = shutil.which(ffmpeg)
+    if executable is None:
+        raise click.ClickException(f"{ffmpeg} not found; install ffmpeg first")
+    static_folder = current_app.static_folder
+    try:
+        entries = transcode(static_folder, executable, log=click.echo)
+    except subprocess.CalledProcessError as exc:
+        raise click.ClickException(
+            f"ffmpeg failed: {exc.stderr.decode('utf-8', 'replace').strip()}"
+        ) from exc
+    update_manifest(static_folder, "video", entries)
+
+
+@build_cli.command("content")
+def build_content():
+    """Compile the content directory into a binary snapshot for fast startup."""
+    store = current_app.extensions["content"]
+    target, snapshot = write_binary_snapshot(store.path)
+    click.echo(
+        f"{store.path.name} -> {target.name} "
+        f"({target.stat().st_size} bytes, version {snapshot.version})"
+    )
+
+
+@build_cli.command("refs")
+@click.option(
+    "--prune",
+    is_flag=True,
+    help="Delete static files nothing references (for the deploy artifact).",
+)
+def build_refs(prune):
+    """
+    Check static file references; fail on missing files, list unused ones.
+
+    With ``TENANTS_DIR`` set, every tenant's content is walked too; when the
+    directory is not there (mounted at runtime), ``--prune`` refuses to run,
+    since tenant content may reference any file.
+    """
+    tenants_dir = current_app.config.get("TENANTS_DIR")
+    tenants = []
+    if tenants_dir and os.path.isdir(tenants_dir):
+        try:
+            tenants = list(tenant_contents(tenants_dir))
+        except ContentError as exc:
+            raise click.ClickException(f"tenant content: {exc}") from exc
+    elif tenants_dir and prune:
+        raise click.ClickException(
+            f"TENANTS_DIR {tenants_dir} not found; its content may reference "
+            "any static file, not pruning"
+        )
+    graph = build_reference_graph(
+        current_app, current_content(), current_app.extensions["media"], tenants
+    )
+    dangling = graph.dangling()
+    for name, sources in dangling.items():
+        click.echo(f"missing {name} <- {', '.join(sources)}", err=True)
+    if dangling:
+        raise click.ClickException(f"{len(dangling)} referenced static files missing")
+    unresolved = graph.unresolved()
+    for pattern, sources in unresolved.items():
+        click.echo(f"unresolved {pattern} <- {', '.join(sources)}", err=True)
+    if unresolved and prune:
+        raise click.ClickException(
+            f"{len(unresolved)} reference patterns match no file; not pruning"
+        )
+
+    unused = (
+        graph.prune()
+        if prune
+        else [(name, graph.files[name]) for name in graph.unreferenced()]
+    )
+    for name, size in unused:
+        click.echo(f"  {'removed' if prune else 'unused'}: {name} ({size} bytes)")
+    click.echo(
+        f"refs: {len(graph.edges)} sources, {len(graph.referenced())} files "
+        f"referenced, {len(unused)} unreferenced "
+        f"({sum(size for _, size in unused)} bytes{' removed' if prune else ''})"
+    )
@@ -0,0 +1,274 @@
+"""
+CSS Build Module
+================
+
+Bundles and minifies the local stylesheets and extracts the critical
+(above-the-fold) rules for each page layout. The output feeds the hashed
+static manifest consumed by ``app.core.assets`` at runtime.
+
+Features:
+- Comment and whitespace minification without external tooling
+- Ordered bundling of the stylesheets currently linked from head.html
+- Per-layout critical CSS derived from the classes, ids and tags used by
+  the templates rendered above the fold
+
+Architecture:
+- Pure functions operating on strings, so the build is deterministic
+- A tiny brace-matching parser that understands rules and nested
+  @media/@supports groups, which is all the local stylesheets use
+- Layout keys mirror ``PAGE_TEMPLATES`` in ``app.core.template_factory``
+"""
+
+import re
+from pathlib import Path
+
+# Stylesheets bundled in cascade order. utility.css and custom.css are not
+# linked from head.html today, so bundling them would change the design.
+CSS_BUNDLE = ["css/style.css", "css/cards.css"]
+
+# Templates rendered on every page above the fold (fixed footer included)
+SHELL_TEMPLATES = [
+    "base.html",
+    "components/common/header/head.html",
+    "components/common/navbar/navbar.html",
+    "components/common/navbar/nav_items.html",
+    "components/common/page_title.html",
+    "components/common/footer/footer.html",
+    "components/common/footer/footer_items.html",
+]
+
+# Layout-specific templates, keyed like PAGE_TEMPLATES
+LAYOUT_TEMPLATES = {
+    "card_grid": [
+        "page_layouts/card_grid_page.html",
+        "page_layouts/multi_section_page.html",
+        "components/common/tech_section.html",
+        "components/common/cards.html",
+    ],
+    "carousel": [
+        "page_layouts/carousel_page.html",
+        "components/common/carousel.html",
+        "components/common/carousel_slide.html",
+        "components/common/media.html",
+        "components/common/sources.html",
+    ],
+    "horizontal_card": [
+        "page_layouts/single_card_page.html",
+        "components/common/horizontal_card.html",
+    ],
+    "landing": [
+        "pages/landing.html",
+        "components/landing/landing_content.html",
+        "components/common/landing_header.html",
+        "components/common/landing_cards.html",
+        "components/common/landing_card.html",
+        "components/common/professional_info.html",
+        "components/common/landing_footer.html",
+    ],
+    "error": [
+        "components/errors/400.html",
+        "components/errors/404.html",
+        "components/errors/500.html",
+    ],
+}
+
+# Selector tokens that are always present in a rendered document
+ALWAYS_TAGS = {"html", "body", "head"}
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_SPACE_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+_COLON_RE = re.compile(r":\s+")
+_CLASS_ATTR_RE = re.compile(r"""class=(["'])(.*?)\1""", re.S)
+_ID_ATTR_RE = re.compile(r"""id=(["'])(.*?)\1""", re.S)
+_TAG_RE = re.compile(r"<([a-zA-Z][\w-]*)")
+_WORD_RE = re.compile(r"[A-Za-z_][\w-]*")
+_PSEUDO_RE = re.compile(r"::?[\w-]+(\([^)]*\))?")
+_ATTR_SELECTOR_RE = re.compile(r"\[[^\]]*\]")
+_SEL_CLASS_RE = re.compile(r"\.([\w-]+)")
+_SEL_ID_RE = re.compile(r"#([\w-]+)")
+_SEL_TAG_RE = re.compile(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)")
+_FONT_FAMILY_RE = re.compile(r"font-family:([^;]+)")
+
+
+def strip_comments(css):
+    """Remove ``/* ... */`` comments (including source map annotations)."""
+    return _COMMENT_RE.sub("", css)
+
+
+def minify_css(css):
+    """
+    Minify a stylesheet by removing comments and insignificant whitespace.
+
+    Args:
+        css (str): Source stylesheet
+
+    Returns:
+        str: Minified stylesheet with identical cascade semantics
+    """
+    css = strip_comments(css)
+    css = _SPACE_RE.sub(" ", css)
+    css = _PUNCT_RE.sub(r"\1", css)
+    css = _COLON_RE.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+
+def parse_css(css):
+    """
+    Parse minified CSS into a list of ``(kind, prelude, body)`` nodes.
+
+    ``kind`` is ``"rule"`` for style rules, ``"group"`` for @media/@supports
+    blocks (``body`` is a nested node list), ``"at"`` for other block
+    at-rules such as @keyframes and ``"statement"`` for @import/@charset.
+    """
+    nodes = []
+    i, n = 0, len(css)
+    while i < n:
+        brace = css.find("{", i)
+        semi = css.find(";", i)
+        if brace == -1:
+            break
+        if 0 <= semi < brace and css[i:semi].strip().startswith("@"):
+            nodes.append(("statement", css[i : semi + 1].strip(), None))
+            i = semi + 1
+            continue
+        prelude = css[i:brace].strip()
+        depth, k = 1, brace + 1
+        while k < n and depth:
+            if css[k] == "{":
+                depth += 1
+            elif css[k] == "}":
+                depth -= 1
+            k += 1
+        body = css[brace + 1 : k - 1]
+        if prelude.startswith(("@media", "@supports")):
+            nodes.append(("group", prelude, parse_css(body)))
+        elif prelude.startswith("@"):
+            nodes.append(("at", prelude, body))
+        else:
+            nodes.append(("rule", prelude, body))
+        i = k
+    return nodes
+
+
+def serialize_css(nodes):
+    """Serialize nodes produced by ``parse_css`` back into minified CSS."""
+    parts = []
+    for kind, prelude, body in nodes:
+        if kind == "statement":
+            parts.append(prelude)
+        elif kind == "group":
+            inner = serialize_css(body)
+            if inner:
+                parts.append(f"{prelude}{{{inner}}}")
+        else:
+            parts.append(f"{prelude}{{{body}}}")
+    return "".join(parts)
+
+
+def collect_selectors(template_sources):
+    """
+    Collect the classes, ids and tags referenced by template sources.
+
+    Jinja expressions inside attributes contribute their literal words, so
+    defaults such as ``card_class|default('card ...')`` are picked up.
+
+    Returns:
+        dict: ``{"classes": set, "ids": set, "tags": set}``
+    """
+    classes, ids, tags = set(), set(), set(ALWAYS_TAGS)
+    for source in template_sources:
+        for _, value in _CLASS_ATTR_RE.findall(source):
+            classes.update(_WORD_RE.findall(value))
+        for _, value in _ID_ATTR_RE.findall(source):
+            ids.update(_WORD_RE.findall(value))
+        tags.update(tag.lower() for tag in _TAG_RE.findall(source))
+    return {"classes": classes, "ids": ids, "tags": tags}
+
+
+def _split_selectors(prelude):
+    """Split a selector list on top-level commas (ignoring ``:is(a,b)``)."""
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(prelude):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(prelude[start:i])
+            start = i + 1
+    parts.append(prelude[start:])
+    return parts
+
+
+def _selector_matches(selector, used):
+    """Return True when every class/id/tag in a simple selector is used."""
+    bare = _ATTR_SELECTOR_RE.sub("", _PSEUDO_RE.sub("", selector))
+    return (
+        set(_SEL_CLASS_RE.findall(bare)) <= used["classes"]
+        and set(_SEL_ID_RE.findall(bare)) <= used["ids"]
+        and {t.lower() for t in _SEL_TAG_RE.findall(bare)} <= used["tags"]
+    )
+
+
+def extract_critical(nodes, used):
+    """
+    Filter parsed CSS down to the rules whose selectors match ``used``.
+
+    Selector lists are narrowed to their matching members, groups are kept
+    when any nested rule survives, and @keyframes/@font-face are kept only
+    when a kept declaration references their name or font family.
+    """
+    kept = []
+    referenced = []
+    for kind, prelude, body in nodes:
+        if kind == "rule":
+            selectors = [
+                s for s in _split_selectors(prelude) if _selector_matches(s, used)
+            ]
+            if selectors:
+                kept.append(("rule", ",".join(selectors), body))
+        elif kind == "group":
+            inner = extract_critical(body, used)
+            if inner:
+                kept.append(("group", prelude, inner))
+        elif kind == "at" and prelude.startswith(("@keyframes", "@-webkit-keyframes")):
+            referenced.append((prelude.split(None, 1)[-1], (kind, prelude, body)))
+        elif kind == "at" and prelude == "@font-face":
+            family = _FONT_FAMILY_RE.search(body)
+            if family:
+                referenced.append((family.group(1).strip("\"'"), (kind, prelude, body)))
+    text = serialize_css(kept)
+    for name, node in referenced:
+        if re.search(rf"(?<![\w-]){re.escape(name)}(?![\w-])", text):
+            kept.append(node)
+    return kept
+
+
+def bundle_css(static_folder, files=CSS_BUNDLE):
+    """Concatenate and minify the bundled stylesheets in cascade order."""
+    root = Path(static_folder)
+    return "".join(minify_css((root / name).read_text("utf-8")) for name in files)
+
+
+def critical_css_by_layout(bundle, template_folder):
+    """
+    Compute the critical CSS string for every layout in LAYOUT_TEMPLATES.
+
+    Args:
+        bundle (str): Minified bundle produced by ``bundle_css``
+        template_folder (str): Root of the Jinja template tree
+
+    Returns:
+        dict: Layout key -> critical CSS string
+    """
+    root = Path(template_folder)
+    nodes = parse_css(bundle)
+    shell = [(root / name).read_text("utf-8") for name in SHELL_TEMPLATES]
+    result = {}
+    for layout, templates in LAYOUT_TEMPLATES.items():
+        sources = shell + [(root / name).read_text("utf-8") for name in templates]
+        result[layout] = serialize_css(
+            extract_critical(nodes, collect_selectors(sources))
+        )
+    return result
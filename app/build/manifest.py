@@ -0,0 +1,61 @@
+"""
+Static Manifest Writer
+======================
+
+Writes content-hashed build outputs under ``static/dist`` and records them
+in ``dist/manifest.json``. Each build step merges its own section into the
+manifest so steps can run independently and in any order.
+
+Manifest layout::
+
+    {
+      "assets":   {"css/bundle.css": "dist/css/bundle.1a2b3c4d.css", ...},
+      "critical": {"card_grid": "<minified css>", ...}
+    }
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+DIST_DIRNAME = "dist"
+MANIFEST_NAME = "manifest.json"
+HASH_LENGTH = 8
+
+
+def content_hash(data):
+    """Return the short content hash used in hashed filenames."""
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def write_hashed(static_folder, logical_name, data):
+    """
+    Write ``data`` to ``dist/`` under a content-hashed filename.
+
+    Args:
+        static_folder (str): Flask static folder
+        logical_name (str): Unhashed name, e.g. ``css/bundle.css``
+        data (bytes): File contents
+
+    Returns:
+        str: Path relative to the static folder, e.g.
+        ``dist/css/bundle.1a2b3c4d.css``
+    """
+    stem, dot, suffix = logical_name.rpartition(".")
+    if not dot:
+        stem, suffix = logical_name, ""
+    hashed = f"{stem}.{content_hash(data)}{dot}{suffix}"
+    target = Path(static_folder) / DIST_DIRNAME / hashed
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_bytes(data)
+    return f"{DIST_DIRNAME}/{hashed}"
+
+
+def update_manifest(static_folder, section, entries):
+    """Merge ``entries`` into one manifest section and rewrite the file."""
+    path = Path(static_folder) / DIST_DIRNAME / MANIFEST_NAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = json.loads(path.read_text("utf-8")) if path.exists() else {}
+    manifest.setdefault(section, {}).update(entries)
+    path.write_text(json.dumps(manifest, indent=2, sort_keys=True), "utf-8")
+    return manifest
@@ -0,0 +1,176 @@
+"""
+Media Metadata Index
+====================
+
+Build step that records the intrinsic size of every image under
+``static/images`` plus, for opaque images, a dominant color and a tiny
+base64 blur-up placeholder. The index lands in the ``media`` section of
+the static manifest, so templates can reserve space (``width``/``height``)
+and paint a preview without touching image files at request time.
+
+Index layout::
+
+    "media": {
+      "images/content/ingy-dot-net.jpg": {
+        "width": 1600, "height": 1200,
+        "color": "#3a4b5c",
+        "placeholder": "data:image/jpeg;base64,..."
+      },
+      "images/logos/logo-js.svg": {"width": 630, "height": 630}
+    }
+
+Notes:
+- Transparent images (logos) get no color or placeholder: it would show
+  through the image once loaded
+- SVG sizes come from the root element's ``width``/``height`` or
+  ``viewBox``; raster images need Pillow (``build`` extra) and are skipped
+  without it
+- ``mp4_metadata`` reads duration and frame size from an MP4's ``moov``
+  box; the media registry and ``flask build video`` use it for videos
+"""
+
+import base64
+import io
+import os
+import re
+import struct
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageFilter, ImageOps
+except ImportError:  # pragma: no cover - depends on the environment
+    Image = None
+
+IMAGE_ROOT = "images"
+RASTER_SUFFIXES = (".jpg", ".jpeg", ".png", ".webp", ".gif")
+PLACEHOLDER_WIDTH = 16
+PLACEHOLDER_QUALITY = 40
+
+_SVG_TAG = re.compile(rb"<svg\b[^>]*>", re.IGNORECASE | re.DOTALL)
+_SVG_ATTR = re.compile(rb'\b(width|height|viewBox)\s*=\s*["\']([^"\']+)["\']')
+_SVG_LENGTH = re.compile(rb"^\s*([\d.]+)\s*(px)?\s*$")
+
+
+def _has_alpha(image):
+    if image.mode in ("RGBA", "LA", "PA"):
+        return image.getextrema()[-1][0] < 255
+    return "transparency" in image.info
+
+
+def raster_metadata(path):
+    """Dimensions, and color and placeholder for opaque images."""
+    with Image.open(path) as original:
+        image = ImageOps.exif_transpose(original)
+        meta = {"width": image.width, "height": image.height}
+        if _has_alpha(image):
+            return meta
+        rgb = image.convert("RGB")
+        red, green, blue = rgb.resize((1, 1), Image.BOX).getpixel((0, 0))
+        meta["color"] = f"#{red:02x}{green:02x}{blue:02x}"
+        height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+        preview = rgb.resize((PLACEHOLDER_WIDTH, height), Image.BOX)
+        buffer = io.BytesIO()
+        preview.filter(ImageFilter.GaussianBlur(1)).save(
+            buffer, "JPEG", quality=PLACEHOLDER_QUALITY
+        )
+        encoded = base64.b64encode(buffer.getvalue()).decode("ascii")
+        meta["placeholder"] = f"data:image/jpeg;base64,{encoded}"
+        return meta
+
+
+def svg_metadata(path):
+    """Dimensions from the root ``<svg>`` element, or None when unsized."""
+    tag = _SVG_TAG.search(Path(path).read_bytes())
+    if tag is None:
+        return None
+    attrs = dict(_SVG_ATTR.findall(tag.group(0)))
+    width = _SVG_LENGTH.match(attrs.get(b"width", b""))
+    height = _SVG_LENGTH.match(attrs.get(b"height", b""))
+    if width and height:
+        size = float(width.group(1)), float(height.group(1))
+    elif b"viewBox" in attrs:
+        box = attrs[b"viewBox"].replace(b",", b" ").split()
+        if len(box) != 4:
+            return None
+        size = float(box[2]), float(box[3])
+    else:
+        return None
+    if not all(size):
+        return None
+    return {"width": round(size[0]), "height": round(size[1])}
+
+
+def _iter_boxes(data, start, end):
+    while start + 8 <= end:
+        size, kind = struct.unpack_from(">I4s", data, start)
+        header = 8
+        if size == 1:
+            size, header = struct.unpack_from(">Q", data, start + 8)[0], 16
+        elif size == 0:
+            size = end - start
+        if size < header:
+            return
+        yield kind, start + header, min(start + size, end)
+        start += size
+
+
+def mp4_metadata(path):
+    """Duration (seconds) and frame size of an ISO media file, if found."""
+    moov = None
+    with open(path, "rb") as handle:
+        while moov is None:
+            header = handle.read(8)
+            if len(header) < 8:
+                return {}
+            size, kind = struct.unpack(">I4s", header)
+            if size == 1:
+                size = struct.unpack(">Q", handle.read(8))[0] - 16
+            elif size == 0:
+                size = -1  # box extends to the end of the file
+            else:
+                size -= 8
+            if kind == b"moov":
+                moov = handle.read(size)
+            elif size < 0:
+                return {}
+            else:
+                handle.seek(size, os.SEEK_CUR)
+
+    meta = {}
+    for kind, start, end in _iter_boxes(moov, 0, len(moov)):
+        if kind == b"mvhd":
+            if moov[start] == 1:
+                timescale, duration = struct.unpack_from(">IQ", moov, start + 20)
+            else:
+                timescale, duration = struct.unpack_from(">II", moov, start + 12)
+            if timescale:
+                meta["duration"] = round(duration / timescale, 3)
+        elif kind == b"trak" and "width" not in meta:
+            for sub, sub_start, sub_end in _iter_boxes(moov, start, end):
+                if sub == b"tkhd" and sub_end - sub_start >= 8:
+                    width, height = struct.unpack_from(">II", moov, sub_end - 8)
+                    if width and height:
+                        meta["width"], meta["height"] = width >> 16, height >> 16
+    return meta
+
+
+def build_media_index(static_folder, root=IMAGE_ROOT):
+    """
+    Collect metadata for every image below ``static_folder/root``.
+
+    Returns:
+        dict: Static-relative path -> metadata
+    """
+    static = Path(static_folder)
+    index = {}
+    for path in sorted((static / root).rglob("*")):
+        suffix = path.suffix.lower()
+        if suffix == ".svg":
+            meta = svg_metadata(path)
+        elif suffix in RASTER_SUFFIXES and Image is not None:
+            meta = raster_metadata(path)
+        else:
+            continue
+        if meta:
+            index[path.relative_to(static).as_posix()] = meta
+    return index
@@ -0,0 +1,334 @@
+"""
+Asset Reference Graph
+=====================
+
+Build step that maps every place the app points at a static file to the
+file it names, so a deploy fails on references to files that do not exist
+and ships without files nothing references.
+
+Sources walked:
+- Templates: ``url_for('static', filename='...')`` literals and
+  ``/static/...`` URLs
+- Stylesheets and scripts under ``static``: ``/static/...`` URLs and CSS
+  ``url(...)`` values (relative ones resolved against the stylesheet)
+- Python modules in ``PYTHON_SOURCES`` (constants, context processor, data
+  factories, runtime modules under ``core``, and ``CSS_BUNDLE``, the
+  stylesheets bundled at build time): string literals that are static
+  paths, and path patterns (``"images/icon-{size}.png"``, f-strings with a
+  literal static prefix) matched against the files
+- Content: the logo, carousel media and home card names the data factories
+  resolve through the media registry, with the same folders and roots, so
+  a missing carousel video is reported where the page would request it;
+  with ``TENANTS_DIR`` set, every tenant's content directory as well
+
+Graph layout::
+
+    {"templates/components/common/header/head.html": {"css/style.css", ...},
+     "content:carousels.achievements[1]": {"videos/content/beat-cancer-bell.mp4"},
+     "content[alice.example.com]:home_card": {"images/content/alice.png"},
+     ...}
+
+Notes:
+- Names built entirely at runtime (``filename=var``, f-strings starting
+  with a variable) are not static paths; the content they come from is
+  walked instead
+- A pattern (placeholders in ``{}``) keeps every file it matches; one that
+  matches no file is unresolved, and ``--prune`` refuses to run while any
+  is, since the files it names cannot be told apart from unused ones
+- A referenced image keeps its sibling variants (``foo.webp`` next to
+  ``foo.jpg``), which the media registry serves in its place
+- ``dist/`` and dotfiles are not walked: build outputs are reached through
+  the manifest and rebuilt from the files that are kept
+"""
+
+import ast
+import os
+import posixpath
+import re
+from pathlib import Path
+
+from ..data.content_store import load_content
+from .manifest import DIST_DIRNAME
+
+# Top-level static folders a path must start with to count as a reference
+STATIC_ROOTS = ("audio", "css", "fonts", "images", "js", "videos")
+PYTHON_SOURCES = ("build/css.py", "context_processor.py", "core", "data")
+LOGO_ROOT = "images/logos"
+LOGO_COLLECTIONS = ("institutions", "technologies", "certifications", "social_links")
+SCRIPT_SUFFIXES = (".css", ".js")
+# Logical names of build outputs (``dist/`` via the manifest), not files
+BUILD_OUTPUTS = frozenset({"css/bundle.css"})
+
+_STATIC_URL_RE = re.compile(r"/static/([^\s'\"()?#<>{}]+)")
+_FILENAME_RE = re.compile(r"""filename\s*=\s*(['"])([^'"{}]+)\1""")
+_CSS_URL_RE = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+_SUFFIX_RE = re.compile(r"\.[A-Za-z0-9]+")
+_PLACEHOLDER_RE = re.compile(r"\{[^{}]*\}")
+
+
+def static_name(value, base=""):
+    """
+    Static-relative name ``value`` refers to, or None if it is not a path.
+
+    Args:
+        value (str): ``/static/...`` URL or static-relative path
+        base (str): Folder that relative paths start from (stylesheets)
+    """
+    value = value.strip()
+    if value.startswith("/static/"):
+        value = value[len("/static/") :]
+    elif base and not value.startswith(("/", "data:", "#")) and "//" not in value:
+        value = posixpath.join(base, value)
+    name = posixpath.normpath(value)
+    root, _, rest = name.partition("/")
+    if root not in STATIC_ROOTS or not _SUFFIX_RE.fullmatch(
+        posixpath.splitext(rest)[1]
+    ):
+        return None
+    return name
+
+
+def is_pattern(name):
+    """Whether static name ``name`` has ``{}`` placeholders."""
+    return _PLACEHOLDER_RE.search(name) is not None
+
+
+def pattern_regex(pattern):
+    """Regex matching the names ``pattern`` can expand to (within a folder)."""
+    parts = _PLACEHOLDER_RE.split(pattern)
+    return re.compile("[^/]+".join(re.escape(part) for part in parts))
+
+
+def template_references(template_folder):
+    """Yield ``(source, name)`` for static paths in the templates."""
+    folder = Path(template_folder)
+    for path in sorted(folder.rglob("*")):
+        if not path.is_file():
+            continue
+        text = path.read_text("utf-8")
+        source = f"templates/{path.relative_to(folder).as_posix()}"
+        values = _STATIC_URL_RE.findall(text)
+        values += [match[1] for match in _FILENAME_RE.findall(text)]
+        for value in values:
+            name = static_name(value)
+            if name and name not in BUILD_OUTPUTS:
+                yield source, name
+
+
+def static_references(static_folder):
+    """Yield ``(source, name)`` for static paths in stylesheets and scripts."""
+    for source, path in _static_files(static_folder):
+        if path.suffix not in SCRIPT_SUFFIXES:
+            continue
+        text = path.read_text("utf-8")
+        base = posixpath.dirname(source)
+        values = [(value, "") for value in _STATIC_URL_RE.findall(text)]
+        if path.suffix == ".css":
+            values += [(match[1], base) for match in _CSS_URL_RE.findall(text)]
+        for value, relative_to in values:
+            name = static_name(value, relative_to)
+            if name:
+                yield f"static/{source}", name
+
+
+def python_references(app_root, modules=PYTHON_SOURCES):
+    """Yield ``(source, name)`` for string literals that are static paths."""
+    root = Path(app_root)
+    paths = []
+    for module in modules:
+        path = root / module
+        paths += sorted(path.rglob("*.py")) if path.is_dir() else [path]
+    for path in paths:
+        tree = ast.parse(path.read_text("utf-8"))
+        source = path.relative_to(root).as_posix()
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                value = node.value
+            elif isinstance(node, ast.JoinedStr):
+                value = "".join(
+                    part.value if isinstance(part, ast.Constant) else "{}"
+                    for part in node.values
+                )
+            else:
+                continue
+            name = static_name(value)
+            if name and name not in BUILD_OUTPUTS:
+                yield source, name
+
+
+def content_references(content, registry, label="content"):
+    """
+    Yield ``(source, name)`` for the media the content files point at.
+
+    Names resolve like the data factories resolve them, so a missing file
+    yields the name the page would request. Sources start with ``label``.
+    """
+    # Not at module level: app.core.media imports this package
+    from ..core.media import CONTENT_ROOTS
+
+    for collection in LOGO_COLLECTIONS:
+        for key, record in getattr(content, collection).items():
+            name = registry.resolve(f"{LOGO_ROOT}/{record.logo}").name
+            yield f"{label}:{collection}.{key}", name
+    for carousel, slides in content.carousels.items():
+        for i, slide in enumerate(slides):
+            if slide.media:
+                name = registry.resolve(slide.media, CONTENT_ROOTS).name
+                yield f"{label}:carousels.{carousel}[{i}]", name
+    name = static_name(content.home_card.image_src)
+    if name:
+        yield f"{label}:home_card", name
+
+
+def tenant_contents(tenants_dir):
+    """
+    Yield ``(label, ContentSnapshot)`` for every tenant content directory.
+
+    Hosts that alias one directory (symlinks) are walked once.
+
+    Raises:
+        ContentError: When a tenant's content does not load
+    """
+    seen = set()
+    for path in sorted(Path(tenants_dir).iterdir()):
+        if path.name.startswith(".") or not path.is_dir():
+            continue
+        resolved = path.resolve()
+        if resolved not in seen:
+            seen.add(resolved)
+            yield f"content[{path.name}]", load_content(resolved)
+
+
+def _static_files(static_folder):
+    static = Path(static_folder)
+    for directory, dirnames, filenames in os.walk(static):
+        dirnames[:] = sorted(
+            name
+            for name in dirnames
+            if not name.startswith(".")
+            and not (directory == str(static) and name == DIST_DIRNAME)
+        )
+        for filename in sorted(filenames):
+            if not filename.startswith("."):
+                path = Path(directory) / filename
+                yield path.relative_to(static).as_posix(), path
+
+
+class ReferenceGraph:
+    """
+    Source -> referenced static names, checked against the static folder.
+
+    Args:
+        static_folder (str): Flask static folder
+        references (iterable): ``(source, name)`` pairs
+    """
+
+    def __init__(self, static_folder, references):
+        self.static_folder = static_folder
+        self.files = {
+            name: path.stat().st_size for name, path in _static_files(static_folder)
+        }
+        self.edges = {}
+        for source, name in references:
+            self.edges.setdefault(source, set()).add(name)
+        self.patterns = {}
+        for names in self.edges.values():
+            for pattern in filter(is_pattern, names):
+                regex = pattern_regex(pattern)
+                self.patterns[pattern] = sorted(filter(regex.fullmatch, self.files))
+
+    def referenced(self):
+        """Referenced names that exist, plus their sibling variants."""
+        names = set().union(*self.edges.values()) if self.edges else set()
+        names = names.difference(self.patterns).union(*self.patterns.values())
+        stems = {posixpath.splitext(name)[0] for name in names}
+        return {
+            name
+            for name in self.files
+            if name in names or posixpath.splitext(name)[0] in stems
+        }
+
+    def dangling(self):
+        """
+        Referenced names with no file.
+
+        Returns:
+            dict: Name -> sorted sources referencing it
+        """
+        missing = {}
+        for source, names in self.edges.items():
+            for name in names - self.files.keys() - self.patterns.keys():
+                missing.setdefault(name, []).append(source)
+        return {name: sorted(sources) for name, sources in sorted(missing.items())}
+
+    def unresolved(self):
+        """
+        Patterns that match no file.
+
+        Returns:
+            dict: Pattern -> sorted sources referencing it
+        """
+        return {
+            pattern: sorted(
+                source for source, names in self.edges.items() if pattern in names
+            )
+            for pattern, matches in sorted(self.patterns.items())
+            if not matches
+        }
+
+    def unreferenced(self):
+        """Sorted names of the files nothing references."""
+        return sorted(self.files.keys() - self.referenced())
+
+    def prune(self):
+        """
+        Delete the unreferenced files, and folders they leave empty.
+
+        Returns:
+            list: ``(name, bytes)`` of every deleted file
+
+        Raises:
+            ValueError: When a pattern is unresolved (nothing is deleted)
+        """
+        unresolved = self.unresolved()
+        if unresolved:
+            raise ValueError(
+                f"Cannot prune with unresolved patterns: {', '.join(unresolved)}"
+            )
+        static = Path(self.static_folder)
+        removed = []
+        for name in self.unreferenced():
+            path = static / name
+            path.unlink()
+            removed.append((name, self.files.pop(name)))
+            parent = path.parent
+            while parent != static and not any(parent.iterdir()):
+                parent.rmdir()
+                parent = parent.parent
+        return removed
+
+
+def build_reference_graph(app, content, registry, tenants=()):
+    """
+    Walk the app's templates, static scripts, Python sources and content.
+
+    Args:
+        app (Flask): Application whose folders are walked
+        content (ContentSnapshot): Content whose media is resolved
+        registry (MediaRegistry): Registry resolving content media names
+        tenants (iterable): ``(label, ContentSnapshot)`` of other tenants
+            (``tenant_contents``), whose media is resolved too
+
+    Returns:
+        ReferenceGraph
+    """
+    template_folder = os.path.join(app.root_path, app.template_folder)
+    references = [
+        *template_references(template_folder),
+        *static_references(app.static_folder),
+        *python_references(app.root_path),
+        *content_references(content, registry),
+    ]
+    for label, tenant_content in tenants:
+        references.extend(content_references(tenant_content, registry, label))
+    return ReferenceGraph(app.static_folder, references)
@@ -0,0 +1,245 @@
+"""
+Vendor Asset Build Module
+=========================
+
+Self-hosts the third-party frontend assets that head.html and scripts.html
+used to pull from jsDelivr/cdnjs, subset to what the portfolio actually uses.
+
+Features:
+- Scans every template, every Python string literal and the site scripts
+  under ``app/`` for class names and Font Awesome icons
+- Subsets Bootstrap CSS and Font Awesome CSS with the critical CSS engine
+  from ``app.build.css``
+- Keeps only the webfonts for icon styles in use and, when fontTools is
+  installed, subsets those fonts down to the used glyphs
+- Emits content-hashed files into ``static/dist/vendor`` via the manifest
+
+Architecture:
+- Sources are fetched from the same pinned CDN URLs the templates used, or
+  read from a local directory for offline/reproducible builds
+- Classes toggled by Bootstrap's JavaScript are safelisted because they
+  never appear in templates
+"""
+
+import ast
+import io
+import re
+import urllib.request
+from pathlib import Path
+
+from ..data.content_store import content_files
+from .css import (
+    collect_selectors,
+    extract_critical,
+    parse_css,
+    serialize_css,
+    strip_comments,
+)
+from .manifest import write_hashed
+
+BOOTSTRAP_VERSION = "5.3.6"
+FONT_AWESOME_VERSION = "6.5.0"
+
+BOOTSTRAP_BASE = f"https://cdn.jsdelivr.net/npm/bootstrap@{BOOTSTRAP_VERSION}/dist"
+FONT_AWESOME_BASE = (
+    f"https://cdnjs.cloudflare.com/ajax/libs/font-awesome/{FONT_AWESOME_VERSION}"
+)
+
+# Local file name -> upstream URL
+VENDOR_SOURCES = {
+    "bootstrap.min.css": f"{BOOTSTRAP_BASE}/css/bootstrap.min.css",
+    "bootstrap.bundle.min.js": f"{BOOTSTRAP_BASE}/js/bootstrap.bundle.min.js",
+    "all.min.css": f"{FONT_AWESOME_BASE}/css/all.min.css",
+}
+
+# Icon style class -> webfont file stem
+FONT_AWESOME_STYLES = {
+    "fas": "fa-solid-900",
+    "fa-solid": "fa-solid-900",
+    "far": "fa-regular-400",
+    "fa-regular": "fa-regular-400",
+    "fab": "fa-brands-400",
+    "fa-brands": "fa-brands-400",
+}
+
+# Classes added at runtime by bootstrap.bundle.js (carousel, collapse navbar)
+JS_SAFELIST = {
+    "active",
+    "show",
+    "collapse",
+    "collapsing",
+    "collapsed",
+    "slide",
+    "pointer-event",
+    "carousel-item-next",
+    "carousel-item-prev",
+    "carousel-item-start",
+    "carousel-item-end",
+}
+
+_WORD_RE = re.compile(r"[A-Za-z_][\w-]*")
+_FONT_FACE_SRC_RE = re.compile(r"src:[^;}]*")
+_CODEPOINT_RE = re.compile(r'content:"\\([0-9a-fA-F]+)"')
+
+
+def _python_strings(path):
+    """Yield every string literal in a Python source file."""
+    tree = ast.parse(Path(path).read_text("utf-8"))
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            yield node.value
+
+
+def scan_used_selectors(app_root):
+    """
+    Collect classes, ids and tags used anywhere in the application.
+
+    Templates contribute their class/id attributes and tags; Python modules
+    (constants, context processors, data factories) contribute every word in
+    their string literals, which covers class names built in code. Content
+    files (``app/content``) contribute every word, since they carry icon and
+    button classes too. The site scripts (``static/js``) contribute every
+    word as well, which covers classes and selectors they add at runtime.
+    """
+    root = Path(app_root)
+    templates = [p.read_text("utf-8") for p in sorted(root.rglob("*.html"))]
+    used = collect_selectors(templates)
+    for path in sorted(root.rglob("*.py")):
+        for value in _python_strings(path):
+            used["classes"].update(_WORD_RE.findall(value))
+    content_dir = root / "content"
+    if content_dir.is_dir():
+        for path in content_files(content_dir):
+            used["classes"].update(_WORD_RE.findall(path.read_text("utf-8")))
+    for path in sorted((root / "static" / "js").glob("*.js")):
+        used["classes"].update(_WORD_RE.findall(path.read_text("utf-8")))
+    used["classes"] |= JS_SAFELIST
+    return used
+
+
+def fetch_sources(source_dir=None):
+    """
+    Return vendor source files as ``{name: bytes}``.
+
+    Args:
+        source_dir (str, optional): Directory containing the files named in
+            VENDOR_SOURCES plus ``webfonts/``. Downloads from the CDN if unset.
+    """
+    if source_dir:
+        root = Path(source_dir)
+        files = {name: (root / name).read_bytes() for name in VENDOR_SOURCES}
+        for font in sorted((root / "webfonts").glob("*")):
+            files[f"webfonts/{font.name}"] = font.read_bytes()
+        return files
+
+    files = {}
+    for name, url in VENDOR_SOURCES.items():
+        with urllib.request.urlopen(url, timeout=30) as response:
+            files[name] = response.read()
+    for stem in sorted(set(FONT_AWESOME_STYLES.values())):
+        url = f"{FONT_AWESOME_BASE}/webfonts/{stem}.woff2"
+        with urllib.request.urlopen(url, timeout=30) as response:
+            files[f"webfonts/{stem}.woff2"] = response.read()
+    return files
+
+
+def subset_font(data, codepoints):
+    """
+    Subset a webfont to ``codepoints`` when fontTools is available.
+
+    Returns:
+        tuple: ``(bytes, format)`` where format is ``woff2`` or ``woff``;
+        the original font is returned unchanged without fontTools.
+    """
+    try:
+        from fontTools import subset
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        return data, "woff2"
+
+    font = TTFont(io.BytesIO(data))
+    subsetter = subset.Subsetter(subset.Options())
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    for flavor in ("woff2", "woff"):
+        try:
+            out = io.BytesIO()
+            font.flavor = flavor
+            font.save(out)
+            return out.getvalue(), flavor
+        except ImportError:  # woff2 needs the brotli module
+            continue
+    return data, "woff2"
+
+
+def subset_font_awesome(css, fonts, used, static_folder):
+    """
+    Subset Font Awesome CSS and its webfonts to the icons in ``used``.
+
+    Args:
+        css (str): Font Awesome ``all.min.css``
+        fonts (dict): ``{"webfonts/<file>": bytes}``
+        used (dict): Selectors from ``scan_used_selectors``
+        static_folder (str): Destination static folder for hashed fonts
+
+    Returns:
+        str: Subset CSS with @font-face sources pointing at hashed fonts
+    """
+    nodes = parse_css(strip_comments(css))
+    kept = extract_critical(nodes, used)
+    kept_text = serialize_css(kept)
+    codepoints = {int(cp, 16) for cp in _CODEPOINT_RE.findall(kept_text)}
+    stems = {
+        FONT_AWESOME_STYLES[c] for c in used["classes"] if c in FONT_AWESOME_STYLES
+    }
+
+    result = []
+    for kind, prelude, body in kept:
+        if prelude == "@font-face":
+            stem = next((s for s in stems if s in body), None)
+            source = fonts.get(f"webfonts/{stem}.woff2") if stem else None
+            if source is None:
+                continue
+            data, flavor = subset_font(source, codepoints)
+            path = write_hashed(static_folder, f"vendor/webfonts/{stem}.{flavor}", data)
+            url = path.split("vendor/", 1)[1]
+            body = _FONT_FACE_SRC_RE.sub(f'src:url({url}) format("{flavor}")', body)
+        result.append((kind, prelude, body))
+    return serialize_css(result)
+
+
+def build_vendor_assets(app_root, static_folder, source_dir=None):
+    """
+    Build subset, content-hashed vendor assets.
+
+    Returns:
+        dict: Manifest ``assets`` entries for the vendor files
+    """
+    files = fetch_sources(source_dir)
+    used = scan_used_selectors(app_root)
+
+    bootstrap_css = serialize_css(
+        extract_critical(
+            parse_css(strip_comments(files["bootstrap.min.css"].decode("utf-8"))),
+            used,
+        )
+    )
+    fonts = {k: v for k, v in files.items() if k.startswith("webfonts/")}
+    icons_css = subset_font_awesome(
+        files["all.min.css"].decode("utf-8"), fonts, used, static_folder
+    )
+    bootstrap_js = re.sub(
+        rb"\n?//# sourceMappingURL=\S+\s*$", b"", files["bootstrap.bundle.min.js"]
+    )
+
+    return {
+        "vendor/bootstrap.css": write_hashed(
+            static_folder, "vendor/bootstrap.css", bootstrap_css.encode("utf-8")
+        ),
+        "vendor/fontawesome.css": write_hashed(
+            static_folder, "vendor/fontawesome.css", icons_css.encode("utf-8")
+        ),
+        "vendor/bootstrap.bundle.js": write_hashed(
+            static_folder, "vendor/bootstrap.bundle.js", bootstrap_js
+        ),
+    }
@@ -0,0 +1,263 @@
+"""
+Video Transcoding Build Module
+==============================
+
+Offline ffmpeg step that turns the heavy media under ``static`` into files
+that start playing quickly on slow links:
+
+- Videos (``static/videos``): a JPEG poster frame, a 4 second muted
+  preview loop, an MP4 rendition ladder (360p/720p/1080p, never taller
+  than the source) and an HLS master playlist over the same renditions
+- Animated GIFs above ``GIF_MIN_BYTES`` (``static/images``): a looping
+  H.264 MP4 and a poster frame
+
+Outputs go to ``dist/media/<source path>.<source hash>/`` and are recorded
+in the ``video`` section of the static manifest, keyed by the source's
+static-relative path::
+
+    "video": {
+      "videos/content/beat-cancer-bell.mp4": {
+        "poster": "dist/media/videos/content/beat-cancer-bell.1a2b3c4d/poster.jpg",
+        "preview": ".../preview.mp4",
+        "hls": ".../master.m3u8",
+        "sources": [
+          {"src": ".../master.m3u8", "type": "application/vnd.apple.mpegurl"},
+          {"src": ".../360p.mp4", "type": "video/mp4", "media": "(max-width: 640px)"},
+          {"src": ".../720p.mp4", "type": "video/mp4"}
+        ]
+      }
+    }
+
+Architecture:
+- The output folder name carries the source hash, so unchanged sources are
+  skipped on rebuilds and the outputs can be cached as immutable
+- HLS segments are remuxed (``-c copy``) from the MP4 renditions instead
+  of encoding every rendition twice
+- Requires an ``ffmpeg`` binary on PATH (or ``--ffmpeg``); the runtime
+  image does not need it
+"""
+
+import hashlib
+import shutil
+import subprocess
+from pathlib import Path
+
+from .manifest import DIST_DIRNAME, HASH_LENGTH
+from .media import mp4_metadata
+
+MEDIA_DIRNAME = "media"
+VIDEO_ROOT = "videos"
+GIF_ROOT = "images"
+VIDEO_SUFFIXES = (".mp4", ".m4v", ".mov", ".webm")
+GIF_MIN_BYTES = 32 * 1024
+
+# (height, video bitrate in kbit/s); the first rung is always kept
+RENDITIONS = ((360, 800), (720, 2500), (1080, 5000))
+DEFAULT_RENDITION = 720
+SMALL_SCREEN = "(max-width: 640px)"
+HLS_SEGMENT_SECONDS = 4
+PREVIEW_SECONDS = 4
+PREVIEW_HEIGHT = 240
+POSTER_HEIGHT = 720
+AUDIO_BITRATE = "96k"
+
+HLS_TYPE = "application/vnd.apple.mpegurl"
+MP4_TYPE = "video/mp4"
+
+_EVEN = "trunc(iw/2)*2:trunc(ih/2)*2"
+
+
+def source_hash(path):
+    """Short content hash of a (possibly large) source file."""
+    with open(path, "rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()[:HASH_LENGTH]
+
+
+def find_sources(static_folder):
+    """
+    Static-relative paths of the videos and heavy GIFs to transcode.
+
+    Returns:
+        list: ``(name, path)`` tuples, sorted by name
+    """
+    static = Path(static_folder)
+    sources = []
+    for path in (static / VIDEO_ROOT).rglob("*"):
+        if path.is_file() and path.suffix.lower() in VIDEO_SUFFIXES:
+            sources.append((path.relative_to(static).as_posix(), path))
+    for path in (static / GIF_ROOT).rglob("*.gif"):
+        if path.stat().st_size >= GIF_MIN_BYTES:
+            sources.append((path.relative_to(static).as_posix(), path))
+    return sorted(sources)
+
+
+def rendition_ladder(height):
+    """Renditions no taller than the source, at least the smallest one."""
+    if not height:
+        return [rung for rung in RENDITIONS if rung[0] <= DEFAULT_RENDITION]
+    return [rung for rung in RENDITIONS if rung[0] <= height] or [RENDITIONS[0]]
+
+
+def _h264(bitrate=None, crf=None):
+    args = ["-c:v", "libx264", "-preset", "slow", "-pix_fmt", "yuv420p"]
+    if bitrate:
+        args += [
+            "-b:v",
+            f"{bitrate}k",
+            "-maxrate",
+            f"{bitrate * 107 // 100}k",
+            "-bufsize",
+            f"{bitrate * 3 // 2}k",
+        ]
+    else:
+        args += ["-crf", str(crf)]
+    return args + ["-movflags", "+faststart"]
+
+
+def video_commands(ffmpeg, source, out, duration=None, height=None):
+    """
+    ffmpeg invocations for one video, in execution order.
+
+    Args:
+        ffmpeg (str): ffmpeg executable
+        source (Path): Source video
+        out (Path): Output folder
+        duration (float, optional): Source duration, picks the poster frame
+        height (int, optional): Source height, caps the rendition ladder
+
+    Returns:
+        list: Argument lists for ``subprocess.run``
+    """
+    base = [ffmpeg, "-hide_banner", "-loglevel", "error", "-y"]
+    seek = f"{min(1.0, (duration or 2) / 2):.2f}"
+    commands = [
+        base
+        + ["-ss", seek, "-i", str(source), "-frames:v", "1"]
+        + ["-vf", f"scale=-2:'min({POSTER_HEIGHT},ih)'", "-q:v", "3"]
+        + [str(out / "poster.jpg")],
+        base
+        + ["-t", str(PREVIEW_SECONDS), "-i", str(source), "-an"]
+        + ["-vf", f"scale=-2:{PREVIEW_HEIGHT},fps=15"]
+        + _h264(crf=32)
+        + [str(out / "preview.mp4")],
+    ]
+    for rung_height, bitrate in rendition_ladder(height):
+        mp4 = out / f"{rung_height}p.mp4"
+        commands.append(
+            base
+            + ["-i", str(source), "-map", "0:v:0", "-map", "0:a:0?"]
+            + ["-vf", f"scale=-2:{rung_height}"]
+            + ["-g", "48", "-keyint_min", "48", "-sc_threshold", "0"]
+            + _h264(bitrate=bitrate)
+            + ["-c:a", "aac", "-b:a", AUDIO_BITRATE, str(mp4)]
+        )
+        commands.append(
+            base
+            + ["-i", str(mp4), "-c", "copy", "-f", "hls"]
+            + ["-hls_time", str(HLS_SEGMENT_SECONDS)]
+            + ["-hls_playlist_type", "vod"]
+            + ["-hls_segment_filename", str(out / f"{rung_height}p_%03d.ts")]
+            + [str(out / f"{rung_height}p.m3u8")]
+        )
+    return commands
+
+
+def gif_commands(ffmpeg, source, out):
+    """ffmpeg invocations that turn an animated GIF into a looping MP4."""
+    base = [ffmpeg, "-hide_banner", "-loglevel", "error", "-y"]
+    return [
+        base
+        + ["-i", str(source), "-an", "-vf", _EVEN]
+        + _h264(crf=28)
+        + [str(out / "loop.mp4")],
+        base + ["-i", str(source), "-frames:v", "1", str(out / "poster.jpg")],
+    ]
+
+
+def master_playlist(ladder, aspect):
+    """HLS master playlist text over the ``<height>p.m3u8`` renditions."""
+    lines = ["#EXTM3U", "#EXT-X-VERSION:3"]
+    for height, bitrate in ladder:
+        width = round(height * aspect / 2) * 2
+        bandwidth = (bitrate + int(AUDIO_BITRATE[:-1])) * 1000
+        lines.append(
+            f"#EXT-X-STREAM-INF:BANDWIDTH={bandwidth},RESOLUTION={width}x{height}"
+        )
+        lines.append(f"{height}p.m3u8")
+    return "\n".join(lines) + "\n"
+
+
+def video_entry(prefix, ladder, gif=False):
+    """Manifest entry for the outputs in static-relative folder ``prefix``."""
+    if gif:
+        return {
+            "poster": f"{prefix}/poster.jpg",
+            "sources": [{"src": f"{prefix}/loop.mp4", "type": MP4_TYPE}],
+        }
+    sources = [{"src": f"{prefix}/master.m3u8", "type": HLS_TYPE}]
+    heights = [height for height, _ in ladder]
+    default = max(h for h in heights if h <= DEFAULT_RENDITION)
+    if heights[0] != default:
+        sources.append(
+            {
+                "src": f"{prefix}/{heights[0]}p.mp4",
+                "type": MP4_TYPE,
+                "media": SMALL_SCREEN,
+            }
+        )
+    sources.append({"src": f"{prefix}/{default}p.mp4", "type": MP4_TYPE})
+    return {
+        "poster": f"{prefix}/poster.jpg",
+        "preview": f"{prefix}/preview.mp4",
+        "hls": f"{prefix}/master.m3u8",
+        "sources": sources,
+    }
+
+
+def transcode(static_folder, ffmpeg="ffmpeg", run=subprocess.run, log=print):
+    """
+    Transcode every source that has no up-to-date outputs yet.
+
+    Args:
+        static_folder (str): Flask static folder
+        ffmpeg (str): ffmpeg executable
+        run (callable): ``subprocess.run`` compatible runner
+        log (callable): Progress output, one line per source
+
+    Returns:
+        dict: Manifest ``video`` section entries
+    """
+    static = Path(static_folder)
+    entries = {}
+    for name, source in find_sources(static):
+        stem = name.rpartition(".")[0]
+        prefix = f"{DIST_DIRNAME}/{MEDIA_DIRNAME}/{stem}.{source_hash(source)}"
+        out = static / prefix
+        gif = source.suffix.lower() == ".gif"
+        info = {} if gif else mp4_metadata(source)
+        ladder = rendition_ladder(info.get("height"))
+        entries[name] = video_entry(prefix, ladder, gif=gif)
+        if out.is_dir():
+            log(f"{name}: up to date")
+            continue
+
+        partial = out.with_name(out.name + ".partial")
+        shutil.rmtree(partial, ignore_errors=True)
+        partial.mkdir(parents=True)
+        if gif:
+            commands = gif_commands(ffmpeg, source, partial)
+        else:
+            commands = video_commands(
+                ffmpeg, source, partial, info.get("duration"), info.get("height")
+            )
+        for command in commands:
+            run(command, check=True, capture_output=True)
+        if not gif:
+            aspect = (info["width"] / info["height"]) if info.get("height") else 16 / 9
+            (partial / "master.m3u8").write_text(
+                master_playlist(ladder, aspect), "utf-8"
+            )
+        partial.rename(out)
+        size = sum(path.stat().st_size for path in out.iterdir())
+        log(f"{name} -> {prefix} ({len(commands)} steps, {size} bytes)")
+    return entries
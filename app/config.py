@@ -93,6 +93,18 @@ class Config:
         """Server port - environment variable overrides with type conversion."""
         return int(os.getenv("PORT", self.get("port", 8080)))
 
+    @property
+    def tracing_sample_rate(self) -> float:
+        """Fraction of requests traced - environment variable overrides for sampling."""
+        return float(
+            os.getenv("TRACING_SAMPLE_RATE", self.get("tracing_sample_rate", 0.0))
+        )
+
+    @property
+    def health_token(self) -> str:
+        """Token unlocking /readyz and /health check details - environment only."""
+        return os.getenv("HEALTH_TOKEN", "")
+
     # Cloud Deployment Configuration
     # =============================
     # These properties are intentionally environment-only for security.
@@ -134,3 +146,5 @@ def apply_config(app):
     app_config = load_app_config()
     for key, value in app_config.items():
         app.config[key.upper()] = value
+    app.config["TRACING_SAMPLE_RATE"] = config.tracing_sample_rate
+    app.config["HEALTH_TOKEN"] = config.health_token
@@ -28,7 +28,17 @@ All templates automatically receive:
 
 from flask import url_for, current_app
 
+from .core.tracing import traced
+from .data.content_store import current_content
 
+# Footer: (social link key, logo, label); URLs come from the tenant's content
+FOOTER_LINKS = (
+    ("linkedin", "images/logos/logo-linkedin.png", "LinkedIn"),
+    ("github", "images/logos/logo-github-dark.png", "GitHub"),
+)
+
+
+@traced("context_processor.nav_links")
 def inject_nav_links():
     """
     Inject navigation links and app name into all templates
@@ -49,6 +59,7 @@ def inject_nav_links():
         - Tech Stack: Technology skills and tool proficiency
         - IRL: Personal interests and lifestyle content
         - Connect: Contact information and social links
+        - Search: Site search across all of the above
     """
     nav_links = [
         {
@@ -73,6 +84,7 @@ def inject_nav_links():
         },
         {"href": url_for("routes.irl"), "icon": "fas fa-users", "label": "IRL"},
         {"href": url_for("routes.connect"), "icon": "fas fa-link", "label": "CONNECT"},
+        {"href": url_for("routes.search"), "icon": "fas fa-search", "label": "SEARCH"},
     ]
     return dict(
         nav_links=nav_links,
@@ -80,6 +92,7 @@ def inject_nav_links():
     )
 
 
+@traced("context_processor.footer_links")
 def inject_footer_links():
     """
     Inject footer social/professional links into all templates
@@ -95,20 +108,18 @@ def inject_footer_links():
         - LinkedIn: Professional networking profile
         - GitHub: Code repositories and development activity
 
-    Note: Logo images are served from static/images/logos/ directory
-    Dark theme GitHub logo used for consistent visual design
+    Note: URLs come from the tenant's social links; logo images are served
+    from static/images/logos/ (dark theme GitHub logo for the footer)
     """
+    social_links = current_content().social_links
     footer_links = [
         {
-            "href": "https://www.linkedin.com/in/alan-r-smith/",
-            "logo": url_for("static", filename="images/logos/logo-linkedin.png"),
-            "label": "LinkedIn",
-        },
-        {
-            "href": "https://github.com/SmithAndGiggles",
-            "logo": url_for("static", filename="images/logos/logo-github-dark.png"),
-            "label": "GitHub",
-        },
+            "href": social_links[key].url,
+            "logo": url_for("static", filename=logo),
+            "label": label,
+        }
+        for key, logo, label in FOOTER_LINKS
+        if key in social_links
     ]
     return dict(footer_links=footer_links)
 
@@ -0,0 +1,314 @@
+"""
+Structured Access Log Module
+============================
+
+One JSON line per request in the Cloud Logging ``httpRequest`` format, plus
+the app's own fields (route, host, page cache status). Request threads only
+format a string and hand it to a bounded queue; a background thread does
+the I/O.
+
+Features:
+- Precomputed line template: a request fills ``%`` placeholders instead of
+  building and serializing a dict
+- JSON fragments for low-cardinality values (route, host, method, cache
+  status) are encoded once and memoized
+- Bounded queue and a single writer thread that writes in batches
+- Overload policy (``ACCESS_LOG_OVERFLOW``): ``drop`` discards records when
+  the queue is full; ``sample`` additionally keeps only every Nth success
+  once the queue is half full. Errors (5xx) are never sampled out
+- Counters for written, dropped and sampled-out records
+
+Architecture:
+- Wraps the rate limiter (only the health probes sit outside it), so
+  rate-limited and shed requests are logged too; latency and bytes are
+  measured until the server closes the response iterable
+- The matched endpoint and page cache status travel in the WSGI environ
+  (``ROUTE_KEY`` / ``CACHE_KEY``), set by the rate limiter, a
+  ``before_request`` hook and ``render_page``
+"""
+
+import functools
+import itertools
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+
+from flask import request
+
+logger = logging.getLogger(__name__)
+
+ROUTE_KEY = "portfolio.route"
+CACHE_KEY = "portfolio.cache"
+
+DEFAULT_QUEUE_SIZE = 8192
+DEFAULT_SAMPLE_EVERY = 10
+OVERFLOW_POLICIES = ("drop", "sample")
+
+LINE_TEMPLATE = (
+    '{"severity":"%s","httpRequest":{"requestMethod":%s,"requestUrl":%s,'
+    '"status":%d,"responseSize":"%d","latency":"%.6fs","remoteIp":%s,'
+    '"userAgent":%s},"route":%s,"host":%s,"cache":%s}'
+)
+
+_MEMO_LIMIT = 1024
+
+
+class _Fragments:
+    """Memoized JSON encodings of low-cardinality strings."""
+
+    def __init__(self):
+        self._encoded = {}
+
+    def __call__(self, value):
+        encoded = self._encoded.get(value)
+        if encoded is None:
+            encoded = json.dumps(value)
+            if len(self._encoded) < _MEMO_LIMIT:
+                self._encoded[value] = encoded
+        return encoded
+
+
+class AccessLogWriter:
+    """
+    Bounded queue drained by one background writer thread.
+
+    Args:
+        stream: File-like object the lines are written to
+        queue_size (int): Records buffered before the overflow policy applies
+        overflow (str): ``drop`` or ``sample``
+        sample_every (int): Successful requests kept per N under ``sample``
+        name (str): Writer thread name
+    """
+
+    def __init__(
+        self,
+        stream,
+        queue_size=DEFAULT_QUEUE_SIZE,
+        overflow="drop",
+        sample_every=DEFAULT_SAMPLE_EVERY,
+        name="access-log",
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown access log overflow policy: {overflow!r}")
+        self.stream = stream
+        self.name = name
+        self.overflow = overflow
+        self.sample_every = max(1, sample_every)
+        self.written = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self._queue = queue.Queue(queue_size)
+        self._high_water = queue_size // 2
+        self._counter = itertools.count()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def submit(self, line, error=False):
+        """Queue ``line`` without blocking; never raises on overload."""
+        if (
+            self.overflow == "sample"
+            and not error
+            and self._queue.qsize() >= self._high_water
+            and next(self._counter) % self.sample_every
+        ):
+            with self._lock:
+                self.sampled_out += 1
+            return
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def _start(self):
+        # Started lazily so it runs in the process that serves requests
+        # (gunicorn forks workers after the app module is imported)
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=self.name, daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < 256:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines = [line for line in batch if line is not None]
+            if lines:
+                try:
+                    self.stream.write("\n".join(lines) + "\n")
+                    self.stream.flush()
+                    self.written += len(lines)
+                except Exception:
+                    with self._lock:
+                        self.dropped += len(lines)
+                    logger.exception("Writing %d access log lines failed", len(lines))
+            for _ in batch:
+                self._queue.task_done()
+
+    def flush(self, timeout=None):
+        """Wait until queued lines are written (tests, shutdown)."""
+        if self._thread is None:
+            return
+        done = threading.Thread(target=self._queue.join, daemon=True)
+        done.start()
+        done.join(timeout)
+
+    def stats(self):
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.written,
+            "dropped": self.dropped,
+            "sampled_out": self.sampled_out,
+        }
+
+
+class _LoggedIterable:
+    """Response iterable that counts bytes and logs when it is closed."""
+
+    __slots__ = ("_iterable", "_close", "bytes")
+
+    def __init__(self, iterable, close):
+        self._iterable = iterable
+        self._close = close
+        self.bytes = 0
+
+    def __iter__(self):
+        for chunk in self._iterable:
+            self.bytes += len(chunk)
+            yield chunk
+
+    def close(self):
+        try:
+            close = getattr(self._iterable, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._close(self.bytes)
+
+
+class AccessLogMiddleware:
+    """
+    WSGI middleware formatting one access log line per request.
+
+    Args:
+        wsgi_app: Wrapped WSGI application
+        writer (AccessLogWriter): Destination of the formatted lines
+        client_ip (callable): Client address of a WSGI environ; the peer
+            address (``REMOTE_ADDR``) when omitted
+        clock (callable): High-resolution time source
+    """
+
+    def __init__(self, wsgi_app, writer, client_ip=None, clock=time.perf_counter):
+        self.wsgi_app = wsgi_app
+        self.writer = writer
+        self.client_ip = client_ip or (lambda environ: environ.get("REMOTE_ADDR", ""))
+        self.clock = clock
+        self._fragment = _Fragments()
+        self._statuses = {}
+
+    def __call__(self, environ, start_response):
+        started = self.clock()
+        status = [0]
+
+        def _start_response(status_line, headers, exc_info=None):
+            code = self._statuses.get(status_line)
+            if code is None:
+                code = self._statuses.setdefault(status_line, int(status_line[:3]))
+            status[0] = code
+            return start_response(status_line, headers, exc_info)
+
+        def _log(size):
+            self.log(environ, status[0], size, self.clock() - started)
+
+        try:
+            iterable = self.wsgi_app(environ, _start_response)
+        except BaseException:
+            status[0] = 500
+            _log(0)
+            raise
+        return _LoggedIterable(iterable, _log)
+
+    def log(self, environ, status, size, latency):
+        """Format and queue the access log line of one request."""
+        fragment = self._fragment
+        path = environ.get("PATH_INFO", "")
+        query = environ.get("QUERY_STRING")
+        line = LINE_TEMPLATE % (
+            "ERROR" if status >= 500 else "WARNING" if status >= 400 else "INFO",
+            fragment(environ.get("REQUEST_METHOD", "")),
+            json.dumps(f"{path}?{query}" if query else path),
+            status,
+            size,
+            latency,
+            json.dumps(self.client_ip(environ)),
+            json.dumps(environ.get("HTTP_USER_AGENT", "")),
+            fragment(environ.get(ROUTE_KEY, "-")),
+            fragment(environ.get("HTTP_HOST", "").split(":")[0].lower()),
+            fragment(environ.get(CACHE_KEY, "-")),
+        )
+        self.writer.submit(line, error=status >= 500)
+
+
+def record_route():
+    """Before-request hook: expose the matched endpoint to the access log."""
+    request.environ[ROUTE_KEY] = request.endpoint or "-"
+
+
+def record_cache_status(status):
+    """Report the page cache outcome (HIT, STALE, MISS) of this request."""
+    request.environ[CACHE_KEY] = status
+
+
+def init_access_log(app):
+    """
+    Log every request as JSON unless disabled.
+
+    Disabled under TESTING unless ``ACCESS_LOG_PATH`` is set, so test runs
+    do not start writer threads that print to the captured stdout.
+
+    Config:
+        ACCESS_LOG_ENABLED: Master switch
+        ACCESS_LOG_PATH: File to append to; stdout when empty
+        ACCESS_LOG_QUEUE_SIZE: Records buffered for the writer thread
+        ACCESS_LOG_OVERFLOW: ``drop`` or ``sample``
+        ACCESS_LOG_SAMPLE_EVERY: Successes kept per N when sampling
+        RATE_LIMIT_TRUSTED_PROXIES / RATE_LIMIT_CLIENT_IP_HEADER: Shared
+            with the rate limiter so ``remoteIp`` is the client, not the proxy
+    """
+    # Not at module level: the rate limiter imports ROUTE_KEY from here
+    from .rate_limit import client_ip, header_key
+
+    config = app.config
+    path = config.get("ACCESS_LOG_PATH")
+    if not config.get("ACCESS_LOG_ENABLED", True) or (app.testing and not path):
+        return None
+    stream = open(path, "a", encoding="utf-8") if path else sys.stdout
+    writer = AccessLogWriter(
+        stream,
+        queue_size=int(config.get("ACCESS_LOG_QUEUE_SIZE", DEFAULT_QUEUE_SIZE)),
+        overflow=config.get("ACCESS_LOG_OVERFLOW", "drop"),
+        sample_every=int(config.get("ACCESS_LOG_SAMPLE_EVERY", DEFAULT_SAMPLE_EVERY)),
+    )
+    app.before_request(record_route)
+    app.wsgi_app = AccessLogMiddleware(
+        app.wsgi_app,
+        writer,
+        client_ip=functools.partial(
+            client_ip,
+            trusted_proxies=int(config.get("RATE_LIMIT_TRUSTED_PROXIES", 1)),
+            header=header_key(config.get("RATE_LIMIT_CLIENT_IP_HEADER")),
+        ),
+    )
+    app.extensions["access_log"] = writer
+    return writer
@@ -0,0 +1,113 @@
+"""
+Static Asset Manifest Module
+============================
+
+Runtime side of the asset build pipeline. Loads ``static/dist/manifest.json``
+once at startup and exposes template helpers that resolve logical asset
+names to their hashed URLs and inline per-layout critical CSS.
+
+Features:
+- ``asset_url(name)``: hashed URL when built, plain static URL otherwise
+- ``critical_css(layout)``: pre-minified critical CSS for a page layout
+- ``has_asset(name)``: switch templates between self-hosted and CDN assets
+- Long-lived immutable caching for content-hashed files under ``dist/``
+
+Architecture:
+- The manifest is read once per application instance (zero per-request I/O)
+- Missing build output degrades gracefully to the unbundled stylesheets
+- Helpers are registered as Jinja globals instead of context processors
+  so they are not rebuilt on every render
+"""
+
+import json
+from pathlib import Path
+
+from flask import current_app, request, url_for
+from markupsafe import Markup
+
+DIST_PREFIX = "dist/"
+MANIFEST_PATH = "dist/manifest.json"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class AssetManifest:
+    """
+    In-memory view of the build manifest.
+
+    Attributes:
+        assets (dict): Logical name -> hashed path relative to static folder
+        critical (dict): Layout key -> critical CSS string
+        media (dict): Static-relative image path -> dimensions, color and
+            placeholder
+        video (dict): Static-relative video/GIF path -> transcoded poster,
+            preview and sources
+    """
+
+    def __init__(self, data=None):
+        data = data or {}
+        self.assets = data.get("assets", {})
+        self.critical = {
+            layout: Markup(css) for layout, css in data.get("critical", {}).items()
+        }
+        self.media = data.get("media", {})
+        self.video = data.get("video", {})
+
+    @classmethod
+    def load(cls, static_folder):
+        """Load the manifest from ``static_folder``; empty if not built."""
+        path = Path(static_folder) / MANIFEST_PATH
+        if not path.exists():
+            return cls()
+        return cls(json.loads(path.read_text("utf-8")))
+
+    @property
+    def loaded(self):
+        """True when a build manifest was found."""
+        return bool(self.assets)
+
+    def resolve(self, name):
+        """Return the static-relative path for a logical asset name."""
+        return self.assets.get(name, name)
+
+
+def get_manifest():
+    """Return the AssetManifest of the current application."""
+    return current_app.extensions["assets"]
+
+
+def asset_url(name):
+    """Template helper: URL for a logical asset, hashed when available."""
+    return url_for("static", filename=get_manifest().resolve(name))
+
+
+def has_asset(name):
+    """Template helper: True when ``name`` was produced by a build step."""
+    return name in get_manifest().assets
+
+
+def critical_css(layout):
+    """Template helper: critical CSS for ``layout`` or an empty string."""
+    return get_manifest().critical.get(layout, "")
+
+
+def _cache_hashed_assets(response):
+    """Mark content-hashed build outputs as immutable."""
+    if request.endpoint == "static" and (request.view_args or {}).get(
+        "filename", ""
+    ).startswith(DIST_PREFIX):
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+    return response
+
+
+def init_assets(app):
+    """
+    Load the asset manifest and register template helpers on ``app``.
+
+    Args:
+        app (Flask): Application instance being configured
+    """
+    app.extensions["assets"] = AssetManifest.load(app.static_folder)
+    app.add_template_global(asset_url)
+    app.add_template_global(has_asset)
+    app.add_template_global(critical_css)
+    app.after_request(_cache_hashed_assets)
@@ -0,0 +1,269 @@
+"""
+Edge Cache Policy Module
+========================
+
+Per-route HTTP caching policies for a CDN in front of the app. Routes
+declare their policy with the ``cache_policy`` decorator right below
+``@routes.route``; an after-request hook turns it into ``Cache-Control``,
+``Surrogate-Control``, ``Surrogate-Key`` and ``Vary`` headers.
+
+Features:
+- Short browser TTL with long shared-cache TTL (``s-maxage``) plus
+  ``stale-while-revalidate`` / ``stale-if-error`` so the edge keeps serving
+  while the origin re-renders or is down
+- Surrogate keys derived from the content collections a page renders, scoped
+  per tenant (``<tenant>/<collection>``), so a content change purges exactly
+  the pages that show it
+- ``flask cache purge`` computes the affected keys from a content diff and
+  optionally sends them to the CDN purge endpoint
+
+Key scheme:
+- ``<tenant>``: every page of a tenant
+- ``<tenant>/<collection>``: pages rendering a content collection; pages
+  using the base layout also render ``LAYOUT_COLLECTIONS`` (footer links)
+- API routes key on the collection their URL selects (``by=...``)
+"""
+
+import json
+import urllib.request
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import click
+from flask import current_app, request
+from flask.cli import AppGroup
+
+from ..data.content_store import load_binary_snapshot, load_snapshot
+from .tenants import DEFAULT_TENANT, current_tenant
+
+DEFAULT_MAX_AGE = 60
+DEFAULT_S_MAXAGE = 3600
+DEFAULT_STALE_WHILE_REVALIDATE = 86400
+DEFAULT_STALE_IF_ERROR = 604800
+
+# Rendered by base.html on every page (footer links)
+LAYOUT_COLLECTIONS = ("social_links",)
+# Carousel slides with their cited sources, on pages and in the slide API
+CAROUSEL_COLLECTIONS = ("carousels", "sources", "external_urls")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Caching rules for one route.
+
+    Attributes:
+        collections (tuple): Content collections the response renders
+        max_age (int): Browser TTL in seconds
+        s_maxage (int): Shared (CDN) TTL in seconds
+        stale_while_revalidate (int): Seconds a stale copy may be served
+            while the CDN refetches in the background
+        stale_if_error (int): Seconds a stale copy may be served when the
+            origin errors
+        vary (tuple): Request headers the response varies on
+        no_store (bool): Never cache (health checks, per-request data)
+        layout (bool): Rendered inside base.html, so also keyed on
+            ``LAYOUT_COLLECTIONS``
+        by (tuple): ``(view arg, ((value, collections), ...))`` for routes
+            whose collections depend on the URL
+    """
+
+    collections: tuple = ()
+    max_age: int = DEFAULT_MAX_AGE
+    s_maxage: int = DEFAULT_S_MAXAGE
+    stale_while_revalidate: int = DEFAULT_STALE_WHILE_REVALIDATE
+    stale_if_error: int = DEFAULT_STALE_IF_ERROR
+    vary: tuple = ("Accept-Encoding",)
+    no_store: bool = False
+    layout: bool = True
+    by: tuple = ()
+    _stale: str = field(init=False, repr=False, compare=False, default="")
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "_stale",
+            f"stale-while-revalidate={self.stale_while_revalidate}, "
+            f"stale-if-error={self.stale_if_error}",
+        )
+
+    @property
+    def cache_control(self):
+        """``Cache-Control`` for browsers and standards-based CDNs."""
+        if self.no_store:
+            return "no-store"
+        return (
+            f"public, max-age={self.max_age}, s-maxage={self.s_maxage}, {self._stale}"
+        )
+
+    @property
+    def surrogate_control(self):
+        """``Surrogate-Control`` for CDNs that strip it before the browser."""
+        return f"max-age={self.s_maxage}, {self._stale}"
+
+    @property
+    def rendered(self):
+        """Every collection the route may render (for purge reporting)."""
+        names = list(self.collections)
+        if self.by:
+            for _, collections in self.by[1]:
+                names += collections
+        if self.layout:
+            names += LAYOUT_COLLECTIONS
+        return tuple(dict.fromkeys(names))
+
+    def collections_for(self, view_args=None):
+        """Collections rendered for a request with ``view_args``."""
+        names = list(self.collections)
+        if self.by:
+            arg, choices = self.by
+            names += dict(choices).get((view_args or {}).get(arg), ())
+        if self.layout:
+            names += LAYOUT_COLLECTIONS
+        return tuple(dict.fromkeys(names))
+
+    def surrogate_keys(self, tenant_name, view_args=None):
+        """Purge keys for a response rendered for ``tenant_name``."""
+        return [tenant_name] + [
+            f"{tenant_name}/{name}" for name in self.collections_for(view_args)
+        ]
+
+
+def cache_policy(*collections, by=None, **options):
+    """
+    Attach a CachePolicy to a view function.
+
+    Args:
+        *collections (str): Content collections the page renders
+        by (tuple, optional): ``(view arg, {value: collections})`` adding
+            the collections selected by a URL argument
+        **options: CachePolicy fields (``s_maxage``, ``no_store``, ...)
+
+    Example:
+        @routes.route("/techstack")
+        @cache_policy("technologies")
+        def techstack(): ...
+
+        @api_v1.route("/<name>")
+        @cache_policy(by=("name", {"technologies": ("technologies",)}), layout=False)
+        def collection(name): ...
+    """
+    if by is not None:
+        arg, choices = by
+        options["by"] = (arg, tuple((k, tuple(v)) for k, v in choices.items()))
+    policy = CachePolicy(collections=tuple(collections), **options)
+
+    def decorator(view):
+        view.cache_policy = policy
+        return view
+
+    return decorator
+
+
+def route_policies(app=None):
+    """Return ``{endpoint: CachePolicy}`` for every route that declares one."""
+    app = app or current_app
+    return {
+        endpoint: view.cache_policy
+        for endpoint, view in app.view_functions.items()
+        if hasattr(view, "cache_policy")
+    }
+
+
+def apply_cache_policy(response):
+    """After-request hook: emit the edge caching headers of the matched route."""
+    view = current_app.view_functions.get(request.endpoint)
+    policy = getattr(view, "cache_policy", None)
+    if policy is None or response.status_code not in (200, 304):
+        return response
+    response.headers["Cache-Control"] = policy.cache_control
+    if not policy.no_store:
+        response.headers["Surrogate-Control"] = policy.surrogate_control
+        response.headers["Surrogate-Key"] = " ".join(
+            policy.surrogate_keys(current_tenant().name, request.view_args)
+        )
+        for header in policy.vary:
+            response.vary.add(header)
+    return response
+
+
+# =============================================================================
+# PURGING
+# =============================================================================
+
+
+def _load_any(path):
+    """Load a content directory or a compiled ``snapshot.bin``."""
+    path = Path(path)
+    return load_binary_snapshot(path) if path.is_file() else load_snapshot(path)
+
+
+def changed_collections(old, new):
+    """Names of the top-level content collections that differ."""
+    names = set(old.raw) | set(new.raw)
+    return sorted(name for name in names if old.raw.get(name) != new.raw.get(name))
+
+
+def purge_keys(tenant_name, collections, policies):
+    """
+    Surrogate keys to purge for changed ``collections``.
+
+    Only collections that some route renders produce a key; the affected
+    endpoints are returned alongside for reporting.
+
+    Returns:
+        tuple: (sorted keys, sorted endpoints)
+    """
+    changed = set(collections)
+    endpoints = sorted(
+        endpoint
+        for endpoint, policy in policies.items()
+        if changed & set(policy.rendered)
+    )
+    used = {name for policy in policies.values() for name in policy.rendered}
+    keys = sorted(f"{tenant_name}/{name}" for name in changed & used)
+    return keys, endpoints
+
+
+cache_cli = AppGroup("cache", help="Edge cache commands.")
+
+
+@cache_cli.command("purge")
+@click.option(
+    "--old",
+    "old_path",
+    required=True,
+    type=click.Path(exists=True),
+    help="Previous content directory or snapshot.bin.",
+)
+@click.option(
+    "--new",
+    "new_path",
+    type=click.Path(exists=True),
+    help="New content directory or snapshot.bin (defaults to the app's content).",
+)
+@click.option("--tenant", default=DEFAULT_TENANT, show_default=True)
+@click.option(
+    "--endpoint",
+    envvar="CDN_PURGE_ENDPOINT",
+    help="POST the keys to this purge URL (Surrogate-Key header).",
+)
+@click.option("--token", envvar="CDN_PURGE_TOKEN", help="API token for --endpoint.")
+def purge(old_path, new_path, tenant, endpoint, token):
+    """Print (and optionally purge) surrogate keys affected by a content change."""
+    old = _load_any(old_path)
+    new = (
+        _load_any(new_path) if new_path else current_app.extensions["content"].snapshot
+    )
+    keys, endpoints = purge_keys(
+        tenant, changed_collections(old, new), route_policies()
+    )
+    click.echo(json.dumps({"keys": keys, "endpoints": endpoints}))
+    if keys and endpoint:
+        purge_request = urllib.request.Request(
+            endpoint, method="POST", headers={"Surrogate-Key": " ".join(keys)}
+        )
+        if token:
+            purge_request.add_header("Fastly-Key", token)
+        with urllib.request.urlopen(purge_request, timeout=30) as response:
+            click.echo(f"purge: HTTP {response.status}")
@@ -0,0 +1,219 @@
+"""
+Health Probe Module
+===================
+
+Liveness and readiness probes answered at the WSGI layer, before rate
+limiting, access logging or Flask routing, so probes cost a dict lookup.
+
+Features:
+- ``/livez``: preallocated ``200 ok`` bytes; the process is up and serving
+- ``/readyz``: ``200`` once every startup check passed, ``503`` before
+  that. The JSON body listing each check is only returned to requests
+  carrying ``X-Health-Token: <HEALTH_TOKEN>``; everyone else gets the bare
+  status. Both bodies are rebuilt only when a check changes, never per probe
+- Checks: templates compiled, content registry built, static manifest
+  loaded (when a build exists) and caches warm
+- ``/health`` (Flask route) keeps its JSON shape for existing monitors and
+  adds the check results for token holders
+
+Architecture:
+- ``Readiness`` holds named checks; startup code reports into it and the
+  middleware serves its precomputed body
+- Route as Cloud Run's startup probe at ``/readyz`` and liveness probe at
+  ``/livez``
+"""
+
+import hmac
+import json
+import threading
+from pathlib import Path
+
+from .assets import MANIFEST_PATH
+from .warmup import warmup_enabled
+
+LIVEZ_PATH = "/livez"
+READYZ_PATH = "/readyz"
+
+READINESS_CHECKS = ("templates", "content", "static_manifest", "caches")
+TOKEN_HEADER = "HTTP_X_HEALTH_TOKEN"  # X-Health-Token
+
+_PROBE_HEADERS = [("Cache-Control", "no-store")]
+
+
+def _response(status, body, content_type):
+    headers = _PROBE_HEADERS + [
+        ("Content-Type", content_type),
+        ("Content-Length", str(len(body))),
+    ]
+    return status, headers, [body]
+
+
+LIVEZ_RESPONSE = _response("200 OK", b"ok\n", "text/plain; charset=utf-8")
+
+
+class Readiness:
+    """
+    Named startup checks and the precomputed ``/readyz`` response.
+
+    A check is pending until reported; the instance is ready when every
+    check in ``names`` passed. ``response`` lists the checks,
+    ``status_response`` only says whether the instance is ready.
+    """
+
+    def __init__(self, names=READINESS_CHECKS):
+        self.names = tuple(names)
+        self.checks = {}
+        self._lock = threading.Lock()
+        self._rebuild()
+
+    def report(self, name, ok, detail=""):
+        """Record the outcome of check ``name`` and rebuild the response."""
+        with self._lock:
+            self.checks[name] = {"ok": bool(ok), "detail": detail}
+            self._rebuild()
+
+    @property
+    def ready(self):
+        return all(self.checks.get(name, {}).get("ok") for name in self.names)
+
+    def as_dict(self):
+        return {
+            "ready": self.ready,
+            "checks": {
+                name: self.checks.get(name, {"ok": False, "detail": "pending"})
+                for name in self.names
+            },
+        }
+
+    def _rebuild(self):
+        body = json.dumps(self.as_dict(), separators=(",", ":")).encode("utf-8")
+        if self.ready:
+            status, summary = "200 OK", b"ready\n"
+        else:
+            status, summary = "503 Service Unavailable", b"not ready\n"
+        self.response = _response(status, body, "application/json")
+        self.status_response = _response(status, summary, "text/plain; charset=utf-8")
+
+
+def token_matches(token, environ):
+    """True when ``token`` is set and the request sends it in X-Health-Token."""
+    if not token:
+        return False
+    sent = environ.get(TOKEN_HEADER, "")
+    return hmac.compare_digest(sent.encode("utf-8"), token.encode("utf-8"))
+
+
+class HealthMiddleware:
+    """
+    WSGI middleware answering ``/livez`` and ``/readyz`` without Flask.
+
+    Args:
+        wsgi_app: Wrapped WSGI application
+        readiness (Readiness): Startup checks
+        token (str): ``X-Health-Token`` value that unlocks the check details
+    """
+
+    def __init__(self, wsgi_app, readiness, token=None):
+        self.wsgi_app = wsgi_app
+        self.readiness = readiness
+        self.token = token
+
+    def __call__(self, environ, start_response):
+        path = environ.get("PATH_INFO")
+        if path == LIVEZ_PATH:
+            response = LIVEZ_RESPONSE
+        elif path == READYZ_PATH:
+            if token_matches(self.token, environ):
+                response = self.readiness.response
+            else:
+                response = self.readiness.status_response
+        else:
+            return self.wsgi_app(environ, start_response)
+        status, headers, body = response
+        start_response(status, headers)
+        return body
+
+
+def compile_templates(app):
+    """
+    Compile every Jinja template into the environment's cache.
+
+    Returns:
+        tuple: (compiled count, list of "name: error" strings)
+    """
+    env = app.jinja_env
+    errors = []
+    names = env.list_templates(extensions=("html",))
+    for name in names:
+        try:
+            env.get_template(name)
+        except Exception as exc:
+            errors.append(f"{name}: {exc}")
+    return len(names) - len(errors), errors
+
+
+def check_templates(app, readiness):
+    if app.testing:
+        readiness.report("templates", True, "compiled on first use (testing)")
+        return
+    compiled, errors = compile_templates(app)
+    readiness.report(
+        "templates", not errors, "; ".join(errors) or f"{compiled} compiled"
+    )
+
+
+def check_content(app, readiness):
+    registry = app.extensions.get("tenants")
+    snapshot = registry.default.store.snapshot if registry else None
+    readiness.report(
+        "content",
+        snapshot is not None,
+        f"version {snapshot.version}" if snapshot else "no content registry",
+    )
+
+
+def check_static_manifest(app, readiness):
+    """A missing build is fine (unbundled assets); a broken build is not."""
+    manifest = app.extensions.get("assets")
+    if manifest is not None and manifest.loaded:
+        readiness.report(
+            "static_manifest", True, f"{len(manifest.assets)} hashed assets"
+        )
+    elif (Path(app.static_folder) / MANIFEST_PATH).parent.is_dir():
+        readiness.report("static_manifest", False, f"{MANIFEST_PATH} missing or empty")
+    else:
+        readiness.report("static_manifest", True, "not built, serving unbundled")
+
+
+def check_caches(app, readiness):
+    """Pending until the startup warmup reports; cold caches are fine without it."""
+    if warmup_enabled(app):
+        readiness.report("caches", False, "waiting for warmup")
+        return
+    page_cache = app.extensions.get("page_cache")
+    readiness.report(
+        "caches",
+        True,
+        "cold, warmup disabled" if page_cache else "page cache disabled",
+    )
+
+
+def init_health(app):
+    """
+    Run the startup checks and answer probes ahead of the rest of the stack.
+
+    Call last in the factory so the probes wrap every other middleware.
+
+    Config:
+        HEALTH_TOKEN: Secret that unlocks the check details of ``/readyz``
+            and ``/health`` (``X-Health-Token`` header); environment only
+    """
+    readiness = app.extensions["readiness"] = Readiness()
+    check_templates(app, readiness)
+    check_content(app, readiness)
+    check_static_manifest(app, readiness)
+    check_caches(app, readiness)
+    app.wsgi_app = HealthMiddleware(
+        app.wsgi_app, readiness, token=app.config.get("HEALTH_TOKEN") or None
+    )
+    return readiness
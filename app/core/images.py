@@ -0,0 +1,412 @@
+"""
+Image Resizing Module
+=====================
+
+``/img/<width>/<path>`` serves content images from ``static/images`` at any
+width, in the best format the browser accepts, without shipping every
+variant in the container image.
+
+Features:
+- Format negotiation from ``Accept``: AVIF, then WebP, then JPEG (PNG for
+  sources with transparency); responses carry ``Vary: Accept``
+- Fixed width breakpoints (``IMAGE_WIDTHS``): other widths redirect to the
+  next breakpoint up, so at most one variant per breakpoint and format is
+  ever encoded
+- Never upscales: widths above the original serve the original width
+- Size-bounded on-disk LRU (``IMAGE_CACHE_BYTES``, 32 MiB by default) keyed
+  by source path, mtime, width and format, so an edited original gets
+  fresh variants; a variant that cannot be cached is still served
+- Single-flight encoding: concurrent requests for one variant wait for one
+  encode instead of running it in parallel
+- ``srcset(item)`` lists a registry image's variants for templates, so
+  browsers fetch the smallest one that fills the layout; ``sized_src(item)``
+  is the size-limited ``src`` (and preload URL) that goes with it
+- Pillow is optional (``pip install .[images]``); without it the endpoint
+  redirects to the original file
+
+Architecture:
+- Cache sizes and recency (mtime, touched on every hit) are read from the
+  directory, so the budget holds across workers and restarts
+- Encoded variants are written to a temp file and renamed into place; only
+  temp files older than ``TEMP_MAX_AGE`` are cleaned up at startup
+"""
+
+import bisect
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from io import BytesIO
+from pathlib import Path
+
+from flask import Blueprint, abort, current_app, redirect, request, send_file, url_for
+from werkzeug.security import safe_join
+
+from .tenants import resolve_tenant
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:  # pragma: no cover - depends on the environment
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+IMAGE_ROOT = "images"
+SOURCE_SUFFIXES = (".jpg", ".jpeg", ".png", ".webp")
+# Widths encoded; other widths redirect to the next one up
+WIDTHS = (64, 128, 256, 320, 480, 640, 768, 960, 1280, 1600, 1920, 2560)
+# Shared by all workers; on Cloud Run the temp dir is in-memory (tmpfs)
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+TEMP_PREFIX = "."
+TEMP_MAX_AGE = 600  # Seconds before a temp file counts as abandoned
+SRC_WIDTH = 960  # Largest img src width for clients that ignore srcset
+CACHE_CONTROL = "public, max-age=86400, stale-while-revalidate=604800"
+
+# Accept value -> (Pillow format, file suffix, save options), best first
+FORMATS = OrderedDict(
+    [
+        ("image/avif", ("AVIF", ".avif", {"quality": 55})),
+        ("image/webp", ("WEBP", ".webp", {"quality": 80, "method": 4})),
+        ("image/jpeg", ("JPEG", ".jpg", {"quality": 82, "optimize": True})),
+    ]
+)
+PNG = ("PNG", ".png", {"optimize": True})
+
+images = Blueprint("images", __name__)
+
+# Same Host handling as the pages: unknown hosts get a 404
+images.before_request(resolve_tenant)
+
+
+class DiskLRU:
+    """
+    Byte-bounded directory of cached files, least recently used evicted.
+
+    The directory itself is the index: sizes and recency (mtime) are read
+    from disk, so every worker sharing the directory enforces one budget.
+
+    Args:
+        path (str): Cache directory (created when missing)
+        budget (int): Maximum total size of the cached files in bytes
+    """
+
+    def __init__(self, path, budget=DEFAULT_CACHE_BYTES):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.budget = budget
+        self.failed_writes = 0
+        self._lock = threading.Lock()
+        # Temp files of interrupted writes; recent ones may be another
+        # worker's write in progress
+        cutoff = time.time() - TEMP_MAX_AGE
+        for entry in os.scandir(self.path):
+            if entry.name.startswith(TEMP_PREFIX) and entry.stat().st_mtime < cutoff:
+                _unlink(entry.path)
+        self._evict()
+
+    def __len__(self):
+        return len(self._files())
+
+    @property
+    def size(self):
+        return sum(size for _, size, _ in self._files())
+
+    def get(self, name):
+        """Path of cached file ``name`` (marked recently used) or None."""
+        path = self.path / name
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def put(self, name, data):
+        """
+        Store ``data`` as ``name`` and evict beyond the budget.
+
+        Returns:
+            Path of the cached file, or None when it could not be written
+            (full disk, directory removed); callers serve ``data`` uncached
+        """
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.path, prefix=TEMP_PREFIX)
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(data)
+            path = self.path / name
+            os.replace(tmp, path)
+        except OSError:
+            self.failed_writes += 1
+            logger.warning("Caching image variant %s failed", name, exc_info=True)
+            if tmp is not None:
+                _unlink(tmp)
+            return None
+        self._evict()
+        return path
+
+    def _files(self):
+        """``(mtime, size, path)`` of each cached file, oldest first."""
+        files = []
+        for entry in os.scandir(self.path):
+            if entry.name.startswith(TEMP_PREFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:  # evicted by another worker
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(files)
+
+    def _evict(self):
+        with self._lock:
+            files = self._files()
+            size = sum(size for _, size, _ in files)
+            # The newest file (usually the one just written) is always kept
+            for _, file_size, path in files[:-1]:
+                if size <= self.budget:
+                    break
+                _unlink(path)
+                size -= file_size
+
+
+def _unlink(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+class ImageResizer:
+    """
+    Resizes originals into a DiskLRU, one encode per variant at a time.
+
+    Args:
+        root (str): Directory of the original images
+        cache (DiskLRU): Encoded variants
+        widths (tuple): Widths encoded, ascending
+    """
+
+    def __init__(self, root, cache, widths=WIDTHS):
+        self.root = Path(root)
+        self.cache = cache
+        self.widths = tuple(sorted(widths))
+        self.encodes = 0
+        self.hits = 0
+        self.coalesced = 0
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.formats = [
+            mimetype
+            for mimetype, (name, _, _) in FORMATS.items()
+            if name == "JPEG" or features.check(name.lower())
+        ]
+
+    def source(self, path):
+        """Absolute path of an original image, or None when not servable."""
+        if not path.lower().endswith(SOURCE_SUFFIXES):
+            return None
+        full = safe_join(str(self.root), path)
+        if full is None or not os.path.isfile(full):
+            return None
+        return full
+
+    def snap(self, width):
+        """Smallest breakpoint of at least ``width``, or None past the largest."""
+        index = bisect.bisect_left(self.widths, width)
+        return self.widths[index] if width > 0 and index < len(self.widths) else None
+
+    def negotiate(self, accept):
+        """Best format the client accepts explicitly; JPEG otherwise."""
+        accepted = {value for value, quality in accept if quality > 0}
+        for mimetype in self.formats:
+            if mimetype in accepted:
+                return mimetype
+        return "image/jpeg"
+
+    def variant(self, source, width, mimetype):
+        """
+        Cached variant path and its MIME type, encoding it when missing.
+
+        Returns:
+            tuple: (path, mimetype); PNG replaces JPEG for transparent sources.
+            The path is an in-memory file when the cache could not store it
+        """
+        stat = os.stat(source)
+        key = f"{source}|{stat.st_mtime_ns}|{width}|{mimetype}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+        with self._lock:
+            flight = self._flights.get(digest)
+            leader = flight is None
+            if leader:
+                flight = self._flights[digest] = [threading.Lock(), 0]
+            flight[1] += 1
+        try:
+            with flight[0]:
+                for suffix in (FORMATS[mimetype][1], PNG[1]):
+                    path = self.cache.get(digest + suffix)
+                    if path is not None:
+                        if leader:
+                            self.hits += 1
+                        else:
+                            self.coalesced += 1
+                        return path, _mimetype(suffix)
+                data, suffix = self._encode(source, width, mimetype)
+                self.encodes += 1
+                path = self.cache.put(digest + suffix, data)
+                return path or BytesIO(data), _mimetype(suffix)
+        finally:
+            with self._lock:
+                flight[1] -= 1
+                if not flight[1]:
+                    del self._flights[digest]
+
+    def _encode(self, source, width, mimetype):
+        with Image.open(source) as original:
+            image = ImageOps.exif_transpose(original)
+            if width < image.width:
+                height = max(1, round(image.height * width / image.width))
+                image = image.resize((width, height), Image.LANCZOS)
+            fmt, suffix, options = FORMATS[mimetype]
+            alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+            if fmt == "JPEG":
+                if alpha:
+                    fmt, suffix, options = PNG
+                else:
+                    image = image.convert("RGB")
+            elif image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if alpha else "RGB")
+            buffer = BytesIO()
+            image.save(buffer, fmt, **options)
+        return buffer.getvalue(), suffix
+
+    def stats(self):
+        return {
+            "entries": len(self.cache),
+            "bytes": self.cache.size,
+            "budget": self.cache.budget,
+            "failed_writes": self.cache.failed_writes,
+            "encodes": self.encodes,
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+        }
+
+
+def _mimetype(suffix):
+    if suffix == PNG[1]:
+        return "image/png"
+    return next(mime for mime, (_, ext, _) in FORMATS.items() if ext == suffix)
+
+
+@images.route("/img/<int:width>/<path:path>")
+def resized(width, path):
+    """
+    Content image resized to ``width`` pixels in the best accepted format
+
+    Args:
+        width (int): Target width in pixels, up to the largest breakpoint
+        path (str): Image path below ``static/images``
+
+    Returns:
+        Encoded variant, a redirect to the breakpoint width when ``width``
+        is not one, or a redirect to the original without Pillow
+    """
+    resizer = current_app.extensions.get("images")
+    if resizer is None:
+        return redirect(url_for("static", filename=f"{IMAGE_ROOT}/{path}"))
+    source = resizer.source(path)
+    snapped = resizer.snap(width)
+    if source is None or snapped is None:
+        abort(404)
+    if snapped != width:
+        return redirect(url_for("images.resized", width=snapped, path=path), 301)
+    variant, mimetype = resizer.variant(
+        source, width, resizer.negotiate(request.accept_mimetypes)
+    )
+    response = send_file(variant, mimetype=mimetype, conditional=True, etag=True)
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    response.vary.add("Accept")
+    return response
+
+
+def _variant_widths(item):
+    """``(path below static/images, breakpoints below its width)`` or None."""
+    resizer = current_app.extensions.get("images")
+    prefix = IMAGE_ROOT + "/"
+    if (
+        resizer is None
+        or not item.width
+        or not item.name.startswith(prefix)
+        or not item.name.lower().endswith(SOURCE_SUFFIXES)
+    ):
+        return None
+    widths = [width for width in resizer.widths if width < item.width]
+    return (item.name.removeprefix(prefix), widths) if widths else None
+
+
+def srcset(item):
+    """
+    ``srcset`` of a registry image: its ``/img/`` variant at each breakpoint
+    below its own width, then the original at its width.
+
+    Args:
+        item (MediaItem): Image below ``static/images``
+
+    Returns:
+        str or None: None when the image cannot be resized (no Pillow, not
+        below ``static/images``, unknown width or already small)
+    """
+    variants = _variant_widths(item)
+    if variants is None:
+        return None
+    path, widths = variants
+    candidates = [
+        f"{url_for('images.resized', width=width, path=path)} {width}w"
+        for width in widths
+    ]
+    candidates.append(f"{item.url} {item.width}w")
+    return ", ".join(candidates)
+
+
+def sized_src(item, width=SRC_WIDTH):
+    """
+    ``src`` of a registry image: its variant at the largest breakpoint up to
+    ``width``, so clients without ``srcset`` support (and ``Link`` preload
+    parsers) still fetch a size-limited file. The original when it is
+    already that small or cannot be resized.
+    """
+    variants = _variant_widths(item)
+    if variants is None or variants[1][0] > width:
+        return item.url
+    path, widths = variants
+    width = max(candidate for candidate in widths if candidate <= width)
+    return url_for("images.resized", width=width, path=path)
+
+
+def init_images(app):
+    """
+    Register ``/img/<width>/<path>`` and its disk cache.
+
+    Config:
+        IMAGE_CACHE_DIR: Variant cache directory (default: system temp dir)
+        IMAGE_CACHE_BYTES: Disk budget of the variant cache, shared by every
+            worker using the directory
+        IMAGE_WIDTHS: Width breakpoints encoded
+    """
+    app.register_blueprint(images)
+    if Image is None:  # pragma: no cover - depends on the environment
+        return None
+    cache_dir = app.config.get("IMAGE_CACHE_DIR") or os.path.join(
+        tempfile.gettempdir(), "portfolio-img"
+    )
+    resizer = app.extensions["images"] = ImageResizer(
+        Path(app.static_folder) / IMAGE_ROOT,
+        DiskLRU(
+            cache_dir, int(app.config.get("IMAGE_CACHE_BYTES", DEFAULT_CACHE_BYTES))
+        ),
+        widths=tuple(int(width) for width in app.config.get("IMAGE_WIDTHS", WIDTHS)),
+    )
+    return resizer
@@ -0,0 +1,314 @@
+"""
+Media Registry Module
+=====================
+
+One lookup table for every image, video and audio file under ``static``,
+built once at startup. Data modules and templates ask the registry for a
+media item instead of sniffing file extensions and calling ``url_for`` on
+every render.
+
+Features:
+- Logical name (static-relative path, e.g. ``images/content/foo.jpg``) ->
+  ``MediaItem`` with URL, MIME type, kind, size in bytes, dimensions,
+  duration and sibling variants (``foo.webp`` next to ``foo.jpg``)
+- O(1) lookups by name, by URL, or by a name relative to per-kind content
+  roots (``find("foo.mp4", CONTENT_ROOTS)`` -> ``videos/content/foo.mp4``)
+- Dimensions from the ``media`` section of the build manifest (with the
+  color and blur-up placeholder of ``flask build media``); otherwise read
+  from image headers (Pillow) and SVG root elements at startup
+- MP4/MOV duration and frame size from the ``moov`` box, without ffmpeg
+- Poster, preview loop and HLS/MP4 sources from ``flask build video``
+  (the ``video`` manifest section); GIFs with video sources render as
+  looping videos, including the card hover background
+  (``card_background()`` template global)
+- Unknown names resolve to an item guessed from the file name, so content
+  pointing at a missing file still renders a link
+
+Architecture:
+- URLs are built with ``url_for("static", ...)`` once at startup, so they
+  follow ``APPLICATION_ROOT`` and ``static_url_path``
+- ``dist/`` build outputs are not scanned; they are reached through the
+  asset manifest
+- The registry is immutable after startup; adding media needs a restart
+  (or a new deploy), like the asset manifest
+"""
+
+import functools
+import mimetypes
+import os
+import posixpath
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from flask import current_app, url_for
+
+from ..build.media import mp4_metadata, svg_metadata
+
+try:
+    from PIL import Image
+except ImportError:  # pragma: no cover - depends on the environment
+    Image = None
+
+SKIP_DIRS = ("dist",)
+MEDIA_KINDS = ("image", "video", "audio")
+ISO_MEDIA_SUFFIXES = (".mp4", ".m4v", ".mov")
+
+# Carousel media names are relative to these folders, by kind
+CONTENT_ROOTS = {"image": "images/content", "video": "videos/content"}
+# Card hover background; cards.css shows the GIF until it is transcoded
+CARD_BACKGROUND = "images/content/card-backgrounds.gif"
+
+_ROTATED = (5, 6, 7, 8)  # EXIF orientations that swap width and height
+
+
+@dataclass(frozen=True, slots=True)
+class MediaItem:
+    name: str
+    url: str
+    mimetype: str
+    kind: str
+    size: int = 0
+    width: int | None = None
+    height: int | None = None
+    duration: float | None = None
+    color: str | None = None
+    placeholder: str | None = None
+    variants: dict = field(default_factory=dict)
+    poster: str | None = None
+    preview: str | None = None
+    sources: tuple = ()
+
+    @property
+    def exists(self):
+        return self.size > 0
+
+    @property
+    def media_type(self):
+        """How templates render the item: transcoded GIFs play as video."""
+        return "video" if self.sources else self.kind
+
+    @property
+    def meta(self):
+        """Template metadata: dimensions plus color/placeholder, or None."""
+        if not self.width:
+            return None
+        meta = {"width": self.width, "height": self.height}
+        if self.placeholder:
+            meta["color"] = self.color
+            meta["placeholder"] = self.placeholder
+        return meta
+
+
+def _mimetype(name):
+    return mimetypes.guess_type(name)[0] or "application/octet-stream"
+
+
+def default_static_url(name):
+    """URL of static file ``name`` outside an application (tests, scripts)."""
+    return f"/static/{name}"
+
+
+def _url(static_url, path):
+    return static_url(path) if path else None
+
+
+def probe(path, mimetype):
+    """Dimensions (and duration for video) read from a media file's header."""
+    suffix = path.suffix.lower()
+    if suffix == ".svg":
+        return svg_metadata(path) or {}
+    if suffix in ISO_MEDIA_SUFFIXES:
+        return mp4_metadata(path)
+    if mimetype.startswith("image/") and Image is not None:
+        try:
+            with Image.open(path) as image:
+                width, height = image.size
+                if image.getexif().get(0x0112) in _ROTATED:
+                    width, height = height, width
+        except OSError:
+            return {}
+        return {"width": width, "height": height}
+    return {}
+
+
+class MediaRegistry:
+    """
+    Immutable index of the media files below a static folder.
+
+    Args:
+        items (dict): Logical name -> MediaItem
+        static_url (callable): Static-relative name -> URL
+    """
+
+    def __init__(self, items, static_url=default_static_url):
+        self.items = items
+        self.static_url = static_url
+        self._by_url = {item.url: item for item in items.values()}
+        self._guessed = {}
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, name):
+        return name in self.items
+
+    @classmethod
+    def scan(cls, static_folder, static_url=default_static_url, index=None, video=None):
+        """
+        Build the registry from the files below ``static_folder``.
+
+        Args:
+            static_folder (str): Folder to scan (``dist/`` is skipped)
+            static_url (callable): Static-relative name -> URL
+            index (dict, optional): ``media`` section of the build manifest;
+                its entries replace header probing
+            video (dict, optional): ``video`` section of the build manifest
+        """
+        static = Path(static_folder)
+        index = index or {}
+        video = video or {}
+        files = {}
+        for directory, dirnames, filenames in os.walk(static):
+            if directory == str(static):
+                dirnames[:] = [name for name in dirnames if name not in SKIP_DIRS]
+            for filename in filenames:
+                path = Path(directory) / filename
+                mimetype = _mimetype(filename)
+                if mimetype.partition("/")[0] in MEDIA_KINDS:
+                    files[path.relative_to(static).as_posix()] = (path, mimetype)
+
+        siblings = {}
+        for name, (_, mimetype) in files.items():
+            siblings.setdefault(posixpath.splitext(name)[0], {})[mimetype] = name
+
+        items = {}
+        for name, (path, mimetype) in sorted(files.items()):
+            meta = index.get(name) or probe(path, mimetype)
+            variants = {
+                other: static_url(sibling)
+                for other, sibling in siblings[posixpath.splitext(name)[0]].items()
+                if sibling != name
+            }
+            outputs = video.get(name, {})
+            items[name] = MediaItem(
+                name=name,
+                url=static_url(name),
+                mimetype=mimetype,
+                kind=mimetype.partition("/")[0],
+                size=path.stat().st_size,
+                width=meta.get("width"),
+                height=meta.get("height"),
+                duration=meta.get("duration"),
+                color=meta.get("color"),
+                placeholder=meta.get("placeholder"),
+                variants=variants,
+                poster=_url(static_url, outputs.get("poster")),
+                preview=_url(static_url, outputs.get("preview")),
+                sources=tuple(
+                    {**source, "src": _url(static_url, source["src"])}
+                    for source in outputs.get("sources", ())
+                ),
+            )
+        return cls(items, static_url)
+
+    def get(self, name):
+        """MediaItem for logical ``name`` or None."""
+        return self.items.get(name)
+
+    def by_url(self, url):
+        """MediaItem served at ``url`` or None."""
+        return self._by_url.get(url)
+
+    def find(self, name, roots=None):
+        """
+        Look ``name`` up directly, then relative to each of ``roots``.
+
+        Args:
+            name (str): Logical name, URL, or path relative to a root
+                (``../`` allowed, e.g. ``../logos/logo.png``)
+            roots (dict, optional): Kind -> folder, e.g. ``CONTENT_ROOTS``
+
+        Returns:
+            MediaItem or None
+        """
+        item = self.items.get(name) or self._by_url.get(name)
+        if item is not None or not roots:
+            return item
+        for root in roots.values():
+            item = self.items.get(posixpath.normpath(f"{root}/{name}"))
+            if item is not None:
+                return item
+        return None
+
+    def resolve(self, name, roots=None):
+        """
+        Like ``find``, but never None: unknown names get a guessed item.
+
+        The guess takes the kind from the file name and places the file in
+        the matching root, so the page still links where the file should be.
+        """
+        item = self.find(name, roots)
+        if item is not None:
+            return item
+        key = (name, tuple(roots.items()) if roots else ())
+        item = self._guessed.get(key)
+        if item is None:
+            mimetype = _mimetype(name)
+            kind = mimetype.partition("/")[0]
+            if roots:
+                root = roots.get(kind, next(iter(roots.values())))
+                name = posixpath.normpath(f"{root}/{name}")
+            item = self._guessed[key] = MediaItem(
+                name=name,
+                url=self.static_url(name),
+                mimetype=mimetype,
+                kind=kind,
+            )
+        return item
+
+
+def _static_url(app, name):
+    # Same URL in and out of requests (build steps resolve content media too)
+    with app.test_request_context():
+        return url_for("static", filename=name)
+
+
+def media_registry():
+    """Return the MediaRegistry of the current application."""
+    return current_app.extensions["media"]
+
+
+def card_background():
+    """
+    Template helper: the card hover background as a looping video, or None.
+
+    Returns the MediaItem of ``CARD_BACKGROUND`` once ``flask build video``
+    has transcoded it (its ``sources`` come from the ``video`` manifest
+    section); until then cards keep the stylesheet's GIF background.
+    """
+    item = media_registry().get(CARD_BACKGROUND)
+    return item if item is not None and item.sources else None
+
+
+def init_media(app):
+    """
+    Scan the static folder into ``app.extensions["media"]``.
+
+    Call after ``init_assets``: indexed dimensions and placeholders come from
+    the asset manifest.
+
+    URLs come from ``url_for("static", ...)`` in a request context made from
+    the config, built once at startup (and once per guessed name). They include ``APPLICATION_ROOT``
+    and ``static_url_path`` but not a per-request ``SCRIPT_NAME`` (e.g. from
+    ``X-Forwarded-Prefix``); mount the app under a prefix through
+    ``APPLICATION_ROOT``. The cached view models hold these URLs anyway.
+    """
+
+    registry = app.extensions["media"] = MediaRegistry.scan(
+        app.static_folder,
+        functools.partial(_static_url, app),
+        app.extensions["assets"].media,
+        app.extensions["assets"].video,
+    )
+    app.add_template_global(card_background)
+    return registry
@@ -0,0 +1,160 @@
+"""
+Offline Support Module
+======================
+
+Service worker and web app manifest generated per tenant, so repeat
+navigations are answered from the browser's cache instead of the network.
+
+Features:
+- ``/sw.js`` precaches every page (the argument-free GET routes of
+  ``routes`` in ``app.url_map``, as warmed at startup, minus
+  ``UNCACHED_ENDPOINTS``) and every hashed build output in the static
+  manifest
+- Pages: stale-while-revalidate (the cached page shows instantly and is
+  refreshed in the background); offline navigations to uncached pages get
+  the cached home page
+- Navigations with a query string and the ``UNCACHED_ENDPOINTS`` pages
+  (search results) go to the network and are never stored, so each query
+  does not add a cache entry
+- Hashed assets under ``static/dist/``: cache-first, they never change
+- Cache names carry a version hashed from the content version and the
+  precache list: a deploy or content edit installs a new worker, which
+  deletes the previous caches
+- ``/site.webmanifest``: name, colors and icons for installing the site
+- ``SERVICE_WORKER = false`` stops pages registering the worker and serves
+  one that deletes its caches and unregisters itself
+
+Architecture:
+- Both files are rendered once per tenant and cached as payloads (ETag,
+  gzip/br) in the tenant's ``offline`` cache, dropped on content reload
+- ``/sw.js`` is served ``no-cache`` so browsers pick up new versions on
+  their next update check
+"""
+
+import json
+
+from flask import Blueprint, current_app, render_template, url_for
+
+from ..build.manifest import content_hash
+from ..data.content_store import current_content
+from .assets import DIST_PREFIX, get_manifest
+from .http_cache import CachedPayload, dumps_json, payload_response
+from .tenants import resolve_tenant, tenant_cache
+from .warmup import page_urls
+
+offline = Blueprint("offline", __name__)
+offline.before_request(resolve_tenant)
+
+WORKER_TEMPLATE = "offline/sw.js"
+THEME_COLOR = "#000000"
+ICON_PATH = "images/favicons/web-app-manifest-{size}x{size}.png"
+ICON_SIZES = (192, 512)
+# Pages whose response depends on the query string: never cached by the worker
+UNCACHED_ENDPOINTS = ("routes.search",)
+
+
+def precache_urls(app):
+    """
+    URLs a new service worker caches while it installs.
+
+    Returns:
+        tuple: (page URLs, hashed asset URLs), both sorted
+    """
+    assets = {
+        url_for("static", filename=path) for path in get_manifest().assets.values()
+    }
+    pages = set(page_urls(app)) - set(uncached_urls())
+    return sorted(pages), sorted(assets)
+
+
+def uncached_urls():
+    """Page paths the worker passes to the network instead of caching."""
+    return sorted(url_for(endpoint) for endpoint in UNCACHED_ENDPOINTS)
+
+
+def cache_version(content_version, pages, assets):
+    """Short hash naming the worker's caches; changes with any input."""
+    return content_hash(json.dumps([content_version, pages, assets]).encode("utf-8"))
+
+
+def _cached_payload(name, build):
+    cache = tenant_cache("offline")
+    payload = cache.get(name)
+    if payload is None:
+        payload = cache[name] = build()
+    return payload
+
+
+def _build_worker():
+    app = current_app
+    pages, assets = precache_urls(app)
+    script = render_template(
+        WORKER_TEMPLATE,
+        enabled=app.config.get("SERVICE_WORKER", True),
+        version=cache_version(current_content().version, pages, assets),
+        pages=pages,
+        uncached=uncached_urls(),
+        assets=assets,
+        home=url_for("routes.home"),
+        hashed_prefix=url_for("static", filename=DIST_PREFIX),
+    )
+    return CachedPayload(script.encode("utf-8"), "text/javascript")
+
+
+def _build_webmanifest():
+    name = current_app.config.get("APP_NAME", "me2u Portfolio")
+    manifest = {
+        "name": name,
+        "short_name": name,
+        "start_url": url_for("routes.home"),
+        "scope": "/",
+        "display": "standalone",
+        "background_color": THEME_COLOR,
+        "theme_color": THEME_COLOR,
+        "icons": [
+            {
+                "src": url_for("static", filename=ICON_PATH.format(size=size)),
+                "sizes": f"{size}x{size}",
+                "type": "image/png",
+                "purpose": "any maskable",
+            }
+            for size in ICON_SIZES
+        ],
+    }
+    return CachedPayload(dumps_json(manifest), "application/manifest+json")
+
+
+@offline.route("/sw.js")
+def service_worker():
+    """
+    Service worker script for this tenant
+
+    Returns:
+        JavaScript with the precache list and cache version, never cached
+        by HTTP caches without revalidation
+    """
+    return payload_response(
+        _cached_payload("sw.js", _build_worker), cache_control="no-cache"
+    )
+
+
+@offline.route("/site.webmanifest")
+def webmanifest():
+    """
+    Web app manifest for installing the site
+
+    Returns:
+        Manifest JSON with the app name, theme colors and icons
+    """
+    return payload_response(_cached_payload("site.webmanifest", _build_webmanifest))
+
+
+def init_offline(app):
+    """
+    Register ``/sw.js`` and ``/site.webmanifest``.
+
+    Config:
+        SERVICE_WORKER: Register the caching worker (default: True); when
+            false the served worker clears its caches and unregisters
+    """
+    app.register_blueprint(offline)
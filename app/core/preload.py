@@ -0,0 +1,134 @@
+"""
+Critical Asset Preload Module
+=============================
+
+Computes the page-critical assets for each route from its precomputed view
+model and announces them in a ``Link: rel=preload`` response header, so the
+browser starts fetching stylesheets, icon fonts and the hero image before it
+has parsed the document.
+
+Features:
+- Stylesheets resolved through the hashed asset manifest (or the unbundled
+  files when no build exists)
+- Self-hosted icon webfonts with the ``crossorigin`` attribute fonts need
+- Hero image per page: the home card image or the first carousel slide,
+  with the same size-limited ``src``/``srcset``/``sizes`` as its ``<img>``
+  (``imagesrcset``/``imagesizes``); templates load it eagerly with
+  ``fetchpriority="high"``
+- Header values cached per view model, so each request is a dict lookup
+
+Early Hints:
+WSGI has no API for interim (1xx) responses. Front proxies and CDNs that
+support 103 Early Hints (Cloud CDN, Cloudflare, Fastly) synthesize them from
+these ``Link`` headers and replay them before the origin finishes rendering.
+"""
+
+from flask import current_app, g, url_for
+
+from .assets import get_manifest
+from .tenants import tenant_cache
+
+FAVICON = "images/favicons/favicon.svg"
+UNBUNDLED_CSS = ("css/style.css", "css/cards.css")
+FONT_TYPES = {"woff2": "font/woff2", "woff": "font/woff"}
+
+
+def _stylesheet_links(manifest):
+    links = []
+    for name in ("vendor/bootstrap.css", "vendor/fontawesome.css"):
+        if name in manifest.assets:
+            links.append((url_for("static", filename=manifest.resolve(name)), "style"))
+    if "css/bundle.css" in manifest.assets:
+        links.append(
+            (url_for("static", filename=manifest.resolve("css/bundle.css")), "style")
+        )
+    else:
+        links.extend((url_for("static", filename=n), "style") for n in UNBUNDLED_CSS)
+    return links
+
+
+def _font_links(manifest):
+    links = []
+    for path in manifest.assets.values():
+        suffix = path.rsplit(".", 1)[-1]
+        if "/webfonts/" in path and suffix in FONT_TYPES:
+            links.append((url_for("static", filename=path), "font", FONT_TYPES[suffix]))
+    return links
+
+
+def _hero_link(model):
+    """
+    Return the hero image link for a view model, if it has one.
+
+    The link carries the image's ``src``, ``srcset`` and ``sizes`` as
+    rendered, so the browser preloads the same variant the ``<img>`` picks.
+    """
+    card = model.get("home_card")
+    if card and card.get("image_src"):
+        return (
+            card["image_src"],
+            "image",
+            card.get("image_srcset"),
+            card.get("image_sizes"),
+        )
+    slides = model.get("slides")
+    if slides and slides[0].get("media_type", "image") == "image":
+        slide = slides[0]
+        return (slide["src"], "image", slide.get("srcset"), slide.get("sizes"))
+    return None
+
+
+def format_link(link):
+    """
+    Format a link tuple as a Link header entry: ``(url, "font", type)``,
+    ``(url, "image", srcset, sizes)`` or ``(url, as)``.
+    """
+    url, kind = link[0], link[1]
+    value = f"<{url}>; rel=preload; as={kind}"
+    if kind == "font":
+        value += f'; type="{link[2]}"; crossorigin'
+    elif kind == "image" and len(link) > 2 and link[2]:
+        value += f'; imagesrcset="{link[2]}"; imagesizes="{link[3] or "100vw"}"'
+    return value
+
+
+def critical_assets(model):
+    """
+    List the page-critical assets for a view model.
+
+    Returns:
+        list: Link tuples (see ``format_link``) in fetch priority order
+    """
+    manifest = get_manifest()
+    links = _stylesheet_links(manifest) + _font_links(manifest)
+    hero = _hero_link(model)
+    if hero:
+        links.append(hero)
+    links.append((url_for("static", filename=FAVICON), "image"))
+    return links
+
+
+def preload_header(name, model):
+    """Return the cached ``Link`` header value for view model ``name``."""
+    cache = tenant_cache("preload_links")
+    header = cache.get(name)
+    if header is None:
+        header = cache[name] = ", ".join(
+            format_link(link) for link in critical_assets(model)
+        )
+    return header
+
+
+def add_preload_header(response):
+    """After-request hook: announce critical assets for rendered pages."""
+    name = g.get("view_model")
+    if (
+        name
+        and response.status_code == 200
+        and response.mimetype == "text/html"
+        and current_app.config.get("PRELOAD_HEADERS", True)
+    ):
+        model = tenant_cache("view_models").get(name)
+        if model is not None:
+            response.headers.add("Link", preload_header(name, model))
+    return response
@@ -0,0 +1,376 @@
+"""
+Rate Limiting & Load Shedding Module
+====================================
+
+WSGI middleware that caps what a single client, overall and on any one
+route, can cost before the request reaches Flask. Scrapers get ``429 Too Many Requests``
+with ``Retry-After``; when the worker already has too many requests in
+flight, new ones get an immediate ``503`` instead of queueing.
+
+Features:
+- Token buckets per client IP and per client IP and route (endpoint),
+  refilled lazily on access (no timers). Route buckets are never shared
+  between clients, so one scraper cannot exhaust a route for everyone;
+  total load is bounded by the in-flight cap instead
+- In-process buckets in a dict with time-wheel eviction: idle buckets are
+  dropped one wheel slot at a time, so memory tracks active clients only
+- Optional shared-memory buckets (``RATE_LIMIT_SHARED_MEMORY``): a fixed
+  size, memory-mapped table with per-slot record locks shared by all
+  gunicorn workers on the host
+- Sub-resources fetched by pages (slide fragments, resized images, the
+  service worker and web manifest) draw from a separate, larger per-IP
+  asset bucket instead of the page budget and route buckets
+- Precomputed 429/503 responses; health checks and static files are exempt
+
+Architecture:
+- Runs as ``app.wsgi_app`` middleware, so rejected requests skip routing,
+  sessions and template rendering entirely
+- The client IP is taken from ``RATE_LIMIT_CLIENT_IP_HEADER`` when set
+  (the CDN's client address header), else from ``X-Forwarded-For``
+  counting ``RATE_LIMIT_TRUSTED_PROXIES`` hops from the right, otherwise
+  from ``REMOTE_ADDR``. Cloud Run alone appends the real client address
+  (1 hop); behind a CDN it appends the CDN edge, so the client is 2 hops
+  from the right
+"""
+
+import fcntl
+import hashlib
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+
+from werkzeug.exceptions import HTTPException
+from werkzeug.wsgi import ClosingIterator
+
+from .access_log import ROUTE_KEY
+
+EXEMPT_ENDPOINTS = frozenset({"static", "routes.health"})
+# Fetched by pages rather than visitors; charged to the per-IP asset bucket
+ASSET_ENDPOINTS = frozenset(
+    {"api.slide", "images.resized", "offline.service_worker", "offline.webmanifest"}
+)
+UNMATCHED = "<unmatched>"
+
+
+class TokenBuckets:
+    """
+    In-process token buckets with time-wheel eviction of idle keys.
+
+    Each bucket is ``[tokens, last_seen, wheel_slot]``. A key lives in the
+    wheel slot of its last access; when the wheel comes back around to that
+    slot (``idle`` seconds later) the key has been idle long enough to be
+    full again and is dropped.
+    """
+
+    def __init__(self, idle=60.0, slots=60):
+        self._buckets = {}
+        self._wheel = [set() for _ in range(slots)]
+        self._resolution = idle / slots
+        self._tick = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def take(self, key, rate, burst, now):
+        """
+        Take one token from bucket ``key``.
+
+        Returns:
+            float: 0 when allowed, else seconds until a token is available
+        """
+        with self._lock:
+            tick = int(now / self._resolution)
+            self._advance(tick)
+            slot = tick % len(self._wheel)
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [float(burst), now, slot]
+                self._wheel[slot].add(key)
+            else:
+                bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1] = now
+                if bucket[2] != slot:
+                    self._wheel[bucket[2]].discard(key)
+                    self._wheel[slot].add(key)
+                    bucket[2] = slot
+            if bucket[0] >= 1:
+                bucket[0] -= 1
+                return 0.0
+            return (1 - bucket[0]) / rate
+
+    def _advance(self, tick):
+        if self._tick is None:
+            self._tick = tick
+            return
+        size = len(self._wheel)
+        for step in range(1, min(tick - self._tick, size) + 1):
+            slot = (self._tick + step) % size
+            for key in self._wheel[slot]:
+                del self._buckets[key]
+            self._wheel[slot] = set()
+        self._tick = max(tick, self._tick)
+
+
+class SharedTokenBuckets:
+    """
+    Token buckets in a memory-mapped file shared across worker processes.
+
+    The table is direct-mapped: a key hashes to one fixed slot holding
+    ``(key hash, tokens, last_seen)``. A colliding key simply resets the
+    slot, which errs on the side of allowing requests. Memory is fixed at
+    ``slots * 24`` bytes, so no eviction is needed.
+    """
+
+    RECORD = struct.Struct("<Qdd")
+
+    def __init__(self, path, slots=65536):
+        self.slots = slots
+        size = slots * self.RECORD.size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size, mmap.MAP_SHARED)
+        # POSIX record locks exclude other processes, not other threads
+        self._lock = threading.Lock()
+
+    def take(self, key, rate, burst, now):
+        """Same contract as ``TokenBuckets.take``."""
+        digest = int.from_bytes(
+            hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little"
+        )
+        offset = (digest % self.slots) * self.RECORD.size
+        with self._lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, self.RECORD.size, offset)
+            try:
+                stored, tokens, last = self.RECORD.unpack_from(self._map, offset)
+                if stored != digest:
+                    tokens = float(burst)
+                else:
+                    tokens = min(burst, tokens + (now - last) * rate)
+                allowed = tokens >= 1
+                if allowed:
+                    tokens -= 1
+                self.RECORD.pack_into(self._map, offset, digest, tokens, now)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, self.RECORD.size, offset)
+        return 0.0 if allowed else (1 - tokens) / rate
+
+
+def header_key(name):
+    """WSGI environ key of the HTTP header ``name`` (e.g. ``Fastly-Client-IP``)."""
+    return "HTTP_" + name.upper().replace("-", "_") if name else None
+
+
+def client_ip(environ, trusted_proxies=1, header=None):
+    """
+    Client address of a request behind ``trusted_proxies`` proxy hops.
+
+    Each trusted proxy appends the address it received the request from to
+    ``X-Forwarded-For``, so earlier entries may be spoofed by the client.
+    ``header`` is the environ key of a client address header set by the CDN
+    (see ``header_key``); it wins when present. Only use it when the origin
+    is reachable through the CDN alone, since clients can send it too.
+    """
+    if header:
+        address = environ.get(header)
+        if address:
+            return address.strip()
+    forwarded = environ.get("HTTP_X_FORWARDED_FOR")
+    if forwarded and trusted_proxies:
+        hops = [hop.strip() for hop in forwarded.split(",")]
+        return hops[-min(trusted_proxies, len(hops))]
+    return environ.get("REMOTE_ADDR", "")
+
+
+def _plain_response(status, body):
+    body = body.encode("utf-8")
+    headers = [
+        ("Content-Type", "text/plain; charset=utf-8"),
+        ("Content-Length", str(len(body))),
+        ("Cache-Control", "no-store"),
+    ]
+    return status, headers, [body]
+
+
+TOO_MANY_REQUESTS = _plain_response("429 Too Many Requests", "Too Many Requests\n")
+SERVICE_UNAVAILABLE = _plain_response(
+    "503 Service Unavailable", "Service Temporarily Overloaded\n"
+)
+
+
+class RateLimitMiddleware:
+    """
+    WSGI middleware enforcing per-IP and per-IP route limits and an in-flight cap.
+
+    Args:
+        wsgi_app: Wrapped WSGI application
+        url_map (Map): Flask URL map, used to resolve the endpoint
+        buckets: TokenBuckets or SharedTokenBuckets
+        per_ip (tuple): ``(rate per second, burst)`` for each client IP
+        per_route (tuple): ``(rate per second, burst)`` for each client IP
+            on each endpoint
+        per_asset (tuple): ``(rate per second, burst)`` for each client IP
+            across ``ASSET_ENDPOINTS``
+        max_in_flight (int): Concurrent requests before shedding; 0 disables
+        trusted_proxies (int): Proxy hops appending to X-Forwarded-For
+        client_ip_header (str): Client address header set by the CDN
+        clock (callable): Monotonic time source
+    """
+
+    def __init__(
+        self,
+        wsgi_app,
+        url_map,
+        buckets,
+        per_ip=(10.0, 40),
+        per_route=(5.0, 20),
+        per_asset=(20.0, 100),
+        max_in_flight=64,
+        trusted_proxies=1,
+        client_ip_header=None,
+        clock=time.monotonic,
+    ):
+        self.wsgi_app = wsgi_app
+        self.url_map = url_map
+        self.buckets = buckets
+        self.per_ip = per_ip
+        self.per_route = per_route
+        self.per_asset = per_asset
+        self.max_in_flight = max_in_flight
+        self.trusted_proxies = trusted_proxies
+        self.client_ip_header = header_key(client_ip_header)
+        self.clock = clock
+        self.in_flight = 0
+        self.limited = 0
+        self.shed = 0
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def client_ip(self, environ):
+        return client_ip(environ, self.trusted_proxies, self.client_ip_header)
+
+    def endpoint(self, environ):
+        """Endpoint for the request path; matched paths are memoized."""
+        path = environ.get("PATH_INFO", "")
+        endpoint = self._endpoints.get(path)
+        if endpoint is None:
+            try:
+                endpoint, _ = self.url_map.bind_to_environ(environ).match()
+            except HTTPException:
+                return UNMATCHED
+            if len(self._endpoints) < 4096:
+                self._endpoints[path] = endpoint
+        return endpoint
+
+    def __call__(self, environ, start_response):
+        endpoint = environ[ROUTE_KEY] = self.endpoint(environ)
+        if endpoint not in EXEMPT_ENDPOINTS:
+            now = self.clock()
+            client = self.client_ip(environ)
+            if endpoint in ASSET_ENDPOINTS:
+                wait = self.buckets.take("asset:" + client, *self.per_asset, now)
+            else:
+                wait = self.buckets.take("ip:" + client, *self.per_ip, now) or (
+                    self.buckets.take(
+                        f"route:{client}:{endpoint}", *self.per_route, now
+                    )
+                )
+            if wait:
+                self.limited += 1
+                return self._reject(start_response, TOO_MANY_REQUESTS, wait)
+
+        with self._lock:
+            if self.max_in_flight and self.in_flight >= self.max_in_flight:
+                self.shed += 1
+                shed = True
+            else:
+                self.in_flight += 1
+                shed = False
+        if shed:
+            return self._reject(start_response, SERVICE_UNAVAILABLE, 1)
+
+        try:
+            return ClosingIterator(
+                self.wsgi_app(environ, start_response), self._release
+            )
+        except BaseException:
+            self._release()
+            raise
+
+    def _release(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    @staticmethod
+    def _reject(start_response, response, retry_after):
+        status, headers, body = response
+        start_response(
+            status, headers + [("Retry-After", str(max(1, math.ceil(retry_after))))]
+        )
+        return body
+
+    def stats(self):
+        return {
+            "in_flight": self.in_flight,
+            "limited": self.limited,
+            "shed": self.shed,
+        }
+
+
+def init_rate_limit(app):
+    """
+    Wrap ``app.wsgi_app`` with the rate limiter unless disabled.
+
+    Config:
+        RATE_LIMIT_ENABLED: Master switch
+        RATE_LIMIT_PER_IP / RATE_LIMIT_IP_BURST: Client token bucket
+        RATE_LIMIT_PER_ROUTE / RATE_LIMIT_ROUTE_BURST: Token bucket for each
+            client on each endpoint
+        RATE_LIMIT_PER_ASSET / RATE_LIMIT_ASSET_BURST: Token bucket for each
+            client across the page sub-resources in ``ASSET_ENDPOINTS``
+        RATE_LIMIT_MAX_IN_FLIGHT: Concurrent requests before 503s
+        RATE_LIMIT_TRUSTED_PROXIES: Proxy hops in X-Forwarded-For (1 on
+            Cloud Run, 2 with a CDN in front of it)
+        RATE_LIMIT_CLIENT_IP_HEADER: Client address header set by the CDN
+            (e.g. ``Fastly-Client-IP``); takes precedence when present
+        RATE_LIMIT_SHARED_MEMORY: File (e.g. under /dev/shm) to share
+            buckets across workers; in-process buckets when empty
+    """
+    config = app.config
+    if not config.get("RATE_LIMIT_ENABLED", True):
+        return None
+    per_ip = (
+        float(config.get("RATE_LIMIT_PER_IP", 10.0)),
+        int(config.get("RATE_LIMIT_IP_BURST", 40)),
+    )
+    per_asset = (
+        float(config.get("RATE_LIMIT_PER_ASSET", 20.0)),
+        int(config.get("RATE_LIMIT_ASSET_BURST", 100)),
+    )
+    shared = config.get("RATE_LIMIT_SHARED_MEMORY")
+    if shared:
+        buckets = SharedTokenBuckets(shared)
+    else:
+        idle = max(60.0, per_ip[1] / per_ip[0], per_asset[1] / per_asset[0])
+        buckets = TokenBuckets(idle=idle)
+    middleware = RateLimitMiddleware(
+        app.wsgi_app,
+        app.url_map,
+        buckets,
+        per_ip=per_ip,
+        per_route=(
+            float(config.get("RATE_LIMIT_PER_ROUTE", 5.0)),
+            int(config.get("RATE_LIMIT_ROUTE_BURST", 20)),
+        ),
+        per_asset=per_asset,
+        max_in_flight=int(config.get("RATE_LIMIT_MAX_IN_FLIGHT", 64)),
+        trusted_proxies=int(config.get("RATE_LIMIT_TRUSTED_PROXIES", 1)),
+        client_ip_header=config.get("RATE_LIMIT_CLIENT_IP_HEADER") or None,
+    )
+    app.wsgi_app = middleware
+    app.extensions["rate_limit"] = middleware
+    return middleware
@@ -0,0 +1,319 @@
+"""
+Page Render Cache Module
+========================
+
+Stale-while-revalidate caching for rendered HTML pages. Fresh pages are
+served from memory; once a page passes its TTL it is still served while a
+single background thread re-renders it, so no request waits on a render
+after the first one.
+
+Features:
+- TTL + stale window per entry (``RENDER_CACHE_TTL``, ``RENDER_CACHE_STALE``)
+- Single-flight misses: concurrent requests for the same uncached page wait
+  for one render instead of rendering in parallel (no thundering herd)
+- One refresh thread; a page is queued at most once while it is refreshing
+- Counters for hits, misses, stale serves, coalesced waits, refreshes and
+  refresh errors
+- Misses stream the page (see ``streaming``) while it is cached; cached
+  pages are served buffered with an ETag and gzip/br variants computed once,
+  at fast levels since they are built on the request path
+
+Architecture:
+- Entries live in the tenant's ``pages`` namespace of the shared render
+  cache, so they count against the global byte budget and are dropped with
+  the tenant's other caches on content reload
+- Keys are ``(request.path, template)``: the navbar marks the active path
+- Background renders run in a copy of the triggering request context
+- Only the first of concurrent streamed misses is cached; the others stream
+  their own render rather than wait on another client's download. A stream
+  dropped by its client caches nothing
+"""
+
+import logging
+import threading
+import time
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from flask import copy_current_request_context, current_app, g, render_template, request
+
+from ..data.view_models import get_view_model
+from .access_log import record_cache_status
+from .http_cache import CachedPayload, payload_response
+from .streaming import stream_page, stream_response, streaming_enabled
+from .tenants import current_tenant
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = 300
+DEFAULT_STALE = 3600
+# Pages are compressed on every miss and refresh, inline with the render;
+# brotli 11 is orders of magnitude slower than 5 for a few percent smaller
+PAGE_BROTLI_QUALITY = 5
+PAGE_GZIP_LEVEL = 6
+
+
+class CachedRender:
+    """A rendered body, its HTTP payload and the monotonic time it was rendered."""
+
+    __slots__ = ("body", "created", "payload")
+
+    def __init__(self, body, created):
+        self.body = body
+        self.created = created
+        self.payload = CachedPayload(
+            body.encode("utf-8"),
+            "text/html",
+            brotli_quality=PAGE_BROTLI_QUALITY,
+            gzip_level=PAGE_GZIP_LEVEL,
+        )
+
+    @property
+    def size(self):
+        return len(self.body) + self.payload.size + 64
+
+
+class _Flight:
+    """An in-progress render other requests can wait on."""
+
+    __slots__ = ("event", "value", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class PageCache:
+    """
+    Stale-while-revalidate render cache with single-flight misses.
+
+    Args:
+        ttl (float): Seconds an entry is fresh
+        stale (float): Further seconds a stale entry may be served while it
+            is refreshed in the background
+        clock (callable): Monotonic time source (injectable for tests)
+    """
+
+    def __init__(self, ttl=DEFAULT_TTL, stale=DEFAULT_STALE, clock=time.monotonic):
+        self.ttl = ttl
+        self.stale = stale
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._flights = {}
+        self._streams = set()
+        self._refreshing = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="page-refresh"
+        )
+        self._stats = dict.fromkeys(
+            ("hits", "misses", "stale", "coalesced", "refreshes", "errors"), 0
+        )
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self):
+        """Snapshot of the cache counters."""
+        with self._lock:
+            return dict(self._stats, refreshing=len(self._refreshing))
+
+    def get(self, tenant, key, render, refresh=None, record=None):
+        """
+        Return the cached body for ``key``, rendering it when needed.
+
+        Args:
+            tenant (Tenant): Tenant whose ``pages`` cache holds the entry
+            key (hashable): Page key within the tenant
+            render (callable): Renders the body in the current request
+            refresh (callable, optional): Renders the body outside the
+                request (background refresh); defaults to ``render``
+            record (callable, optional): Called with ``HIT``, ``STALE`` or
+                ``MISS`` (access log cache status)
+        """
+        entry = self.lookup(tenant, key, lambda: refresh or render, record)
+        if entry is None:
+            if record is not None:
+                record("MISS")
+            entry = self.render_once(tenant, key, render)
+        return entry.body
+
+    def lookup(self, tenant, key, make_refresh, record=None):
+        """
+        Return the fresh or stale entry for ``key``, or None on a miss.
+
+        Stale entries are returned while they are re-rendered in the
+        background by the callable ``make_refresh()`` returns; it is only
+        called when a refresh is actually scheduled. ``record`` gets ``HIT``
+        or ``STALE``; misses are left to the caller.
+        """
+        store = tenant.cache("pages")
+        entry = store.get(key)
+        if entry is None:
+            return None
+        age = self.clock() - entry.created
+        if age < self.ttl:
+            self._count("hits")
+            status = "HIT"
+        elif age < self.ttl + self.stale:
+            self._count("stale")
+            status = "STALE"
+            self._schedule_refresh(store, (tenant.key, key), key, make_refresh)
+        else:
+            return None
+        if record is not None:
+            record(status)
+        return entry
+
+    def render_once(self, tenant, key, render):
+        """Render and cache ``key``, or wait for the request already rendering it."""
+        store = tenant.cache("pages")
+        flight_key = (tenant.key, key)
+        with self._lock:
+            flight = self._flights.get(flight_key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[flight_key] = _Flight()
+        if not leader:
+            self._count("coalesced")
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        self._count("misses")
+        try:
+            flight.value = store[key] = CachedRender(render(), self.clock())
+            return flight.value
+        except Exception as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._flights[flight_key]
+            flight.event.set()
+
+    def stream(self, tenant, key, generate):
+        """
+        Stream a missed page, caching its body once the stream completes.
+
+        Args:
+            tenant (Tenant): Tenant whose ``pages`` cache gets the entry
+            key (hashable): Page key within the tenant
+            generate (callable): Returns the page's ``str`` chunks
+
+        Returns:
+            iterator: The chunks. While the page is already being rendered
+            for another request the chunks are not cached: waiting would tie
+            this response to the other client's download speed
+        """
+        flight_key = (tenant.key, key)
+        with self._lock:
+            leader = not (flight_key in self._flights or flight_key in self._streams)
+            if leader:
+                self._streams.add(flight_key)
+        self._count("misses")
+        if not leader:
+            return generate()
+        chunks = self._tee(tenant.cache("pages"), flight_key, key, generate)
+        next(chunks)  # starts the render in this request; closing ends the flight
+        return chunks
+
+    def _tee(self, store, flight_key, key, generate):
+        parts = []
+        try:
+            with closing(generate()) as chunks:
+                yield
+                for chunk in chunks:
+                    parts.append(chunk)
+                    yield chunk
+            store[key] = CachedRender("".join(parts), self.clock())
+        finally:
+            with self._lock:
+                self._streams.discard(flight_key)
+
+    def _schedule_refresh(self, store, flight_key, key, make_refresh):
+        with self._lock:
+            if flight_key in self._refreshing:
+                return
+            refresh = make_refresh()
+
+            def run():
+                try:
+                    store[key] = CachedRender(refresh(), self.clock())
+                    self._count("refreshes")
+                except Exception:
+                    self._count("errors")
+                    logger.exception("Background refresh of %s failed", key)
+                finally:
+                    with self._lock:
+                        self._refreshing.pop(flight_key, None)
+
+            self._refreshing[flight_key] = self._executor.submit(run)
+
+    def drain(self, timeout=None):
+        """Wait for queued background refreshes (tests, shutdown)."""
+        with self._lock:
+            pending = list(self._refreshing.values())
+        wait(pending, timeout=timeout)
+
+
+def render_page(template, view_model):
+    """
+    Render ``template`` with view model ``view_model`` through the page cache.
+
+    Cached pages are served buffered with an ETag (304 on revalidation) and
+    their precomputed gzip/br body. Misses are streamed while they are
+    cached, unless ``STREAM_PAGES`` is off. Without the page cache every
+    page is streamed (or rendered plainly).
+    """
+    model = get_view_model(view_model)
+    streaming = streaming_enabled(current_app)
+
+    def render():
+        with span("render", template=template):
+            return render_template(template, **model)
+
+    cache = current_app.extensions.get("page_cache")
+    if cache is None:
+        return stream_response(stream_page(template, model)) if streaming else render()
+
+    tenant = current_tenant()
+
+    def make_refresh():
+        @copy_current_request_context
+        def refresh():
+            g.tenant = tenant
+            return render_template(template, **get_view_model(view_model))
+
+        return refresh
+
+    key = (request.path, template)
+    entry = cache.lookup(tenant, key, make_refresh, record_cache_status)
+    if entry is None:
+        record_cache_status("MISS")
+        if streaming:
+            return stream_response(
+                cache.stream(tenant, key, lambda: stream_page(template, model))
+            )
+        entry = cache.render_once(tenant, key, render)
+    return payload_response(entry.payload)
+
+
+def init_render_cache(app):
+    """
+    Enable the page cache unless ``RENDER_CACHE_TTL`` is 0.
+
+    Config:
+        RENDER_CACHE_TTL: Seconds a rendered page is fresh
+        RENDER_CACHE_STALE: Seconds a stale page is served while refreshing
+    """
+    ttl = float(app.config.get("RENDER_CACHE_TTL", DEFAULT_TTL))
+    if ttl <= 0:
+        return None
+    cache = app.extensions["page_cache"] = PageCache(
+        ttl, float(app.config.get("RENDER_CACHE_STALE", DEFAULT_STALE))
+    )
+    return cache
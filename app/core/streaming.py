@@ -0,0 +1,122 @@
+"""
+Streaming Render Module
+=======================
+
+Sends HTML pages in a few large chunks while they render instead of building
+the whole page before the first byte. The document head and the navbar go out
+first, so the browser fetches CSS, fonts and the hero image while the content
+is still rendering, and time-to-first-byte no longer grows with the page.
+
+Features:
+- ``{{ stream_flush() }}`` in a template ends a chunk (``base.html`` flushes
+  after the navbar and after the content block); Jinja's small output pieces
+  in between are joined into one write
+- gzip with a sync flush per chunk when the client accepts it, so every
+  compressed chunk is decodable as soon as it arrives
+- Outside a streamed render ``stream_flush()`` renders nothing
+
+Architecture:
+- ``render_page`` streams page cache misses (every page when the cache is
+  off); the page cache keeps the streamed body, so later requests are served
+  buffered with an ETag and precompressed variants
+- Templates render under ``stream_with_context``: the request context (and
+  the request's trace) stays open until the last chunk is sent
+- ``STREAM_PAGES = false`` renders every page buffered; so does TESTING,
+  where the test client leaves a response (and its request context) open
+  until its body is read
+"""
+
+import zlib
+from contextlib import closing
+
+from flask import Response, request, stream_template, stream_with_context
+
+from .tracing import span
+
+# zlib level for streamed responses (compressed while the client waits)
+STREAM_COMPRESS_LEVEL = 6
+
+
+class FlushPoint:
+    """``stream_flush`` of one streamed render: marks the end of a chunk."""
+
+    __slots__ = ("pending",)
+
+    def __init__(self):
+        self.pending = False
+
+    def __call__(self):
+        self.pending = True
+        return ""
+
+
+def _no_flush():
+    return ""
+
+
+def stream_page(template, context):
+    """
+    Render ``template`` as chunks ending at its ``stream_flush()`` calls.
+
+    Args:
+        template (str): Template name
+        context (dict): Template context
+
+    Returns:
+        iterator: ``str`` chunks; rendering happens as they are consumed
+    """
+    flush = FlushPoint()
+
+    @stream_with_context
+    def generate():
+        with span("render", template=template, streamed=True):
+            pieces = []
+            for piece in stream_template(template, stream_flush=flush, **context):
+                pieces.append(piece)
+                if flush.pending:
+                    flush.pending = False
+                    yield "".join(pieces)
+                    pieces.clear()
+            if pieces:
+                yield "".join(pieces)
+
+    return generate()
+
+
+def _gzip(chunks):
+    compressor = zlib.compressobj(STREAM_COMPRESS_LEVEL, zlib.DEFLATED, 31)
+    with closing(chunks):
+        for chunk in chunks:
+            data = compressor.compress(chunk.encode("utf-8"))
+            yield data + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def stream_response(chunks):
+    """
+    HTML response streaming ``chunks``, gzipped when the client accepts it.
+
+    Streamed bodies have no ETag or Content-Length: both need the whole body.
+    """
+    if request.accept_encodings.best_match(["gzip"], default=None):
+        response = Response(_gzip(chunks), mimetype="text/html")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = Response(chunks, mimetype="text/html")
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def streaming_enabled(app):
+    """Whether pages of ``app`` stream (``STREAM_PAGES``, never under TESTING)."""
+    return bool(app.config.get("STREAM_PAGES", True)) and not app.testing
+
+
+def init_streaming(app):
+    """
+    Register the ``stream_flush`` template global (a no-op when buffered).
+
+    Config:
+        STREAM_PAGES: Stream page renders (default: True)
+    """
+    app.jinja_env.globals["stream_flush"] = _no_flush
@@ -11,7 +11,7 @@ Features:
 - Reusable component factory patterns
 - Pre-configured template type definitions
 - Consistent styling and behavior patterns
-- Automatic media type detection and configuration
+- Media type lookup in the media registry
 
 Architecture:
 - Factory pattern for template data structure generation
@@ -30,6 +30,7 @@ contexts without duplicating layout and styling configuration.
 """
 
 from ..data.constants import UI_CONFIG
+from .media import media_registry
 
 # CSS Constants - Centralized styling patterns
 # ===========================================
@@ -184,12 +185,12 @@ class ComponentFactory:
         """
         Generate media component configuration with auto-detection
 
-        Creates media configuration with automatic type detection based on
-        file extension. Supports both image and video content with consistent
+        Creates media configuration with the media type looked up in the
+        media registry. Supports both image and video content with consistent
         responsive styling and accessibility features.
 
         Args:
-            src (str): Media source path (image or video)
+            src (str): Media URL or logical name (image or video)
             alt (str, optional): Alt text for accessibility
             media_type (str, optional): Override media type detection
 
@@ -197,12 +198,14 @@ class ComponentFactory:
             dict: Media configuration for component rendering
 
         Features:
-            - Automatic media type detection from file extension
+            - Media type from the registry (``MediaItem.media_type``, as in
+              the carousel: transcoded GIFs are videos), guessed from the
+              name if unknown
             - Consistent responsive styling across media types
             - Accessibility support with alt text
         """
         if media_type is None:
-            media_type = "video" if src.endswith(".mp4") else "image"
+            media_type = media_registry().resolve(src).media_type
 
         return {
             "type": media_type,
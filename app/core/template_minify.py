@@ -0,0 +1,118 @@
+"""
+Template Minification Module
+============================
+
+Jinja extension that strips insignificant whitespace and HTML comments from
+``.html`` template sources when they are compiled. The compiled templates
+(and every response rendered from them) are smaller, and rendering does no
+extra work: the source is rewritten once, before Jinja parses it.
+
+Features:
+- Indentation and runs of spaces collapse; line breaks are kept so template
+  line numbers in tracebacks stay correct
+- HTML comments are dropped (conditional comments and comments holding
+  Jinja tags are kept)
+- ``<pre>``, ``<textarea>``, ``<script>`` and ``<style>`` bodies and
+  ``{% raw %}`` blocks are left untouched
+- Lines holding only ``{% ... %}``/``{# ... #}`` tags render nothing: the
+  last tag on such a line gets ``-%}`` to eat the line break after it
+- Jinja expressions are never rewritten, including whitespace inside them
+
+Architecture:
+- Jinja tags are swapped for whitespace-free placeholders, the remaining
+  HTML is minified with a handful of regexes, then the tags are put back
+- Non-HTML templates (by file name) pass through unchanged
+- ``MINIFY_TEMPLATES = false`` keeps the sources as written
+"""
+
+import re
+
+from jinja2.ext import Extension
+
+HTML_SUFFIXES = (".html", ".htm")
+
+_JINJA = re.compile(
+    r"\{%-?\s*raw\s*-?%\}.*?\{%-?\s*endraw\s*-?%\}|\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\}",
+    re.DOTALL,
+)
+_PRESERVED = re.compile(
+    r"(<(pre|textarea|script|style)\b.*?</\2\s*>)", re.DOTALL | re.IGNORECASE
+)
+_COMMENT = re.compile(r"<!--(?!\[if).*?-->", re.DOTALL)
+_SPACE = re.compile(r"[ \t\r\f\v]*\n[ \t\r\n\f\v]*|[ \t\r\f\v]{2,}")
+_PLACEHOLDER = "\x00{}\x00"
+_PLACEHOLDER_RE = re.compile("\x00(\\d+)\x00")
+# Lines holding only placeholders; the last one's break is trimmed when
+# every tag on the line is a statement or comment
+_TAG_LINE = re.compile("(?:(?<=\n)|^)(?:\x00\\d+\x00)*\x00(\\d+)\x00(?=\n)")
+
+
+def _drop_comment(match):
+    comment = match.group(0)
+    if "\x00" in comment:
+        return comment  # holds a Jinja tag: keep its side effects
+    return "\n" * comment.count("\n")
+
+
+def _collapse(match):
+    lines = match.group(0).count("\n")
+    return "\n" * lines if lines else " "
+
+
+def _trim_after(tag):
+    if tag[:2] not in ("{%", "{#") or tag[-3] in "-+" or "endraw" in tag[-12:]:
+        return tag
+    return f"{tag[:-2]}-{tag[-2:]}"
+
+
+def minify_html(source):
+    """
+    Minify a Jinja HTML template source.
+
+    Args:
+        source (str): Template source
+
+    Returns:
+        str: Source with comments and insignificant whitespace removed; the
+            number of lines is unchanged
+    """
+    tags = []
+
+    def stash(match):
+        tags.append(match.group(0))
+        return _PLACEHOLDER.format(len(tags) - 1)
+
+    masked = _JINJA.sub(stash, source)
+    parts = _PRESERVED.split(masked)
+    # split() yields text, whole preserved element, tag name, text, ...
+    for index in range(0, len(parts), 3):
+        text = _SPACE.sub(_collapse, _COMMENT.sub(_drop_comment, parts[index]))
+        for match in _TAG_LINE.finditer(text):
+            ids = [int(i) for i in _PLACEHOLDER_RE.findall(match.group(0))]
+            if all(tags[i][:2] in ("{%", "{#") for i in ids):
+                tags[ids[-1]] = _trim_after(tags[ids[-1]])
+        parts[index] = text
+    minified = "".join(part for index, part in enumerate(parts) if index % 3 != 2)
+    return _PLACEHOLDER_RE.sub(lambda match: tags[int(match.group(1))], minified)
+
+
+class HtmlMinifyExtension(Extension):
+    """Minify ``.html`` template sources before Jinja compiles them."""
+
+    def preprocess(self, source, name, filename=None):
+        if name and name.lower().endswith(HTML_SUFFIXES):
+            return minify_html(source)
+        return source
+
+
+def init_template_minify(app):
+    """
+    Add the minifying extension to ``app.jinja_env``.
+
+    Must run before the first template is compiled.
+
+    Config:
+        MINIFY_TEMPLATES: Strip whitespace and comments (default: True)
+    """
+    if app.config.get("MINIFY_TEMPLATES", True):
+        app.jinja_env.add_extension(HtmlMinifyExtension)
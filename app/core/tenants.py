@@ -0,0 +1,451 @@
+"""
+Multi-Tenant Hosting Module
+===========================
+
+Serves many portfolios from one process, keyed by the request's Host
+header. Each tenant is a content directory with its own ContentStore; all
+derived per-tenant objects (view models, slide fragments, API payloads,
+preload headers) live in one render cache shared by every tenant.
+
+Features:
+- Host resolution replaces the hardcoded domain allow list: configured
+  hosts serve the default content, ``<tenants_dir>/<host>/`` serves a
+  tenant's own content, anything else is a 404
+- Lazy tenant loading on first request; at most ``max_tenants`` snapshots
+  stay loaded (least recently used tenants are unloaded)
+- Unknown hosts are remembered for ``NEGATIVE_TTL`` seconds (at most
+  ``MAX_NEGATIVE`` of them), so repeated requests for them never reach
+  the filesystem; a tenant whose content fails to load is remembered as
+  broken for as long, so it is not re-parsed on every request
+- Global byte budget for the render cache, LRU across tenants, so memory
+  stays flat as tenants are added
+- One watcher thread polls the loaded tenants for content changes and drops
+  a tenant's cached renders when its content is reloaded
+
+Architecture:
+- ``resolve_tenant`` is a ``before_request`` hook that stores the tenant
+  on ``flask.g``; ``current_tenant()`` / ``tenant_cache()`` read it back
+- Hosts that point at the same directory (e.g. via symlink) share a tenant
+- Tenants are loaded outside the registry lock, one load per directory;
+  concurrent requests for it wait on that load while other hosts are served
+- The default tenant (``CONTENT_DIR``) is never unloaded
+"""
+
+import logging
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from flask import abort, current_app, g, request
+
+from ..data.content_store import ContentError, ContentStore
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+# Hostnames only: lowercase labels, no path separators or dot segments
+HOST_RE = re.compile(r"[a-z0-9]([a-z0-9-]*[a-z0-9])?(\.[a-z0-9]([a-z0-9-]*[a-z0-9])?)*")
+
+DEFAULT_CACHE_BUDGET = 32 * 1024 * 1024
+DEFAULT_MAX_TENANTS = 64
+DEFAULT_TENANT = "default"
+NEGATIVE_TTL = 30.0  # Seconds an unknown host is remembered
+MAX_NEGATIVE = 4096  # Unknown hosts remembered (LRU)
+
+_MISSING = object()
+
+
+class _Load:
+    """An in-progress tenant load other requests can wait on."""
+
+    __slots__ = ("event", "tenant", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.tenant = None
+        self.error = None
+
+
+def estimate_size(value):
+    """Approximate the memory held by a cached value, in bytes."""
+    size = getattr(value, "size", None)
+    if isinstance(size, int):
+        return size
+    if isinstance(value, (str, bytes)):
+        return len(value) + 50
+    if isinstance(value, dict):
+        return 64 + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return 56 + sum(estimate_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class RenderCache:
+    """
+    Byte-bounded LRU shared by all tenants.
+
+    Keys are ``(tenant_key, namespace, key)``; entries of one tenant can be
+    dropped together when its content changes or it is unloaded.
+    """
+
+    def __init__(self, budget=DEFAULT_CACHE_BUDGET):
+        self.budget = budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._by_tenant = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        size = estimate_size(value)
+        with self._lock:
+            self._discard(key)
+            if size > self.budget:
+                return value
+            self._entries[key] = (value, size)
+            self._by_tenant.setdefault(key[0], set()).add(key)
+            self.size += size
+            while self.size > self.budget:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self.evictions += 1
+        return value
+
+    def drop_tenant(self, tenant_key):
+        """Remove every entry cached for ``tenant_key``."""
+        with self._lock:
+            for key in list(self._by_tenant.get(tenant_key, ())):
+                self._discard(key)
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+            keys = self._by_tenant[key[0]]
+            keys.discard(key)
+            if not keys:
+                del self._by_tenant[key[0]]
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class TenantCache:
+    """Dict-style view of one tenant's namespace in the RenderCache."""
+
+    __slots__ = ("_cache", "_prefix")
+
+    def __init__(self, cache, tenant_key, namespace):
+        self._cache = cache
+        self._prefix = (tenant_key, namespace)
+
+    def get(self, key, default=None):
+        return self._cache.get(self._prefix + (key,), default)
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._cache.set(self._prefix + (key,), value)
+
+    def __contains__(self, key):
+        return self.get(key, _MISSING) is not _MISSING
+
+
+class Tenant:
+    """
+    A content directory served for one or more hosts.
+
+    Attributes:
+        key (str): Resolved content directory, unique per tenant
+        name (str): Short public name (``default`` or the directory name),
+            used in CDN surrogate keys
+    """
+
+    __slots__ = ("key", "name", "store", "hosts", "_cache")
+
+    def __init__(self, store, cache, name=None):
+        self.key = str(store.path)
+        self.name = name or store.path.name
+        self.store = store
+        self.hosts = set()
+        self._cache = cache
+
+    def cache(self, namespace):
+        """Cache view for derived objects of ``namespace`` (e.g. view_models)."""
+        return TenantCache(self._cache, self.key, namespace)
+
+    def invalidate(self):
+        """Drop everything cached for this tenant."""
+        self._cache.drop_tenant(self.key)
+
+
+class TenantRegistry:
+    """
+    Maps hosts to lazily loaded tenants.
+
+    Args:
+        default_store (ContentStore): Content served for ``hosts``
+        hosts (iterable): Hostnames of the default tenant
+        tenants_dir (str): Directory of per-host content directories
+        max_tenants (int): Loaded tenants kept besides the default one
+        cache (RenderCache): Shared render cache
+        negative_ttl (float): Seconds an unknown host or a tenant that
+            failed to load is remembered
+    """
+
+    def __init__(
+        self,
+        default_store,
+        hosts=(),
+        tenants_dir=None,
+        max_tenants=DEFAULT_MAX_TENANTS,
+        cache=None,
+        negative_ttl=NEGATIVE_TTL,
+    ):
+        self.cache = cache or RenderCache()
+        self.default = self._attach(Tenant(default_store, self.cache, DEFAULT_TENANT))
+        self.tenants_dir = Path(tenants_dir) if tenants_dir else None
+        self.max_tenants = max_tenants
+        self._loaded = OrderedDict()
+        self._by_host = {host.lower(): self.default for host in hosts}
+        self.negative_ttl = negative_ttl
+        self._unknown = OrderedDict()  # host -> expiry (monotonic)
+        self._broken = {}  # tenant key -> (expiry (monotonic), error message)
+        self._loading = {}  # tenant key -> _Load
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._watcher = None
+
+    def _attach(self, tenant):
+        tenant.store.subscribe(lambda _snapshot: tenant.invalidate())
+        return tenant
+
+    def resolve(self, host):
+        """
+        Return the tenant serving ``host``, loading it on first use.
+
+        Returns:
+            Tenant or None: None when the host is not served
+
+        Raises:
+            ContentError: When the tenant's content does not load (the failure
+                is remembered for ``negative_ttl`` seconds)
+        """
+        tenant = self._by_host.get(host)
+        if tenant is self.default:
+            return tenant
+        if tenant is not None and tenant.key in self._loaded:
+            with self._lock:
+                if tenant.key in self._loaded:
+                    self._loaded.move_to_end(tenant.key)
+            return tenant
+
+        if self._is_unknown(host):
+            return None
+        path = self._tenant_path(host)
+        if path is None:
+            self._remember_unknown(host)
+            return None
+        key = str(path)
+        with self._lock:
+            tenant = self._loaded.get(key)
+            if tenant is None:
+                self._raise_if_broken(key)
+                load = self._loading.get(key)
+                leader = load is None
+                if leader:
+                    load = self._loading[key] = _Load()
+        if tenant is None:
+            tenant = self._load(key, path, load, host) if leader else self._wait(load)
+        with self._lock:
+            tenant.hosts.add(host)
+            self._by_host[host] = tenant
+        return tenant
+
+    def _load(self, key, path, load, host):
+        """Load the tenant at ``path`` outside the lock, then publish it."""
+        try:
+            load.tenant = self._attach(Tenant(ContentStore(path), self.cache))
+            logger.info("Loaded tenant %s for %s", key, host)
+            return load.tenant
+        except Exception as exc:
+            load.error = exc
+            logger.error("Failed to load tenant %s: %s", key, exc)
+            raise
+        finally:
+            with self._lock:
+                del self._loading[key]
+                if load.tenant is not None:
+                    self._loaded[key] = load.tenant
+                    while len(self._loaded) > self.max_tenants:
+                        self._unload(self._loaded.popitem(last=False)[1])
+                elif load.error is not None:
+                    expiry = time.monotonic() + self.negative_ttl
+                    self._broken[key] = (expiry, str(load.error))
+            load.event.set()
+
+    @staticmethod
+    def _wait(load):
+        load.event.wait()
+        if load.error is not None:
+            raise load.error
+        return load.tenant
+
+    def _raise_if_broken(self, key):
+        """Re-raise a remembered load failure (caller holds the lock)."""
+        entry = self._broken.get(key)
+        if entry is None:
+            return
+        if entry[0] > time.monotonic():
+            raise ContentError(entry[1])
+        del self._broken[key]
+
+    def _is_unknown(self, host):
+        expiry = self._unknown.get(host)
+        if expiry is None:
+            return False
+        if expiry > time.monotonic():
+            return True
+        with self._lock:
+            self._unknown.pop(host, None)
+        return False
+
+    def _remember_unknown(self, host):
+        if self.tenants_dir is None or not HOST_RE.fullmatch(host):
+            return  # Answered without the filesystem anyway
+        with self._lock:
+            self._unknown[host] = time.monotonic() + self.negative_ttl
+            self._unknown.move_to_end(host)
+            while len(self._unknown) > MAX_NEGATIVE:
+                self._unknown.popitem(last=False)
+
+    def _tenant_path(self, host):
+        if self.tenants_dir is None or not HOST_RE.fullmatch(host):
+            return None
+        path = self.tenants_dir / host
+        if not path.is_dir():
+            return None
+        return path.resolve()
+
+    def _unload(self, tenant):
+        for host in tenant.hosts:
+            if self._by_host.get(host) is tenant:
+                del self._by_host[host]
+        tenant.invalidate()
+        logger.info("Unloaded tenant %s", tenant.key)
+
+    @property
+    def loaded(self):
+        """Tenants currently loaded besides the default one."""
+        return list(self._loaded.values())
+
+    def poll(self):
+        """Reload every loaded tenant whose content files changed."""
+        for tenant in [self.default, *self.loaded]:
+            tenant.store.reload_if_changed()
+
+    def start_watching(self, interval):
+        """Poll for content changes every ``interval`` seconds in a daemon thread."""
+        if self._watcher is not None or interval <= 0:
+            return
+
+        def _watch():
+            while not self._stop.wait(interval):
+                self.poll()
+
+        self._watcher = threading.Thread(
+            target=_watch, name="content-watcher", daemon=True
+        )
+        self._watcher.start()
+
+    def stop_watching(self):
+        """Stop the watcher thread (used by tests and shutdown hooks)."""
+        self._stop.set()
+
+
+def request_host():
+    """Lowercased Host header without the port."""
+    return request.headers.get("Host", "").lower().split(":")[0]
+
+
+def resolve_tenant():
+    """
+    Before-request hook: bind the tenant for the Host header to ``g.tenant``.
+
+    Unknown hosts (including direct ``*.run.app`` access) get a 404 to hide
+    the existence of the service.
+    """
+    host = request_host()
+    with span("tenant.resolve", host=host):
+        tenant = current_app.extensions["tenants"].resolve(host)
+    if tenant is None:
+        abort(404)
+    g.tenant = tenant
+
+
+def current_tenant():
+    """Tenant of the current request, or the default tenant outside requests."""
+    tenant = g.get("tenant")
+    if tenant is None:
+        tenant = current_app.extensions["tenants"].default
+    return tenant
+
+
+def tenant_cache(namespace):
+    """Render cache view for ``namespace`` of the current tenant."""
+    return current_tenant().cache(namespace)
+
+
+def init_tenants(app, default_store):
+    """
+    Create the tenant registry and start polling for content changes.
+
+    Config:
+        TENANT_HOSTS: Hosts served with the default content
+        TENANTS_DIR: Directory of ``<host>/`` content directories
+        MAX_TENANTS: Tenants kept loaded besides the default one
+        RENDER_CACHE_BUDGET: Byte budget of the shared render cache
+        CONTENT_RELOAD_INTERVAL: Poll interval in seconds; 0 disables
+    """
+    registry = TenantRegistry(
+        default_store,
+        hosts=app.config.get("TENANT_HOSTS", ()),
+        tenants_dir=app.config.get("TENANTS_DIR") or None,
+        max_tenants=int(app.config.get("MAX_TENANTS", DEFAULT_MAX_TENANTS)),
+        cache=RenderCache(
+            int(app.config.get("RENDER_CACHE_BUDGET", DEFAULT_CACHE_BUDGET))
+        ),
+    )
+    app.extensions["tenants"] = registry
+    if not app.testing:
+        registry.start_watching(float(app.config.get("CONTENT_RELOAD_INTERVAL", 0)))
+    return registry
@@ -0,0 +1,340 @@
+"""
+Request Tracing Module
+======================
+
+Lightweight spans for the phases of a request, so a slow page can be
+attributed to the host check, a data factory, the context processors or
+the Jinja render.
+
+Features:
+- ``span(name, **attributes)`` context manager and ``traced(name)``
+  decorator; both are a shared no-op object when the request is not sampled
+- W3C Trace Context: a sampled request joins the trace of an incoming
+  ``traceparent``; its sampled flag is only followed when
+  ``TRACING_TRUST_PARENT`` says every caller is a trusted proxy, so
+  clients cannot force traces. Sampled responses that no shared cache may
+  store (``no-store`` or ``private``) carry ``traceresponse``, and ``current_traceparent()`` gives the
+  header for outgoing calls
+- Head-based sampling: the decision is made once per request from
+  ``Config.tracing_sample_rate`` (``TRACING_SAMPLE_RATE`` env override)
+- OTLP/JSON export, one ``resourceSpans`` document per line, written by a
+  background thread; the OpenTelemetry Collector's ``otlpjsonfile`` receiver
+  can ship the file on
+
+Spans:
+- ``<METHOD> <route>``: the whole request (server span)
+- ``tenant.resolve``: Host header check and tenant lookup
+- ``view_model.build``: data factories behind a page (cache misses only)
+- ``context_processor.*``: navbar and footer context
+- ``render``: Jinja render of a page template (page cache misses only)
+"""
+
+import json
+import os
+import random
+import re
+import sys
+import time
+from functools import wraps
+
+from flask import g, has_app_context, request
+
+from .access_log import AccessLogWriter
+
+TRACEPARENT_RE = re.compile(r"00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})")
+SERVICE_NAME = "portfolio-app"
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class _NoopSpan:
+    """Stand-in returned when the request is not traced."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def set_attribute(self, key, value):
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class Span:
+    """One timed operation; a context manager that ends the span on exit."""
+
+    __slots__ = (
+        "trace",
+        "span_id",
+        "parent_id",
+        "name",
+        "kind",
+        "start",
+        "end",
+        "attributes",
+        "error",
+    )
+
+    def __init__(self, trace, name, parent_id, kind, attributes):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start = time.time_ns()
+        self.end = None
+        self.attributes = attributes
+        self.error = False
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.error = True
+        self.trace.finish(self)
+        return False
+
+    def to_otlp(self):
+        return {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_id or "",
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start),
+            "endTimeUnixNano": str(self.end or self.start),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+            ],
+            "status": {"code": STATUS_ERROR if self.error else STATUS_OK},
+        }
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class Trace:
+    """Spans of one sampled request; children nest under the open span."""
+
+    __slots__ = ("trace_id", "root", "spans", "_stack")
+
+    def __init__(self, trace_id, parent_id=None):
+        self.trace_id = trace_id
+        self.spans = []
+        self._stack = []
+        self.root = self.start("request", SPAN_KIND_SERVER, {}, parent_id)
+
+    def start(self, name, kind=SPAN_KIND_INTERNAL, attributes=None, parent_id=None):
+        if self._stack:
+            parent_id = self._stack[-1].span_id
+        span_ = Span(self, name, parent_id, kind, attributes or {})
+        self._stack.append(span_)
+        return span_
+
+    def finish(self, span_):
+        span_.end = time.time_ns()
+        if self._stack and self._stack[-1] is span_:
+            self._stack.pop()
+        elif span_ in self._stack:
+            self._stack.remove(span_)
+        self.spans.append(span_)
+
+    @property
+    def traceparent(self):
+        return f"00-{self.trace_id}-{self.root.span_id}-01"
+
+
+def _active_trace():
+    return g.get("trace") if has_app_context() else None
+
+
+def span(name, **attributes):
+    """
+    Start a child span of the current request's open span.
+
+    Example:
+        with span("view_model.build", view_model="techstack"):
+            ...
+    """
+    trace = _active_trace()
+    if trace is None:
+        return NOOP_SPAN
+    return trace.start(name, attributes=attributes)
+
+
+def traced(name):
+    """Decorator running the wrapped function inside ``span(name)``."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def current_traceparent():
+    """``traceparent`` header for outgoing calls, or None when not traced."""
+    trace = _active_trace()
+    return trace.traceparent if trace is not None else None
+
+
+class Tracer:
+    """
+    Head sampling and export of request traces.
+
+    Args:
+        writer (AccessLogWriter): Line writer for OTLP/JSON documents
+        sample_rate (float): Fraction of requests traced (0..1)
+        service_name (str): ``service.name`` resource attribute
+        trust_parent (bool): Follow the sampled flag of incoming
+            ``traceparent`` headers instead of ``sample_rate``
+    """
+
+    def __init__(
+        self, writer, sample_rate, service_name=SERVICE_NAME, trust_parent=False
+    ):
+        self.writer = writer
+        self.sample_rate = sample_rate
+        self.trust_parent = trust_parent
+        self._resource = {
+            "attributes": [
+                {"key": "service.name", "value": {"stringValue": service_name}}
+            ]
+        }
+
+    def begin(self):
+        """Before-request hook: decide sampling and open the server span."""
+        match = TRACEPARENT_RE.fullmatch(request.headers.get("traceparent", ""))
+        if match and match.group(1) == "0" * 32:
+            match = None
+        if match and self.trust_parent:
+            trace_id, parent_id, flags = match.groups()
+            if not int(flags, 16) & 1:
+                return
+        elif random.random() < self.sample_rate:
+            trace_id, parent_id = (
+                match.group(1, 2) if match else (os.urandom(16).hex(), None)
+            )
+        else:
+            return
+        trace = g.trace = Trace(trace_id, parent_id)
+        rule = request.url_rule.rule if request.url_rule else request.path
+        trace.root.name = f"{request.method} {rule}"
+        trace.root.attributes.update(
+            {
+                "http.request.method": request.method,
+                "http.route": rule,
+                "url.path": request.path,
+                "server.address": request.host.split(":")[0],
+            }
+        )
+
+    def annotate(self, response):
+        """
+        After-request hook: record the status and return ``traceresponse``.
+
+        Responses a CDN may store get no ``traceresponse``, since the cached
+        copy would hand one request's trace id to every later visitor.
+        """
+        trace = _active_trace()
+        if trace is not None:
+            trace.root.attributes["http.response.status_code"] = response.status_code
+            trace.root.error = response.status_code >= 500
+            if not _shared_cacheable(response):
+                response.headers["traceresponse"] = trace.traceparent
+        return response
+
+    def end(self, exc=None):
+        """Teardown hook: close the server span and queue the trace for export."""
+        trace = _active_trace()
+        if trace is None:
+            return
+        g.pop("trace", None)
+        if exc is not None:
+            trace.root.error = True
+        trace.finish(trace.root)
+        self.writer.submit(self.export(trace))
+
+    def export(self, trace):
+        """OTLP/JSON ``ExportTraceServiceRequest`` line for ``trace``."""
+        return json.dumps(
+            {
+                "resourceSpans": [
+                    {
+                        "resource": self._resource,
+                        "scopeSpans": [
+                            {
+                                "scope": {"name": __name__},
+                                "spans": [span_.to_otlp() for span_ in trace.spans],
+                            }
+                        ],
+                    }
+                ]
+            },
+            separators=(",", ":"),
+        )
+
+
+def _shared_cacheable(response):
+    """
+    True unless ``response`` forbids shared caches from storing it.
+
+    ``no-cache`` responses may still be stored (and revalidated), and CDNs
+    cache some statuses, such as 404, heuristically without any header.
+    """
+    cache_control = response.cache_control
+    return not (cache_control.no_store or cache_control.private)
+
+
+def init_tracing(app):
+    """
+    Trace sampled requests when ``TRACING_EXPORT_PATH`` is set.
+
+    Config:
+        TRACING_EXPORT_PATH: OTLP/JSON lines file; ``-`` for stdout, empty
+            disables tracing
+        TRACING_SAMPLE_RATE: Fraction of requests traced (``Config``)
+        TRACING_TRUST_PARENT: Follow the sampled flag of incoming
+            ``traceparent`` headers; only when every request comes through
+            a proxy that sets or strips them
+    """
+    path = app.config.get("TRACING_EXPORT_PATH")
+    if not path:
+        return None
+    stream = sys.stdout if path == "-" else open(path, "a", encoding="utf-8")
+    tracer = Tracer(
+        AccessLogWriter(stream, name="trace-export"),
+        float(app.config.get("TRACING_SAMPLE_RATE", 0.0)),
+        service_name=app.config.get("APP_NAME", SERVICE_NAME),
+        trust_parent=bool(app.config.get("TRACING_TRUST_PARENT", False)),
+    )
+    app.before_request_funcs.setdefault(None, []).insert(0, tracer.begin)
+    # After-request hooks run in reverse: first in the list sees the final headers
+    app.after_request_funcs.setdefault(None, []).insert(0, tracer.annotate)
+    app.teardown_request(tracer.end)
+    app.extensions["tracing"] = tracer
+    return tracer
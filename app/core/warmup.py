@@ -0,0 +1,213 @@
+"""
+Startup Cache Warmer Module
+===========================
+
+Renders every page once per tenant before the worker accepts traffic, so
+the first visitor to each page on a fresh instance gets a cached response.
+
+Features:
+- Pages: every argument-free GET route of the ``routes`` blueprint whose
+  cache policy allows caching (``/health`` is skipped), for each distinct
+  tenant behind ``TENANT_HOSTS``; fills view models, rendered pages and
+  preload headers
+- API: the ``/api/v1/`` index and every collection and card payload it
+  links to; fills the payloads with their ETags and gzip/br variants
+- Logs each URL's status and reports the request count and total warm
+  time; the result drives the ``caches`` readiness check. A URL that
+  answers 5xx keeps the instance unready while a background thread retries
+  it every ``WARMUP_RETRY_INTERVAL`` seconds, so a transient failure does
+  not leave the worker unready for good
+
+Architecture:
+- Requests go straight to ``Flask.wsgi_app`` through a werkzeug test
+  client, skipping the rate limiter, access log and probe middleware
+- Runs synchronously at the end of ``create_app``: gunicorn workers only
+  accept connections after it returns, and ``/readyz`` stays 503 until the
+  caches are warm (retries run in a daemon thread after it returns)
+- Skipped when a ``flask`` CLI command loads the app (build steps in the
+  Dockerfile, purges), detected by the active click context
+"""
+
+import logging
+import threading
+import time
+
+import click
+from werkzeug.test import Client
+
+from .cache_policy import route_policies
+
+logger = logging.getLogger(__name__)
+
+WARM_BLUEPRINT = "routes"
+API_INDEX = "/api/v1/"
+RETRY_INTERVAL = 10.0  # Seconds between retries of failed URLs
+
+
+def page_urls(app):
+    """Argument-free, cacheable GET pages of the ``routes`` blueprint."""
+    policies = route_policies(app)
+    urls = []
+    for rule in app.url_map.iter_rules():
+        if (
+            rule.endpoint.partition(".")[0] != WARM_BLUEPRINT
+            or rule.arguments
+            or "GET" not in rule.methods
+        ):
+            continue
+        policy = policies.get(rule.endpoint)
+        if policy is not None and policy.no_store:
+            continue
+        urls.append(rule.rule)
+    return urls
+
+
+def tenant_hosts(app):
+    """One configured host per distinct tenant (aliases share caches)."""
+    registry = app.extensions["tenants"]
+    hosts = {}
+    for host in app.config.get("TENANT_HOSTS", ()):
+        tenant = registry.resolve(host.lower())
+        if tenant is not None:
+            hosts.setdefault(tenant.key, host.lower())
+    return list(hosts.values()) or ["localhost"]
+
+
+def warm_caches(app, targets=None):
+    """
+    Request every page and API payload once per tenant.
+
+    Args:
+        targets (list, optional): ``(host, url)`` pairs to request instead,
+            e.g. the ``failed`` pairs of an earlier run
+
+    Returns:
+        dict: ``seconds``, ``hosts``, ``requests``, ``failures`` (list of
+            "host url status" strings) and ``failed`` (``(host, url)`` pairs)
+    """
+    client = Client(lambda environ, start: type(app).wsgi_app(app, environ, start))
+    started = time.perf_counter()
+    hosts = tenant_hosts(app) if targets is None else sorted({h for h, _ in targets})
+    requests, failures, failed = 0, [], []
+
+    def fetch(host, url):
+        nonlocal requests
+        requests += 1
+        try:
+            response = client.get(
+                url,
+                headers={"Host": host, "Accept-Encoding": "br, gzip"},
+                buffered=True,  # consume streamed pages so they get cached
+            )
+        except Exception as exc:  # propagated when DEBUG/TESTING is on
+            failures.append(f"{host} {url} 500 ({exc})")
+            failed.append((host, url))
+            logger.exception("Warming %s%s failed", host, url)
+            return None
+        if response.status_code >= 500:
+            failures.append(f"{host} {url} {response.status_code}")
+            failed.append((host, url))
+        logger.debug("Warmed %s%s: %s", host, url, response.status_code)
+        return response
+
+    if targets is not None:
+        for host, url in targets:
+            fetch(host, url)
+    else:
+        for host in hosts:
+            for url in page_urls(app):
+                fetch(host, url)
+            index = fetch(host, API_INDEX)
+            if index is not None and index.status_code == 200:
+                links = index.get_json(force=True)
+                for group in ("collections", "cards"):
+                    for url in links.get(group, {}).values():
+                        fetch(host, url)
+
+    report = {
+        "seconds": round(time.perf_counter() - started, 3),
+        "hosts": hosts,
+        "requests": requests,
+        "failures": failures,
+        "failed": failed,
+    }
+    logger.info(
+        "Warmed %d URLs for %d tenant(s) in %.3fs",
+        requests,
+        len(hosts),
+        report["seconds"],
+    )
+    return report
+
+
+def warmup_enabled(app):
+    """
+    Whether ``init_warmup`` warms this app.
+
+    Off under TESTING, when ``WARMUP_ON_START`` is false, and when the app
+    is loaded by a ``flask`` CLI command (``flask build ...``,
+    ``flask cache ...``), which never serves the pages it would warm.
+    """
+    return (
+        not app.testing
+        and app.config.get("WARMUP_ON_START", True)
+        and click.get_current_context(silent=True) is None
+    )
+
+
+def retry_failures(app, report, interval):
+    """
+    Re-request the failed URLs of ``report`` until they all succeed.
+
+    Runs in the calling thread; each attempt updates the ``caches``
+    readiness check, which turns ready once nothing fails any more.
+
+    Returns:
+        int: Attempts made
+    """
+    readiness = app.extensions["readiness"]
+    attempts = 0
+    while report["failed"]:
+        time.sleep(interval)
+        attempts += 1
+        report = warm_caches(app, report["failed"])
+        if report["failures"]:
+            readiness.report("caches", False, "; ".join(report["failures"]))
+        else:
+            readiness.report("caches", True, f"failed URLs warmed on retry {attempts}")
+    return attempts
+
+
+def init_warmup(app):
+    """
+    Warm the caches and report the ``caches`` readiness check.
+
+    Skipped unless ``warmup_enabled``. Failed URLs are retried by a daemon
+    thread (``retry_failures``).
+
+    Config:
+        WARMUP_RETRY_INTERVAL: Seconds between retries of failed URLs;
+            0 disables retries (the instance stays unready)
+    """
+    if not warmup_enabled(app):
+        return None
+    readiness = app.extensions["readiness"]
+    readiness.report("caches", False, "warming")
+    report = app.extensions["warmup"] = warm_caches(app)
+    if report["failures"]:
+        readiness.report("caches", False, "; ".join(report["failures"]))
+        interval = float(app.config.get("WARMUP_RETRY_INTERVAL", RETRY_INTERVAL))
+        if interval > 0:
+            threading.Thread(
+                target=retry_failures,
+                args=(app, report, interval),
+                name="warmup-retry",
+                daemon=True,
+            ).start()
+    else:
+        readiness.report(
+            "caches",
+            True,
+            f"{report['requests']} URLs warmed in {report['seconds']}s",
+        )
+    return report
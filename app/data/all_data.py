@@ -1,15 +1,9 @@
 """Portfolio data provider with shared utilities"""
 
-from flask import url_for
-from .constants import (
-    INSTITUTIONS,
-    EDUCATION_PROGRAMS,
-    CERTIFICATIONS,
-    TECHNOLOGIES,
-    SOCIAL_LINKS,
-    BADGE_TEXT,
-    CONTACT_CONFIG,
-)
+from app.core.images import sized_src, srcset
+from app.core.media import media_registry
+from .constants import BADGE_TEXT, UI_CONFIG
+from .content_store import current_content
 
 
 # Shared data utilities
@@ -17,21 +11,27 @@ def _create_logo_data(filename, alt_text, name=None, path="images/logos"):
     """Create logo data structure"""
     return {
         "name": name or alt_text,
-        "src": url_for("static", filename=f"{path}/{filename}"),
+        "src": media_registry().resolve(f"{path}/{filename}").url,
         "alt": alt_text,
     }
 
 
+def _social_url(content, key):
+    social = content.social_links.get(key)
+    return social.url if social else "#"
+
+
 def get_shared_data():
-    """Get common data used across templates"""
+    """Get common data used across templates, from the tenant's content"""
+    content = current_content()
     return {
         "education_institutions": {
-            key: _create_logo_data(inst["logo"], inst["alt"], inst["name"])
-            for key, inst in INSTITUTIONS.items()
+            key: _create_logo_data(inst.logo, inst.alt, inst.name)
+            for key, inst in content.institutions.items()
         },
         "tech_logos": {
-            key: _create_logo_data(tech["logo"], tech["alt"], tech["name"])
-            for key, tech in TECHNOLOGIES.items()
+            key: _create_logo_data(tech.logo, tech.alt, tech.name)
+            for key, tech in content.technologies.items()
         },
         "common_styles": {
             "card_default": "card rounded-4 bg-dark text-white h-100 hover-shadow",
@@ -41,120 +41,109 @@ def get_shared_data():
             "tech_card": "tech-card h-100",
         },
         "external_links": {
-            "linkedin_profile": "https://www.linkedin.com/in/alan-smith-ca/",
-            "github_profile": "https://github.com/SmithAndGiggles",
+            "linkedin_profile": _social_url(content, "linkedin"),
+            "github_profile": _social_url(content, "github"),
             "credly_base": "https://www.credly.com/badges/",
-            "mayo_clinic_picc": "https://www.mayoclinic.org/tests-procedures/picc-line/about/pac-20468748",
-            "portfolio_email": f'mailto:{CONTACT_CONFIG["email"]}',
-        },
-        "meta_data": {
-            "site_title": "Alan Smith - Portfolio",
-            "site_description": "Professional portfolio showcasing cloud engineering, full-stack development, and technical achievements.",
-            "author": "Alan Smith",
-            "keywords": "cloud engineer, full-stack developer, GCP, Python, Flask, DevOps",
+            "mayo_clinic_picc": content.external_urls.get("mayo_clinic_picc", "#"),
+            "portfolio_email": f'mailto:{content.contact["email"]}',
         },
+        "meta_data": dict(content.meta),
     }
 
 
 def get_education_cards():
     """Generate education cards"""
 
-    def _create_card(program_data):
-        institution = INSTITUTIONS[program_data["institution"]]
+    content = current_content()
+
+    def _create_card(program):
+        institution = content.institutions[program.institution]
+        logo = media_registry().resolve(f"images/logos/{institution.logo}")
         return {
-            "href": institution["url"],
-            "logo_src": url_for(
-                "static", filename=f'images/logos/{institution["logo"]}'
-            ),
-            "logo_alt": institution["alt"],
-            "title": program_data["program"],
-            "subtitle": f"{institution['name']} • {program_data['years']}",
+            "href": institution.url,
+            "logo_src": logo.url,
+            "logo_meta": logo.meta,
+            "logo_alt": institution.alt,
+            "title": program.program,
+            "subtitle": f"{institution.name} • {program.years}",
             "badge_text": BADGE_TEXT["learn_more"],
         }
 
-    return [_create_card(program) for program in EDUCATION_PROGRAMS]
+    return [_create_card(program) for program in content.education_programs]
 
 
 def get_certification_cards():
     """Generate certification cards"""
 
-    def _create_card(cert_data):
+    def _create_card(cert):
+        logo = media_registry().resolve(f"images/logos/{cert.logo}")
         return {
-            "href": cert_data["url"],
-            "logo_src": url_for("static", filename=f'images/logos/{cert_data["logo"]}'),
-            "logo_alt": cert_data["alt"],
-            "title": cert_data["title"],
-            "subtitle": cert_data["subtitle"],
+            "href": cert.url,
+            "logo_src": logo.url,
+            "logo_meta": logo.meta,
+            "logo_alt": cert.alt,
+            "title": cert.title,
+            "subtitle": cert.subtitle,
             "badge_text": BADGE_TEXT["view_badge_icon"],
         }
 
-    return [_create_card(cert) for cert in CERTIFICATIONS.values()]
+    return [_create_card(cert) for cert in current_content().certifications.values()]
 
 
 def get_techstack_cards():
     """Generate tech stack cards by category"""
 
-    def _create_card(tech_data, logo_path="images/logos"):
+    def _create_card(tech, logo_path="images/logos"):
+        logo = media_registry().resolve(f"{logo_path}/{tech.logo}")
         return {
-            "href": tech_data["url"],
-            "logo_src": url_for("static", filename=f'{logo_path}/{tech_data["logo"]}'),
-            "logo_alt": tech_data["alt"],
-            "title": tech_data["name"],
-            "subtitle": tech_data["description"],
+            "href": tech.url,
+            "logo_src": logo.url,
+            "logo_meta": logo.meta,
+            "logo_alt": tech.alt,
+            "title": tech.name,
+            "subtitle": tech.description,
             "badge_text": BADGE_TEXT["learn_more"],
         }
 
-    frontend = [
-        _create_card(tech)
-        for tech in TECHNOLOGIES.values()
-        if tech["category"] == "frontend"
-    ]
-    backend = [
-        _create_card(tech)
-        for tech in TECHNOLOGIES.values()
-        if tech["category"] == "backend"
-    ]
-    infra = [
-        _create_card(tech)
-        for tech in TECHNOLOGIES.values()
-        if tech["category"] == "infra"
-    ]
-
-    return {"frontend": frontend, "backend": backend, "infra": infra}
+    return {
+        category: [_create_card(tech) for tech in techs]
+        for category, techs in current_content().technologies_by_category.items()
+    }
 
 
 def get_connect_cards():
     """Generate social connection cards"""
 
-    def _create_card(social_data):
+    def _create_card(social):
         badge_map = {"linkedin": "View Profile", "github": "View GitHub"}
         badge_text = next(
-            (text for key, text in badge_map.items() if key in social_data["url"]),
+            (text for key, text in badge_map.items() if key in social.url),
             "Send Email",
         )
+        logo = media_registry().resolve(f"images/logos/{social.logo}")
         return {
-            "href": social_data["url"],
-            "logo_src": url_for(
-                "static", filename=f'images/logos/{social_data["logo"]}'
-            ),
-            "logo_alt": social_data["alt"],
-            "title": social_data["name"],
-            "subtitle": social_data["description"],
+            "href": social.url,
+            "logo_src": logo.url,
+            "logo_meta": logo.meta,
+            "logo_alt": social.alt,
+            "title": social.name,
+            "subtitle": social.description,
             "badge_text": badge_text,
         }
 
-    return [_create_card(social) for social in SOCIAL_LINKS.values()]
+    return [_create_card(social) for social in current_content().social_links.values()]
 
 
 def get_home_card():
     """Generate homepage welcome card"""
+    home = current_content().home_card
+    image = media_registry().resolve(home.image_src)
     return {
-        "image_src": "images/content/cartoonized-alan-smith.png",
-        "image_alt": "Cartoonized Alan Smith",
-        "card_title": "Welcome to My Portfolio",
-        "card_text": (
-            "Hi, I'm Alan Smith, a technology enthusiast, lifelong learner, and passionate problem solver. "
-            "This website showcases my journey and achievements, giving you a glimpse into my professional world and personal growth. "
-            "<i class='fas fa-face-wink' style='color:#f7b731; font-size:1.3em; vertical-align:middle;'></i>"
-        ),
+        "image_src": sized_src(image),
+        "image_srcset": srcset(image),
+        "image_sizes": UI_CONFIG["home_card"]["image_sizes"],
+        "image_meta": image.meta,
+        "image_alt": home.image_alt,
+        "card_title": home.card_title,
+        "card_text": home.card_text,
     }
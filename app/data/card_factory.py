@@ -2,14 +2,13 @@
 
 from flask import url_for
 from app.utils.template_helpers import generate_card_data, generate_source_link
-from .constants import (
-    CERTIFICATIONS,
-    INSTITUTIONS,
-    EDUCATION_PROGRAMS,
-    TECHNOLOGIES,
-    SOCIAL_LINKS,
-    BADGE_TEXT,
-)
+from .constants import BADGE_TEXT
+from .content_store import current_content
+
+
+def _collection(name):
+    """Collection ``name`` of the current tenant's content, as plain dicts"""
+    return current_content().raw[name]
 
 
 def _create_card(href, logo_filename, logo_alt, title, subtitle="", badge_text=""):
@@ -25,7 +24,7 @@ def _create_card(href, logo_filename, logo_alt, title, subtitle="", badge_text="
 
 
 def _create_card_from_constants(config, badge_text=BADGE_TEXT["learn_more"]):
-    """Create cards from constants"""
+    """Create cards from the tenant's content"""
     return _create_card(
         config["url"],
         config["logo"],
@@ -36,7 +35,7 @@ def _create_card_from_constants(config, badge_text=BADGE_TEXT["learn_more"]):
 
 
 def get_certification_cards():
-    """Get certification cards from constants"""
+    """Get certification cards from the tenant's content"""
     return [
         _create_card(
             cert["url"],
@@ -46,15 +45,16 @@ def get_certification_cards():
             cert["subtitle"],
             BADGE_TEXT["view_badge_icon"],
         )
-        for cert in CERTIFICATIONS.values()
+        for cert in _collection("certifications").values()
     ]
 
 
 def get_education_cards():
-    """Get education cards from constants"""
+    """Get education cards from the tenant's content"""
     cards = []
-    for program in EDUCATION_PROGRAMS:
-        institution = INSTITUTIONS[program["institution"]]
+    institutions = _collection("institutions")
+    for program in _collection("education_programs"):
+        institution = institutions[program["institution"]]
         cards.append(
             _create_card(
                 institution["url"],
@@ -68,7 +68,7 @@ def get_education_cards():
 
 
 def get_connect_cards():
-    """Get social/contact cards from constants"""
+    """Get social/contact cards from the tenant's content"""
     return [
         _create_card(
             social["url"],
@@ -77,41 +77,40 @@ def get_connect_cards():
             social["name"],
             social["description"],
         )
-        for social in SOCIAL_LINKS.values()
+        for social in _collection("social_links").values()
     ]
 
 
 def get_frontend_tech_cards():
-    """Get frontend tech cards from constants"""
+    """Get frontend tech cards from the tenant's content"""
     return [
         _create_card_from_constants(tech)
-        for tech in TECHNOLOGIES.values()
+        for tech in _collection("technologies").values()
         if tech["category"] == "frontend"
     ]
 
 
 def get_backend_tech_cards():
-    """Get backend tech cards from constants"""
+    """Get backend tech cards from the tenant's content"""
     return [
         _create_card_from_constants(tech)
-        for tech in TECHNOLOGIES.values()
+        for tech in _collection("technologies").values()
         if tech["category"] == "backend"
     ]
 
 
 def get_infra_tech_cards():
-    """Get infrastructure tech cards from constants"""
+    """Get infrastructure tech cards from the tenant's content"""
     return [
         _create_card_from_constants(tech)
-        for tech in TECHNOLOGIES.values()
+        for tech in _collection("technologies").values()
         if tech["category"] == "infra"
     ]
 
 
 def get_common_sources():
-    """Get common source citations from constants"""
-    from .constants import EXTERNAL_URLS
-
+    """Get common source citations from the tenant's external URLs"""
+    external_urls = current_content().external_urls
     sources = {
         ("mayo_clinic_picc", "About PICC Lines (Mayo Clinic)"),
         ("cancer_society", "More on APL here"),
@@ -121,6 +120,6 @@ def get_common_sources():
     }
 
     return {
-        key: generate_source_link(EXTERNAL_URLS.get(key, "#"), text)
+        key: generate_source_link(external_urls.get(key, "#"), text)
         for key, text in sources
     }
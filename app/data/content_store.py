@@ -0,0 +1,535 @@
+"""
+Portfolio Content Store
+=======================
+
+Loads all portfolio content (institutions, technologies, certifications,
+education, social links, landing page, home card, carousel slides) from a
+directory of TOML/JSON/YAML files, validates it into typed records and
+builds lookup indexes. The resulting ``ContentSnapshot`` is immutable and is
+swapped atomically when the source files change, so content updates take
+effect without restarting workers.
+
+Features:
+- One file per collection; every top-level table of every file is merged
+  into a single document (``.toml``, ``.json``, ``.yaml``/``.yml``)
+- Typed, frozen records with required-field and cross-reference validation
+- mtime polling (stdlib only); the tenant registry polls every loaded
+  store from one background thread
+- Reload listeners so dependent caches (view models, API payloads, render
+  caches) are invalidated with the swap
+
+Architecture:
+- ``ContentSnapshot.raw`` keeps the validated source documents as plain
+  dicts for ``constants.py`` compatibility and the JSON API
+- A failed reload keeps serving the previous snapshot and logs the error
+- ``flask build content`` compiles the directory into ``snapshot.bin``;
+  workers decode it at startup instead of parsing TOML when its checksum
+  matches the current source files. The checksum is the snapshot version
+  (the ETag seed)
+"""
+
+import hashlib
+import json
+import logging
+import marshal
+import os
+import struct
+import threading
+import tomllib
+from dataclasses import MISSING, dataclass, field, fields
+from functools import lru_cache
+from pathlib import Path
+
+from flask import current_app, g
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONTENT_DIR = Path(__file__).resolve().parent.parent / "content"
+CONTENT_SUFFIXES = (".toml", ".json", ".yaml", ".yml")
+TECH_CATEGORIES = ("frontend", "backend", "infra")
+
+# Binary snapshot: fixed header, then the marshalled source document
+SNAPSHOT_NAME = "snapshot.bin"
+SNAPSHOT_MAGIC = b"PFCS"
+SNAPSHOT_FORMAT = 1
+# magic, format, sha256 of the source files, payload length
+SNAPSHOT_HEADER = struct.Struct("<4sH32sQ")
+
+
+class ContentError(ValueError):
+    """Raised when content files are missing fields or inconsistent."""
+
+
+# =============================================================================
+# TYPED RECORDS
+# =============================================================================
+
+
+@dataclass(frozen=True, slots=True)
+class Institution:
+    key: str
+    name: str
+    url: str
+    logo: str
+    alt: str
+
+
+@dataclass(frozen=True, slots=True)
+class Technology:
+    key: str
+    name: str
+    url: str
+    logo: str
+    alt: str
+    category: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class Certification:
+    key: str
+    title: str
+    subtitle: str
+    short_title: str
+    url: str
+    logo: str
+    alt: str
+
+
+@dataclass(frozen=True, slots=True)
+class EducationProgram:
+    institution: str
+    program: str
+    years: str
+
+
+@dataclass(frozen=True, slots=True)
+class SocialLink:
+    key: str
+    name: str
+    url: str
+    logo: str
+    alt: str
+    description: str
+
+
+@dataclass(frozen=True, slots=True)
+class LandingCard:
+    key: str
+    icon: str
+    title: str
+    description: str
+    button_text: str
+    button_class: str
+    url_key: str
+
+
+@dataclass(frozen=True, slots=True)
+class HomeCard:
+    image_src: str
+    image_alt: str
+    card_title: str
+    card_text: str
+
+
+@dataclass(frozen=True, slots=True)
+class Source:
+    href: str
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class Slide:
+    alt: str
+    title: str
+    text: str
+    media: str = ""  # Empty for a text-only slide
+    highlight: str | None = None
+    sources1: tuple = ()
+    sources2: tuple = ()
+
+
+@dataclass(frozen=True)
+class ContentSnapshot:
+    """
+    Immutable, validated view of the content directory.
+
+    Attributes:
+        version (str): Checksum of all source files; changes with any edit
+            and seeds deploy-level ETags
+        raw (dict): Validated source documents as plain dicts
+        technologies_by_category (dict): Category -> tuple of Technology
+        carousels (dict): Carousel name -> tuple of Slide
+        meta (dict): Optional site metadata (title, description, author,
+            keywords)
+    """
+
+    version: str
+    raw: dict
+    contact: dict
+    landing_page: dict
+    home_card: HomeCard
+    institutions: dict
+    technologies: dict
+    certifications: dict
+    education_programs: tuple
+    social_links: dict
+    external_urls: dict
+    landing_cards: dict
+    carousels: dict
+    meta: dict = field(default_factory=dict)
+    technologies_by_category: dict = field(default_factory=dict)
+
+
+# =============================================================================
+# LOADING & VALIDATION
+# =============================================================================
+
+
+def _parse_file(path):
+    """Parse one content file into a dict based on its suffix."""
+    if path.suffix == ".toml":
+        return tomllib.loads(path.read_text("utf-8"))
+    if path.suffix == ".json":
+        return json.loads(path.read_text("utf-8"))
+    try:
+        import yaml
+    except ImportError as exc:
+        raise ContentError(f"{path.name}: PyYAML is required for YAML content") from exc
+    return yaml.safe_load(path.read_text("utf-8")) or {}
+
+
+def content_files(path):
+    """Return the content files in ``path`` in deterministic order."""
+    return sorted(p for p in Path(path).iterdir() if p.suffix in CONTENT_SUFFIXES)
+
+
+def _record(cls, data, where, **extra):
+    """Build a record from ``data``, reporting missing/unknown fields."""
+    if not isinstance(data, dict):
+        raise ContentError(f"{where}: expected a table, got {type(data).__name__}")
+    names = {f.name for f in fields(cls)} - set(extra)
+    required = {
+        f.name for f in fields(cls) if f.name not in extra and f.default is MISSING
+    }
+    missing = required - set(data)
+    unknown = set(data) - names
+    if missing or unknown:
+        details = []
+        if missing:
+            details.append(f"missing {sorted(missing)}")
+        if unknown:
+            details.append(f"unknown {sorted(unknown)}")
+        raise ContentError(f"{where}: {', '.join(details)}")
+    return cls(**data, **extra)
+
+
+def _keyed(cls, table, name):
+    return {
+        key: _record(cls, value, f"{name}.{key}", key=key)
+        for key, value in table.items()
+    }
+
+
+def _sources(items, sources, where):
+    """Resolve source references (``"key"`` or inline ``{href, text}``)."""
+    resolved = []
+    for item in items or ():
+        if isinstance(item, str):
+            if item not in sources:
+                raise ContentError(f"{where}: unknown source '{item}'")
+            resolved.append(sources[item])
+        else:
+            resolved.append(_record(Source, item, where))
+    return tuple(resolved)
+
+
+def build_snapshot(raw, version):
+    """
+    Validate a merged content document into a ContentSnapshot.
+
+    Raises:
+        ContentError: On missing collections, fields or broken references
+    """
+    required = (
+        "contact",
+        "landing_page",
+        "landing_cards",
+        "home_card",
+        "institutions",
+        "technologies",
+        "certifications",
+        "education_programs",
+        "social_links",
+        "external_urls",
+        "sources",
+        "carousels",
+    )
+    missing = [name for name in required if name not in raw]
+    if missing:
+        raise ContentError(f"missing collections: {missing}")
+
+    institutions = _keyed(Institution, raw["institutions"], "institutions")
+    technologies = _keyed(Technology, raw["technologies"], "technologies")
+    programs = tuple(
+        _record(EducationProgram, item, f"education_programs[{i}]")
+        for i, item in enumerate(raw["education_programs"])
+    )
+    for i, program in enumerate(programs):
+        if program.institution not in institutions:
+            raise ContentError(
+                f"education_programs[{i}]: unknown institution '{program.institution}'"
+            )
+    for tech in technologies.values():
+        if tech.category not in TECH_CATEGORIES:
+            raise ContentError(
+                f"technologies.{tech.key}: category must be one of {TECH_CATEGORIES}"
+            )
+
+    landing_cards = _keyed(LandingCard, raw["landing_cards"], "landing_cards")
+    for card in landing_cards.values():
+        if card.url_key not in raw["landing_page"]:
+            raise ContentError(
+                f"landing_cards.{card.key}: unknown url_key '{card.url_key}'"
+            )
+
+    # Named sources point at external_urls entries via ``url_key``
+    sources = {}
+    for key, value in raw["sources"].items():
+        data = dict(value)
+        url_key = data.pop("url_key", None)
+        if url_key is not None:
+            if url_key not in raw["external_urls"]:
+                raise ContentError(f"sources.{key}: unknown url_key '{url_key}'")
+            data["href"] = raw["external_urls"][url_key]
+        sources[key] = _record(Source, data, f"sources.{key}")
+    carousels = {}
+    for name, slides in raw["carousels"].items():
+        built = []
+        for i, slide in enumerate(slides):
+            where = f"carousels.{name}[{i}]"
+            data = dict(slide)
+            data["sources1"] = _sources(data.get("sources1"), sources, where)
+            data["sources2"] = _sources(data.get("sources2"), sources, where)
+            built.append(_record(Slide, data, where))
+        carousels[name] = tuple(built)
+
+    return ContentSnapshot(
+        version=version,
+        raw=raw,
+        contact=raw["contact"],
+        landing_page=raw["landing_page"],
+        home_card=_record(HomeCard, raw["home_card"], "home_card"),
+        institutions=institutions,
+        technologies=technologies,
+        certifications=_keyed(Certification, raw["certifications"], "certifications"),
+        education_programs=programs,
+        social_links=_keyed(SocialLink, raw["social_links"], "social_links"),
+        external_urls=raw["external_urls"],
+        landing_cards=landing_cards,
+        carousels=carousels,
+        meta=raw.get("meta", {}),
+        technologies_by_category={
+            category: tuple(t for t in technologies.values() if t.category == category)
+            for category in TECH_CATEGORIES
+        },
+    )
+
+
+def _hash_source(digest, file, data):
+    """Feed one content file into the running source checksum."""
+    digest.update(file.name.encode("utf-8") + b"\0" + data)
+
+
+def _read_sources(path):
+    """Merge every content file in ``path``; returns ``(raw, sha256 digest)``."""
+    raw = {}
+    digest = hashlib.sha256()
+    for file in content_files(path):
+        _hash_source(digest, file, file.read_bytes())
+        document = _parse_file(file)
+        overlap = set(raw) & set(document)
+        if overlap:
+            raise ContentError(f"{file.name}: duplicate collections {sorted(overlap)}")
+        raw.update(document)
+    return raw, digest.digest()
+
+
+def source_digest(path):
+    """sha256 of the content files in ``path``, without parsing them."""
+    digest = hashlib.sha256()
+    for file in content_files(path):
+        _hash_source(digest, file, file.read_bytes())
+    return digest.digest()
+
+
+def load_snapshot(path):
+    """Read, merge and validate every content file in ``path``."""
+    raw, digest = _read_sources(path)
+    return build_snapshot(raw, digest.hex()[:16])
+
+
+def write_binary_snapshot(path, target=None):
+    """
+    Compile the content directory ``path`` into a binary snapshot.
+
+    The sources are validated first, so a snapshot is only ever written for
+    content that loads. The file is replaced atomically.
+
+    Returns:
+        tuple: (target path, ContentSnapshot)
+    """
+    raw, digest = _read_sources(path)
+    snapshot = build_snapshot(raw, digest.hex()[:16])
+    payload = marshal.dumps(raw)
+    target = Path(target or Path(path) / SNAPSHOT_NAME)
+    header = SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT, digest, len(payload))
+    tmp = target.with_suffix(".tmp")
+    tmp.write_bytes(header + payload)
+    os.replace(tmp, target)
+    return target, snapshot
+
+
+def load_binary_snapshot(target, digest=None):
+    """
+    Load a snapshot written by ``write_binary_snapshot``.
+
+    Decoding skips TOML/YAML parsing but is still linear in the content size,
+    and every worker holds its own copy; the records are validated again.
+
+    Args:
+        target (Path): Snapshot file
+        digest (bytes, optional): Checksum of the current source files
+            (``source_digest``); a snapshot built from other sources is
+            rejected
+
+    Raises:
+        ContentError: On a foreign, outdated, stale or truncated file
+    """
+    data = Path(target).read_bytes()
+    if len(data) < SNAPSHOT_HEADER.size:
+        raise ContentError(f"{target}: truncated snapshot header")
+    magic, fmt, built_from, length = SNAPSHOT_HEADER.unpack_from(data)
+    offset = SNAPSHOT_HEADER.size
+    if magic != SNAPSHOT_MAGIC or fmt != SNAPSHOT_FORMAT:
+        raise ContentError(f"{target}: not a format {SNAPSHOT_FORMAT} snapshot")
+    if digest is not None and built_from != digest:
+        raise ContentError(f"{target}: built from other source files")
+    if len(data) != offset + length:
+        raise ContentError(f"{target}: truncated snapshot payload")
+    raw = marshal.loads(memoryview(data)[offset:])
+    return build_snapshot(raw, built_from.hex()[:16])
+
+
+def load_content(path):
+    """
+    Load the content of ``path``, preferring a fresh binary snapshot.
+
+    Falls back to parsing the source files when the snapshot is missing,
+    was built from different source files or is unreadable.
+    """
+    path = Path(path)
+    target = path / SNAPSHOT_NAME
+    if target.exists():
+        try:
+            return load_binary_snapshot(target, source_digest(path))
+        except (ContentError, ValueError, EOFError, OSError) as exc:
+            logger.warning("Ignoring content snapshot %s: %s", target, exc)
+    return load_snapshot(path)
+
+
+@lru_cache(maxsize=1)
+def load_default_content():
+    """Snapshot of the bundled content directory, loaded once per process."""
+    return load_content(DEFAULT_CONTENT_DIR)
+
+
+# =============================================================================
+# STORE WITH HOT RELOAD
+# =============================================================================
+
+
+class ContentStore:
+    """
+    Holds the current ContentSnapshot for a content directory.
+
+    Readers use ``store.snapshot`` and always see a complete snapshot: a
+    reload builds the new snapshot first and then swaps a single reference.
+    """
+
+    def __init__(self, path, snapshot=None):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._listeners = []
+        self._signature = self._scan()
+        self._snapshot = snapshot or load_content(self.path)
+
+    @property
+    def snapshot(self):
+        """The current ContentSnapshot."""
+        return self._snapshot
+
+    def subscribe(self, callback):
+        """Call ``callback(snapshot)`` after every successful reload."""
+        self._listeners.append(callback)
+
+    def _scan(self):
+        """Cheap change signature: (name, mtime_ns, size) of every file."""
+        return tuple(
+            (p.name, p.stat().st_mtime_ns, p.stat().st_size)
+            for p in content_files(self.path)
+        )
+
+    def reload_if_changed(self):
+        """
+        Reload and swap the snapshot when any content file changed.
+
+        Returns:
+            bool: True when a new snapshot was installed
+        """
+        signature = self._scan()
+        if signature == self._signature:
+            return False
+        with self._lock:
+            if signature == self._signature:
+                return False
+            try:
+                snapshot = load_snapshot(self.path)
+            except (ContentError, OSError, ValueError) as exc:
+                logger.error("Content reload failed, keeping previous: %s", exc)
+                self._signature = signature
+                return False
+            self._signature = signature
+            if snapshot.version == self._snapshot.version:
+                return False
+            self._snapshot = snapshot
+        logger.info("Content reloaded: version %s", snapshot.version)
+        for callback in self._listeners:
+            callback(snapshot)
+        return True
+
+
+def current_content():
+    """
+    Return the ContentSnapshot for the current request.
+
+    Inside a request this is the snapshot of the tenant resolved from the
+    Host header; otherwise (CLI, startup) the application's default content.
+    """
+    tenant = g.get("tenant")
+    if tenant is not None:
+        return tenant.store.snapshot
+    return current_app.extensions["content"].snapshot
+
+
+def init_content(app):
+    """
+    Load the application's default content into a ContentStore.
+
+    Config:
+        CONTENT_DIR: Content directory (defaults to the bundled ``app/content``)
+    """
+    path = Path(app.config.get("CONTENT_DIR") or DEFAULT_CONTENT_DIR)
+    snapshot = load_default_content() if path == DEFAULT_CONTENT_DIR else None
+    store = app.extensions["content"] = ContentStore(path, snapshot)
+    return store
@@ -1,28 +1,30 @@
 # filepath: something-something-portfolio-app/app/data/landing_data.py
 
-from .constants import LANDING_PAGE_CONFIG, LANDING_CARDS
+from .content_store import current_content
 
 
 def get_landing_page_data():
-    """Generate landing page data from constants"""
+    """Generate landing page data from the content store"""
+    content = current_content()
+    page_config = content.landing_page
     cards = [
         {
-            "icon": config["icon"],
-            "title": config["title"],
-            "description": config["description"],
-            "button_text": config["button_text"],
-            "button_class": config["button_class"],
-            "url": LANDING_PAGE_CONFIG[config["url_key"]],
+            "icon": card.icon,
+            "title": card.title,
+            "description": card.description,
+            "button_text": card.button_text,
+            "button_class": card.button_class,
+            "url": page_config[card.url_key],
         }
-        for config in LANDING_CARDS.values()
+        for card in content.landing_cards.values()
     ]
 
     return {
-        "page_config": LANDING_PAGE_CONFIG,
+        "page_config": page_config,
         "cards": cards,
         "professional": {
-            "title": LANDING_PAGE_CONFIG["professional_title"],
-            "description": LANDING_PAGE_CONFIG["professional_description"],
-            "tech_badges": LANDING_PAGE_CONFIG["tech_badges"],
+            "title": page_config["professional_title"],
+            "description": page_config["professional_description"],
+            "tech_badges": page_config["tech_badges"],
         },
     }
@@ -0,0 +1,335 @@
+"""
+Site Search Module
+==================
+
+Full-text search over the content the pages show: education programs,
+certifications, technologies, social links and the carousel slide texts.
+
+Features:
+- Tokenization: lowercase, accent-folded words (``döt`` matches ``dot``);
+  common English stop words are not indexed
+- Inverted index: term -> postings of (document, score), scored once at
+  build time as field weight (title > subtitle > alt/slide text) times
+  inverse document frequency
+- Queries: every term must match. Submitted searches match whole words;
+  as-you-type callers (``prefix=True``) also match the last word as a
+  prefix while it is still being typed (no trailing space), against every
+  indexed term with that prefix (bisect over the sorted terms)
+- Autocomplete: a prefix trie whose nodes keep their most frequent
+  completions, so a lookup only walks the typed prefix
+- Bounded LRU cache of recent queries
+
+Architecture:
+- Built once per tenant from the cached page view models, so results link
+  to the page showing the item; kept in the tenant's ``search`` cache and
+  dropped with the view models on content reload
+- Read-only once built (tuples throughout) and shared by request threads;
+  only the result cache takes a lock
+"""
+
+import bisect
+import heapq
+import re
+import threading
+import unicodedata
+from collections import OrderedDict, defaultdict
+from math import log
+
+from flask import current_app, g, url_for
+
+from ..core.tenants import estimate_size, tenant_cache
+from ..core.tracing import span
+from .view_models import get_view_model
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+TAG_RE = re.compile(r"<[^>]+>")
+STOP_WORDS = frozenset(
+    "a an and are as at be by for from has in is it its of on or our the this to "
+    "was we were with".split()
+)
+
+# Document field -> weight of one occurrence
+FIELD_WEIGHTS = {"title": 3.0, "subtitle": 2.0, "alt": 1.0, "text": 1.0}
+
+SUGGESTIONS = 8  # Completions kept per trie node
+DEFAULT_LIMIT = 20
+DEFAULT_CACHE_SIZE = 256
+MAX_QUERY_LENGTH = 100
+SNIPPET_LENGTH = 160
+
+# Content collections the indexed view models are built from
+SEARCH_COLLECTIONS = (
+    "education_programs",
+    "institutions",
+    "certifications",
+    "technologies",
+    "social_links",
+    "carousels",
+)
+
+# (view model, page endpoint, section label, item lists)
+SOURCES = (
+    ("education", "routes.education", "Education", ("cards",)),
+    ("certifications", "routes.certifications", "Certifications", ("cards",)),
+    (
+        "techstack",
+        "routes.techstack",
+        "Tech Stack",
+        ("frontend_cards", "backend_cards", "infra_cards"),
+    ),
+    ("connect", "routes.connect", "Connect", ("cards",)),
+    ("achievements", "routes.achievements", "Achievements", ("slides",)),
+    ("irl", "routes.irl", "IRL", ("slides",)),
+)
+
+
+def words(text):
+    """Lowercase, accent-folded words of ``text`` (stop words included)."""
+    folded = unicodedata.normalize("NFKD", text).encode("ascii", "ignore")
+    return TOKEN_RE.findall(folded.decode("ascii").lower())
+
+
+def tokenize(text):
+    """Indexed terms of ``text``: its words without stop words."""
+    return [word for word in words(text) if word not in STOP_WORDS]
+
+
+def _snippet(text):
+    if len(text) <= SNIPPET_LENGTH:
+        return text
+    return text[:SNIPPET_LENGTH].rsplit(" ", 1)[0] + "…"
+
+
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children = {}
+        self.top = ()
+
+
+class PrefixTrie:
+    """
+    Terms by prefix, most frequent first.
+
+    Args:
+        frequencies (dict): Term -> document frequency
+        size (int): Completions kept per node
+    """
+
+    def __init__(self, frequencies, size=SUGGESTIONS):
+        self.root = _Node()
+        self.nodes = 1
+        # Inserting by rank fills every node's top list in order
+        for term in sorted(frequencies, key=lambda term: (-frequencies[term], term)):
+            node = self.root
+            for char in term:
+                child = node.children.get(char)
+                if child is None:
+                    child = node.children[char] = _Node()
+                    self.nodes += 1
+                node = child
+                if len(node.top) < size:
+                    node.top += (term,)
+
+    def complete(self, prefix):
+        """Most frequent terms starting with ``prefix`` (tuple)."""
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return ()
+        return node.top
+
+
+class SearchIndex:
+    """
+    Read-only inverted index with a bounded query cache.
+
+    Args:
+        documents (list): Dicts with ``title``, ``subtitle``, ``alt``,
+            ``text`` (indexed) and ``section``, ``url``, ``href`` (returned)
+        cache_size (int): Queries kept in the result cache
+    """
+
+    def __init__(self, documents, cache_size=DEFAULT_CACHE_SIZE):
+        weights = defaultdict(lambda: defaultdict(float))
+        for doc_id, document in enumerate(documents):
+            for field, weight in FIELD_WEIGHTS.items():
+                for term in tokenize(document.get(field) or ""):
+                    weights[term][doc_id] += weight
+
+        count = len(documents)
+        self.postings = {
+            term: tuple(
+                (doc_id, weight * log(1 + count / len(docs)))
+                for doc_id, weight in docs.items()
+            )
+            for term, docs in weights.items()
+        }
+        self.terms = tuple(sorted(self.postings))
+        self.trie = PrefixTrie({term: len(docs) for term, docs in weights.items()})
+        self.results = tuple(
+            {
+                "title": document["title"],
+                "snippet": document.get("subtitle")
+                or _snippet(document.get("text") or ""),
+                "section": document["section"],
+                "url": document["url"],
+                "href": document.get("href"),
+            }
+            for document in documents
+        )
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.size = (
+            estimate_size(self.results)
+            + sum(
+                64 + len(term) + 72 * len(docs) for term, docs in self.postings.items()
+            )
+            + 200 * self.trie.nodes
+            + 512 * cache_size
+        )
+
+    def search(self, query, limit=DEFAULT_LIMIT, prefix=False):
+        """
+        Documents matching every term of ``query``, best first.
+
+        Args:
+            query (str): Search text
+            limit (int): Maximum results
+            prefix (bool): Match the last word as a prefix unless the query
+                ends with a space (results updated while typing)
+
+        Returns:
+            tuple: Result dicts (``title``, ``snippet``, ``section``,
+            ``url``, ``href``); shared, do not modify
+        """
+        terms = tuple(words(query))
+        typing = prefix and not query[-1:].isspace()
+        key = (terms, typing, limit)
+        with self._lock:
+            results = self._cache.get(key)
+            if results is not None:
+                self._cache.move_to_end(key)
+                return results
+        results = self._search(terms, typing, limit) if terms else ()
+        with self._lock:
+            self._cache[key] = results
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return results
+
+    def _search(self, terms, typing, limit):
+        scores = self._scores(terms, typing)
+        best = heapq.nlargest(
+            limit, scores.items(), key=lambda item: (item[1], -item[0])
+        )
+        return tuple(self.results[doc] for doc, _ in best)
+
+    def _scores(self, terms, typing):
+        # Document -> summed score over the terms; empty unless all match
+        groups = [
+            dict(self.postings.get(term, ()))
+            for term in (terms[:-1] if typing else terms)
+            if term not in STOP_WORDS
+        ]
+        if typing:
+            groups.append(self._prefix_scores(terms[-1]))
+        if not groups:  # only stop words
+            return {}
+        groups.sort(key=len)
+        scores = groups[0]
+        for group in groups[1:]:
+            if not scores:
+                break
+            scores = {
+                doc: score + group[doc] for doc, score in scores.items() if doc in group
+            }
+        return scores
+
+    def prefix_terms(self, prefix):
+        """Every indexed term starting with ``prefix``, in sorted order."""
+        start = bisect.bisect_left(self.terms, prefix)
+        end = bisect.bisect_left(self.terms, prefix + "\x7f", start)
+        return self.terms[start:end]
+
+    def _prefix_scores(self, prefix):
+        # A document matching several completions counts its best one
+        scores = {}
+        for term in self.prefix_terms(prefix):
+            for doc, score in self.postings[term]:
+                if score > scores.get(doc, 0.0):
+                    scores[doc] = score
+        return scores
+
+    def suggest(self, query, limit=SUGGESTIONS):
+        """
+        Completions of the word being typed, as whole queries.
+
+        With earlier words, only completions found in documents matching
+        them are offered, taken from every term with the prefix rather than
+        the trie's top few.
+        """
+        terms = words(query)
+        if not terms or query[-1:].isspace():
+            return ()
+        head = terms[:-1]
+        if head:
+            docs = self._scores(head, False)
+            completions = sorted(
+                (
+                    term
+                    for term in self.prefix_terms(terms[-1])
+                    if any(doc in docs for doc, _ in self.postings[term])
+                ),
+                key=lambda term: (-len(self.postings[term]), term),
+            )
+            head = " ".join(head) + " "
+        else:
+            completions = self.trie.complete(terms[-1])
+            head = ""
+        return tuple(head + term for term in completions[:limit])
+
+
+def build_documents():
+    """Searchable documents from the current tenant's page view models."""
+    documents = []
+    for view_model, endpoint, section, lists in SOURCES:
+        model = get_view_model(view_model)
+        url = url_for(endpoint)
+        for name in lists:
+            for item in model[name]:
+                documents.append(
+                    {
+                        "title": item.get("title") or item.get("alt") or "",
+                        "subtitle": item.get("subtitle") or "",
+                        "alt": item.get("logo_alt") or item.get("alt") or "",
+                        "text": TAG_RE.sub(" ", item.get("text") or ""),
+                        "section": section,
+                        "url": url,
+                        "href": item.get("href"),
+                    }
+                )
+    return documents
+
+
+def get_search_index():
+    """
+    Return the current tenant's search index, building it on first use.
+
+    Config:
+        SEARCH_CACHE_SIZE: Queries kept in the result cache
+    """
+    cache = tenant_cache("search")
+    index = cache.get("index")
+    if index is None:
+        with span("search.build"):
+            index = cache["index"] = SearchIndex(
+                build_documents(),
+                int(current_app.config.get("SEARCH_CACHE_SIZE", DEFAULT_CACHE_SIZE)),
+            )
+        # Built from other pages' models; the response is not one of them
+        g.pop("view_model", None)
+    return index
@@ -0,0 +1,77 @@
+"""
+Route View Models
+=================
+
+Precomputes the template context for each portfolio page once per
+application instance instead of rebuilding card and slide lists on every
+request. Routes render from these cached models, and request-independent
+consumers (preload headers, APIs) read the same structures.
+
+Architecture:
+- Builders are plain callables keyed by view model name
+- Models are built lazily inside the first request that needs them, because
+  the data factories use ``url_for``
+- Models are cached per tenant in the shared render cache and dropped when
+  the tenant's content is reloaded or the cache evicts them
+"""
+
+from flask import g
+
+from ..core.tenants import tenant_cache
+from ..core.tracing import span
+
+from .all_data import (
+    get_certification_cards,
+    get_connect_cards,
+    get_education_cards,
+    get_home_card,
+    get_techstack_cards,
+)
+from .carousel_factory import get_achievement_slides, get_irl_slides
+from .landing_data import get_landing_page_data
+
+
+def _techstack_model():
+    cards = get_techstack_cards()
+    return {
+        "frontend_cards": cards["frontend"],
+        "backend_cards": cards["backend"],
+        "infra_cards": cards["infra"],
+    }
+
+
+VIEW_MODEL_BUILDERS = {
+    "home": lambda: {"home_card": get_home_card()},
+    "education": lambda: {"cards": get_education_cards()},
+    "certifications": lambda: {"cards": get_certification_cards()},
+    "techstack": _techstack_model,
+    "connect": lambda: {"cards": get_connect_cards()},
+    "achievements": lambda: {
+        "slides": get_achievement_slides(),
+        "carousel_id": "achievementsCarousel",
+    },
+    "irl": lambda: {"slides": get_irl_slides(), "carousel_id": "irlCarousel"},
+    "landing": get_landing_page_data,
+}
+
+# Carousel id -> view model that holds its slides
+CAROUSELS = {
+    "achievementsCarousel": "achievements",
+    "irlCarousel": "irl",
+}
+
+
+def get_view_model(name):
+    """
+    Return the current tenant's cached template context for ``name``.
+
+    Also records the name on ``flask.g`` so after-request hooks can find the
+    model that produced the response.
+    """
+    cache = tenant_cache("view_models")
+    model = cache.get(name)
+    if model is None:
+        with span("view_model.build", view_model=name):
+            model = cache[name] = VIEW_MODEL_BUILDERS[name]()
+    g.view_model = name
+    return model
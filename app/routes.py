@@ -9,65 +9,49 @@ following Flask best practices for maintainable web applications.
 Architecture:
 - Blueprint pattern for modular route organization
 - Data layer separation via dedicated data modules
+- Precomputed view models, built once per instance instead of per request
+- Rendered pages cached with stale-while-revalidate and single-flight misses
+- Link: rel=preload headers for page-critical assets (CDN 103 Early Hints)
+- Edge cache policies declared per route; surrogate keys name the content
+  collections each page renders
 - Template rendering with context-specific data injection
 - URL generation support for dynamic content (carousels, images)
-- Security: Domain filtering to block direct .run.app access
+- Multi-tenant: content resolved from the Host header; unknown hosts
+  (e.g. direct .run.app access) get a 404
 
 Route Structure:
 - Core portfolio pages: /, /education, /certifications, /techstack, /connect
 - Dynamic content: /achievements, /irl (with carousel support)
+- Site search: /search?q=... over every page's content
 - Special landing page: /me2u-place for custom domain routing
 """
 
-from flask import Blueprint, render_template, request, abort
-from .data.all_data import (
-    get_education_cards,
-    get_certification_cards,
-    get_techstack_cards,
-    get_connect_cards,
-    get_home_card,
-)
-from .data.carousel_factory import get_achievement_slides, get_irl_slides
-from .data.landing_data import get_landing_page_data
+import time
+
+from flask import Blueprint, current_app, jsonify, render_template, request
+from .core.render_cache import render_page
+from .core.cache_policy import CAROUSEL_COLLECTIONS, apply_cache_policy, cache_policy
+from .core.health import token_matches
+from .core.preload import add_preload_header
+from .core.tenants import resolve_tenant
+from .data.search import MAX_QUERY_LENGTH, SEARCH_COLLECTIONS, get_search_index
 
 # Blueprint registration for modular route organization
 # Enables clean separation of routing logic from application factory
 routes = Blueprint("routes", __name__)
 
+# Resolve the tenant (content) for the Host header; unknown hosts get a 404
+routes.before_request(resolve_tenant)
+
+# Announce page-critical assets (CSS, fonts, hero image) via Link: rel=preload
+routes.after_request(add_preload_header)
 
-@routes.before_request
-def check_allowed_domains():
-    """
-    Security middleware to block direct Cloud Run .run.app URL access.
-    
-    Only allows access from approved custom domains to prevent unauthorized
-    access via the default Cloud Run URL. This provides cost-effective
-    security without requiring expensive Load Balancer infrastructure.
-    
-    Allowed domains:
-    - portfolio.me2u.space (main portfolio site)
-    - me2u.space (redirect domain)
-    
-    Blocks:
-    - Any .run.app domains (direct Cloud Run access)
-    - Any other unauthorized domains
-    """
-    allowed_hosts = [
-        'portfolio.me2u.space',
-        'me2u.space',
-        'localhost',  # For local development
-        '127.0.0.1',  # For local development
-    ]
-    
-    host = request.headers.get('Host', '').lower().split(':')[0]  # Remove port if present
-    
-    # Block any requests that don't come from allowed domains
-    if host not in allowed_hosts:
-        # Return 404 to hide the existence of the service
-        abort(404)
+# Edge caching headers from each route's @cache_policy (CDN TTLs, surrogate keys)
+routes.after_request(apply_cache_policy)
 
 
 @routes.route("/")
+@cache_policy("home_card")
 def home():
     """
     Homepage route - Primary landing page for the portfolio
@@ -79,10 +63,11 @@ def home():
     Returns:
         Rendered home.html template with home_card context
     """
-    return render_template("pages/home.html", home_card=get_home_card())
+    return render_page("pages/home.html", "home")
 
 
 @routes.route("/home")
+@cache_policy("home_card")
 def render_index():
     """
     Alternative homepage route for explicit /home navigation
@@ -93,10 +78,11 @@ def render_index():
     Returns:
         Rendered home.html template with home_card context
     """
-    return render_template("pages/home.html", home_card=get_home_card())
+    return render_page("pages/home.html", "home")
 
 
 @routes.route("/education")
+@cache_policy("education_programs", "institutions")
 def education():
     """
     Education showcase route
@@ -107,10 +93,11 @@ def education():
     Returns:
         Rendered education.html template with education cards data
     """
-    return render_template("pages/education.html", cards=get_education_cards())
+    return render_page("pages/education.html", "education")
 
 
 @routes.route("/achievements")
+@cache_policy(*CAROUSEL_COLLECTIONS)
 def achievements():
     """
     Professional achievements carousel route
@@ -124,13 +111,11 @@ def achievements():
     Returns:
         Rendered achievements.html template with carousel slides and configuration
     """
-    slides = get_achievement_slides()
-    return render_template(
-        "pages/achievements.html", slides=slides, carousel_id="achievementsCarousel"
-    )
+    return render_page("pages/achievements.html", "achievements")
 
 
 @routes.route("/certifications")
+@cache_policy("certifications")
 def certifications():
     """
     Professional certifications showcase route
@@ -141,10 +126,11 @@ def certifications():
     Returns:
         Rendered certifications.html template with certification cards data
     """
-    return render_template("pages/certifications.html", cards=get_certification_cards())
+    return render_page("pages/certifications.html", "certifications")
 
 
 @routes.route("/techstack")
+@cache_policy("technologies")
 def techstack():
     """
     Technology stack demonstration route
@@ -158,16 +144,11 @@ def techstack():
         - backend_cards: Server-side technologies and databases
         - infra_cards: DevOps, cloud, and infrastructure tools
     """
-    cards = get_techstack_cards()
-    return render_template(
-        "pages/techstack.html",
-        frontend_cards=cards["frontend"],
-        backend_cards=cards["backend"],
-        infra_cards=cards["infra"],
-    )
+    return render_page("pages/techstack.html", "techstack")
 
 
 @routes.route("/irl")
+@cache_policy(*CAROUSEL_COLLECTIONS)
 def irl():
     """
     Personal interests and lifestyle carousel route
@@ -181,11 +162,11 @@ def irl():
     Returns:
         Rendered irl.html template with personal interest slides and carousel configuration
     """
-    slides = get_irl_slides()
-    return render_template("pages/irl.html", slides=slides, carousel_id="irlCarousel")
+    return render_page("pages/irl.html", "irl")
 
 
 @routes.route("/connect")
+@cache_policy("social_links")
 def connect():
     """
     Contact and networking route
@@ -196,10 +177,30 @@ def connect():
     Returns:
         Rendered connect.html template with contact cards and social links
     """
-    return render_template("pages/connect.html", cards=get_connect_cards())
+    return render_page("pages/connect.html", "connect")
+
+
+@routes.route("/search")
+@cache_policy(*SEARCH_COLLECTIONS)
+def search():
+    """
+    Site search route
+
+    Searches the education, certification, technology, connect and carousel
+    content of every page. Rendered per query, outside the page cache (its
+    key ignores the query string); the search index caches recent queries.
+
+    Returns:
+        Rendered search.html template with the query and its results
+    """
+    query = request.args.get("q", "")[:MAX_QUERY_LENGTH]
+    index = get_search_index()
+    results = index.search(query) if query.strip() else ()
+    return render_template("pages/search.html", query=query.strip(), results=results)
 
 
 @routes.route("/me2u-place")
+@cache_policy("landing_page", "landing_cards")
 def me2u_place_landing():
     """
     Custom domain landing page route using DRY data approach
@@ -213,10 +214,11 @@ def me2u_place_landing():
     Returns:
         Rendered landing.html template with landing page data from constants
     """
-    return render_template("pages/landing.html", **get_landing_page_data())
+    return render_page("pages/landing.html", "landing")
 
 
 @routes.route("/health")
+@cache_policy(no_store=True)
 def health():
     """
     Health check endpoint for monitoring and load balancers.
@@ -228,21 +230,25 @@ def health():
     - CI/CD pipeline verification
 
     Returns:
-        JSON response with health status and basic app info
+        JSON response with health status and ``ok``/``failing`` per readiness
+        check. Requests carrying the ``X-Health-Token`` also get each check's
+        detail and the render cache stats. Probes should prefer /livez and
+        /readyz, which skip Flask entirely.
     """
-    import time
-    from flask import jsonify
-
+    readiness = current_app.extensions["readiness"]
+    checks = readiness.as_dict()["checks"]
     health_data = {
-        "status": "healthy",
+        "status": "healthy" if readiness.ready else "starting",
         "timestamp": int(time.time()),
         "service": "portfolio-app",
         "version": "1.0.0",
         "checks": {
-            "database": "not_applicable",
-            "static_files": "ok",
-            "templates": "ok",
+            name: "ok" if check["ok"] else "failing" for name, check in checks.items()
         },
     }
+    if token_matches(current_app.config.get("HEALTH_TOKEN"), request.environ):
+        page_cache = current_app.extensions.get("page_cache")
+        health_data["checks"] = checks
+        health_data["render_cache"] = page_cache.stats() if page_cache else None
 
     return jsonify(health_data), 200
@@ -1,2 +1,137 @@
 // Custom JavaScript for Portfolio Application
-// Currently empty - add custom scripts here as needed
\ No newline at end of file
+
+// Lazy carousel slides
+// Only the first slide ships with the page; the others are placeholders (title
+// and spinner) with a data-slide-src fragment URL. A slide is fetched right
+// before it is shown and the following one is prefetched when the browser is
+// idle. A failed fetch keeps the placeholder and is retried on the next show.
+(function () {
+  var idle = window.requestIdleCallback || function (callback) {
+    return setTimeout(callback, 200);
+  };
+
+  function loadSlide(item) {
+    if (!item || !item.dataset.slideSrc || item.dataset.slideState) {
+      return Promise.resolve();
+    }
+    item.dataset.slideState = 'loading';
+    return fetch(item.dataset.slideSrc, { credentials: 'same-origin' })
+      .then(function (response) {
+        return response.ok ? response.text() : Promise.reject(response.status);
+      })
+      .then(function (html) {
+        item.innerHTML = html;
+        item.dataset.slideState = 'loaded';
+      })
+      .catch(function () {
+        delete item.dataset.slideState;
+      });
+  }
+
+  document.querySelectorAll('.carousel').forEach(function (carousel) {
+    var items = carousel.querySelectorAll('.carousel-item');
+    carousel.addEventListener('slide.bs.carousel', function (event) {
+      loadSlide(items[event.to]).then(function () {
+        idle(function () { loadSlide(items[event.to + 1]); });
+      });
+    });
+    idle(function () { loadSlide(items[1]); });
+  });
+})();
+
+// Video previews
+// Carousel videos built by `flask build video` autoplay a small muted preview
+// loop. The full sources (HLS, then MP4 by screen size) replace it the first
+// time the visitor clicks or unmutes it (looping fires seek events, so those
+// do not count).
+(function () {
+  function upgrade(video) {
+    var sources = JSON.parse(video.dataset.fullSources);
+    var muted = video.muted;
+    delete video.dataset.fullSources;
+    video.innerHTML = '';
+    sources.forEach(function (source) {
+      var element = document.createElement('source');
+      element.src = source.src;
+      if (source.type) { element.type = source.type; }
+      if (source.media) { element.media = source.media; }
+      video.appendChild(element);
+    });
+    video.load();
+    video.muted = muted;
+    var playing = video.play();
+    if (playing) { playing.catch(function () {}); }
+  }
+
+  ['pointerdown', 'volumechange'].forEach(function (type) {
+    document.addEventListener(type, function (event) {
+      var video = event.target;
+      if (video instanceof HTMLVideoElement && video.dataset.fullSources) {
+        upgrade(video);
+      }
+    }, true);
+  });
+})();
+
+// Card backgrounds
+// Cards carry a muted loop transcoded from the hover GIF (preload="none");
+// it only downloads and plays while the card is hovered or focused.
+(function () {
+  document.querySelectorAll('.card-background-video').forEach(function (video) {
+    var card = video.parentElement;
+    function play() {
+      var playing = video.play();
+      if (playing) { playing.catch(function () {}); }
+    }
+    function pause() { video.pause(); }
+    card.addEventListener('mouseenter', play);
+    card.addEventListener('focus', play);
+    card.addEventListener('mouseleave', pause);
+    card.addEventListener('blur', pause);
+  });
+})();
+
+// Service worker
+// Registered from the data-service-worker attribute of this script tag
+// (absent when SERVICE_WORKER is off). Repeat visits are then served from
+// the worker's caches; see app/core/offline.py.
+(function () {
+  var script = document.currentScript;
+  var url = script && script.dataset.serviceWorker;
+  if (!url || !('serviceWorker' in navigator)) {
+    return;
+  }
+  window.addEventListener('load', function () {
+    navigator.serviceWorker.register(url).catch(function () {});
+  });
+})();
+
+// Search autocomplete
+// Fills the search box's datalist from /api/search/suggest as the visitor
+// types; a response for an outdated query is ignored.
+(function () {
+  var input = document.querySelector('input[data-suggest-src]');
+  if (!input || !input.list) {
+    return;
+  }
+  var latest = '';
+  input.addEventListener('input', function () {
+    var query = latest = input.value;
+    if (!query.trim()) {
+      input.list.innerHTML = '';
+      return;
+    }
+    fetch(input.dataset.suggestSrc + '?q=' + encodeURIComponent(query))
+      .then(function (response) { return response.json(); })
+      .then(function (data) {
+        if (query !== latest) { return; }
+        input.list.innerHTML = '';
+        data.suggestions.forEach(function (suggestion) {
+          var option = document.createElement('option');
+          option.value = suggestion;
+          input.list.appendChild(option);
+        });
+      })
+      .catch(function () {});
+  });
+})();
@@ -0,0 +1,95 @@
+// Service worker generated by app/core/offline.py. The version changes with
+// every deploy and content edit; the new worker then drops the old caches.
+var VERSION = {{ version|tojson }};
+var PAGES = 'pages-' + VERSION;
+var ASSETS = 'assets-' + VERSION;
+{% if enabled %}
+var PRECACHE_PAGES = {{ pages|tojson }};
+var UNCACHED_PAGES = {{ uncached|tojson }};
+var PRECACHE_ASSETS = {{ assets|tojson }};
+var HOME = {{ home|tojson }};
+var HASHED_PREFIX = {{ hashed_prefix|tojson }};
+
+self.addEventListener('install', function (event) {
+  event.waitUntil(Promise.all([
+    caches.open(PAGES).then(function (cache) { return cache.addAll(PRECACHE_PAGES); }),
+    caches.open(ASSETS).then(function (cache) { return cache.addAll(PRECACHE_ASSETS); })
+  ]).then(function () { return self.skipWaiting(); }));
+});
+
+self.addEventListener('activate', function (event) {
+  event.waitUntil(caches.keys().then(function (keys) {
+    return Promise.all(keys.filter(function (key) {
+      return key !== PAGES && key !== ASSETS;
+    }).map(function (key) { return caches.delete(key); }));
+  }).then(function () { return self.clients.claim(); }));
+});
+
+// Pages: answer from the cache at once and refresh it in the background
+function staleWhileRevalidate(event) {
+  return caches.open(PAGES).then(function (cache) {
+    return cache.match(event.request, { ignoreVary: true }).then(function (cached) {
+      var fresh = fetch(event.request).then(function (response) {
+        if (!response.ok) { return response; }
+        return cache.put(event.request, response.clone()).then(function () {
+          return response;
+        });
+      });
+      if (cached) {
+        event.waitUntil(fresh.catch(function () {}));
+        return cached;
+      }
+      return fresh.catch(function (error) {
+        return cache.match(HOME, { ignoreVary: true }).then(function (home) {
+          return home || Promise.reject(error);
+        });
+      });
+    });
+  });
+}
+
+// Search results and other query pages: network only, the home page offline
+function networkOnly(event) {
+  return fetch(event.request).catch(function (error) {
+    return caches.match(HOME, { ignoreVary: true }).then(function (home) {
+      return home || Promise.reject(error);
+    });
+  });
+}
+
+// Hashed assets never change: the network is only asked once
+function cacheFirst(request) {
+  return caches.open(ASSETS).then(function (cache) {
+    return cache.match(request).then(function (cached) {
+      return cached || fetch(request).then(function (response) {
+        if (response.status === 200) { cache.put(request, response.clone()); }
+        return response;
+      });
+    });
+  });
+}
+
+self.addEventListener('fetch', function (event) {
+  var request = event.request;
+  var url = new URL(request.url);
+  if (request.method !== 'GET' || url.origin !== self.location.origin) {
+    return;
+  }
+  if (request.mode === 'navigate') {
+    var cacheable = !url.search && UNCACHED_PAGES.indexOf(url.pathname) === -1;
+    event.respondWith(cacheable ? staleWhileRevalidate(event) : networkOnly(event));
+  } else if (url.pathname.indexOf(HASHED_PREFIX) === 0 && !request.headers.has('range')) {
+    event.respondWith(cacheFirst(request));
+  }
+});
+{% else %}
+
+// Disabled (SERVICE_WORKER = false): clear the caches and step aside
+self.addEventListener('install', function () { self.skipWaiting(); });
+
+self.addEventListener('activate', function (event) {
+  event.waitUntil(caches.keys().then(function (keys) {
+    return Promise.all(keys.map(function (key) { return caches.delete(key); }));
+  }).then(function () { return self.registration.unregister(); }));
+});
+{% endif %}
@@ -71,13 +71,17 @@ def generate_card_data(
 
 def generate_carousel_slide(
     src: str, alt: str, title: str, text: str, 
-    sources1: list | None = None, sources2: list | None = None, highlight: str | None = None
+    sources1: list | None = None, sources2: list | None = None, highlight: str | None = None,
+    meta: dict | None = None, media_type: str = "image", poster: str | None = None,
+    preview: str | None = None, video_sources: list | None = None,
+    srcset: str | None = None, sizes: str | None = None
 ) -> dict:
     """
-    Generate standardized carousel slide data structure with automatic video detection
+    Generate standardized carousel slide data structure
 
     Creates consistent slide data for achievements.html and irl.html carousels.
-    Automatically detects video files and adds media_type information.
+    The media type comes from the caller (the media registry knows it), so
+    templates never sniff file extensions.
 
     Args:
         src: Image or video source path for slide content
@@ -87,14 +91,18 @@ def generate_carousel_slide(
         sources1: Primary source citation links (optional)
         sources2: Secondary source citation links (optional)
         highlight: Key highlight or call-out text (optional)
+        meta: Build-time image dimensions and placeholder (optional)
+        media_type: "image" or "video", from the media registry; None for a
+            text-only slide
+        poster: Video poster frame URL (optional)
+        preview: Short muted preview loop URL (optional)
+        video_sources: Transcoded sources as src/type/media dicts (optional)
+        srcset: Resized image variants, from images.srcset (optional)
+        sizes: Layout width of the image for srcset selection (optional)
 
     Returns:
         Template-ready carousel slide data structure with media_type
     """
-    # Modern approach: use endswith with tuple directly
-    video_extensions = (".mp4", ".webm", ".mov", ".avi")
-    media_type = "video" if src.lower().endswith(video_extensions) else "image"
-
     # Use dictionary comprehension for optional fields
     slide = {
         "src": src,
@@ -105,7 +113,13 @@ def generate_carousel_slide(
         **{k: v for k, v in {
             "sources1": sources1,
             "sources2": sources2,
-            "highlight": highlight
+            "highlight": highlight,
+            "meta": meta,
+            "poster": poster,
+            "preview": preview,
+            "video_sources": video_sources,
+            "srcset": srcset,
+            "sizes": sizes
         }.items() if v is not None}
     }
 
@@ -180,7 +194,9 @@ def generate_source_link(href, text):
     return {"href": href, "text": text}
 
 
-def create_media_vars(media_type, src, alt=None, poster=None, style=None):
+def create_media_vars(
+    media_type, src, alt=None, poster=None, style=None, preview=None, sources=None
+):
     """
     Generate media template variables for dynamic content
 
@@ -194,6 +210,10 @@ def create_media_vars(media_type, src, alt=None, poster=None, style=None):
         alt (str, optional): Alt text for accessibility
         poster (str, optional): Video poster image path
         style (str, optional): CSS styling for media element
+        preview (str, optional): Muted preview loop played until the
+            visitor interacts with the video
+        sources (list, optional): Transcoded video sources (src/type/media
+            dicts, best first) from ``flask build video``
 
     Returns:
         dict: Media template variables ready for Jinja rendering
@@ -208,4 +228,6 @@ def create_media_vars(media_type, src, alt=None, poster=None, style=None):
         "media_alt": alt,
         "media_poster": poster,
         "media_style": style,
+        "media_preview": preview,
+        "media_sources": sources,
     }
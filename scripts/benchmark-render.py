@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Template Render Benchmark
+=========================
+
+Times the card grid and the full certifications/techstack pages as the grids
+grow, to compare per-card includes against the ``card_grid`` macro.
+
+- ``include``: the old layout loop (eight ``{% set %}`` plus an ``{% include %}``
+  of the card component per card), kept here as an in-memory template
+- ``macro``: ``components/common/cards.html`` imported once, one
+  ``card_grid`` call for the whole grid
+- ``page``: the real ``pages/certifications.html`` / ``pages/techstack.html``
+  rendered with the grids scaled to the same card count (no page cache)
+
+Grids are scaled by repeating the real content cards. Run from the repository
+root:
+
+    python scripts/benchmark-render.py [--sizes 10,100,1000] [--repeat 5]
+"""
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from flask import render_template  # noqa: E402
+from jinja2 import ChoiceLoader, DictLoader  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.data.view_models import get_view_model  # noqa: E402
+
+LEGACY_CARD = """\
+<a href="{{ href }}" target="_blank"
+   class="{{ card_class|default('card rounded-4 bg-dark text-white h-100 hover-shadow card-dimensions card-background') }} text-white text-decoration-none">
+  <div class="d-flex align-items-center justify-content-center rounded-top-4 card-logo-container">
+    <img src="{{ logo_src }}" alt="{{ logo_alt }}" class="img-fluid card-logo"
+      {%- if logo_meta %} width="{{ logo_meta.width }}" height="{{ logo_meta.height }}"{% endif %}>
+  </div>
+  <div class="card-body d-flex flex-column justify-content-end rounded-bottom-4">
+    <h3 class="h6 fw-bold text-white mb-2">{{ title }}</h3>
+    {% if subtitle %}<p class="mb-2 text-white-50 small">{{ subtitle }}</p>{% endif %}
+    {% if badge_text %}<span class="btn btn-outline-secondary btn-sm mt-auto w-50 mx-auto d-block">{{ badge_text|safe }}</span>{% endif %}
+  </div>
+</a>
+"""
+
+LEGACY_GRID = """\
+<div class="row row-cols-1 row-cols-md-3 g-4">
+  {% for card in cards %}
+    <div class="col">
+      {% set href = card.href %}
+      {% set logo_src = card.logo_src %}
+      {% set logo_alt = card.logo_alt %}
+      {% set logo_meta = card.logo_meta %}
+      {% set title = card.title %}
+      {% set subtitle = card.subtitle %}
+      {% set badge_text = card.badge_text %}
+      {% set card_class = card.card_class %}
+      {% include 'bench/legacy_card.html' %}
+    </div>
+  {% endfor %}
+</div>
+"""
+
+MACRO_GRID = """\
+{% import 'components/common/cards.html' as card_ui %}
+{{ card_ui.card_grid(cards) }}
+"""
+
+
+def scaled(cards, size):
+    """``size`` cards, repeating ``cards``."""
+    return [cards[index % len(cards)] for index in range(size)]
+
+
+def same_markup(first, second):
+    """Equal up to whitespace (includes drop their trailing newline)."""
+    return "".join(first.split()) == "".join(second.split())
+
+
+def best_of(func, repeat):
+    """Best time per call in milliseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", default="10,50,200,1000")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    app = create_app(
+        {
+            "TESTING": True,
+            "SECRET_KEY": "bench",
+            "RENDER_CACHE_TTL": 0,  # Every page render is measured, none cached
+            "WARMUP_ON_START": False,
+        }
+    )
+    app.jinja_env.loader = ChoiceLoader(
+        [
+            DictLoader(
+                {
+                    "bench/legacy_card.html": LEGACY_CARD,
+                    "bench/legacy_grid.html": LEGACY_GRID,
+                    "bench/macro_grid.html": MACRO_GRID,
+                }
+            ),
+            app.jinja_env.loader,
+        ]
+    )
+
+    with app.test_request_context("/certifications", base_url="http://localhost"):
+        certifications = get_view_model("certifications")["cards"]
+        techstack = get_view_model("techstack")
+        tech_cards = sum(techstack.values(), [])
+        legacy = app.jinja_env.get_template("bench/legacy_grid.html")
+        macro = app.jinja_env.get_template("bench/macro_grid.html")
+
+        print(
+            f"{'cards':>6} {'include':>10} {'macro':>10} {'speedup':>8}"
+            f" {'certs page':>11} {'tech page':>10}"
+        )
+        for size in sizes:
+            cards = scaled(certifications, size)
+            assert same_markup(legacy.render(cards=cards), macro.render(cards=cards))
+            include_ms = best_of(lambda: legacy.render(cards=cards), args.repeat)
+            macro_ms = best_of(lambda: macro.render(cards=cards), args.repeat)
+            certs_ms = best_of(
+                lambda: render_template("pages/certifications.html", cards=cards),
+                args.repeat,
+            )
+            per_section = scaled(tech_cards, max(1, size // 3))
+            tech_ms = best_of(
+                lambda: render_template(
+                    "pages/techstack.html",
+                    frontend_cards=per_section,
+                    backend_cards=per_section,
+                    infra_cards=per_section,
+                ),
+                args.repeat,
+            )
+            print(
+                f"{size:>6} {include_ms:>8.3f}ms {macro_ms:>8.3f}ms"
+                f" {include_ms / macro_ms:>7.1f}x {certs_ms:>9.3f}ms"
+                f" {tech_ms:>8.3f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
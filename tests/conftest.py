@@ -14,7 +14,13 @@ def app():
     # Create a temporary file to isolate the database for each test
     db_fd, db_path = tempfile.mkstemp()
 
-    app = create_app({"TESTING": True, "SECRET_KEY": "test-secret-key"})
+    app = create_app(
+        {
+            "TESTING": True,
+            "SECRET_KEY": "test-secret-key",
+            "HEALTH_TOKEN": "test-health-token",
+        }
+    )
 
     with app.app_context():
         yield app
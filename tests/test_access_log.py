@@ -0,0 +1,122 @@
+"""
+Unit tests for the structured, buffered access log.
+"""
+
+import io
+import json
+import threading
+
+from app import create_app
+from app.core.access_log import AccessLogWriter
+
+
+def _logged_app(tmp_path, **config):
+    path = tmp_path / "access.log"
+    app = create_app(
+        {"TESTING": True, "SECRET_KEY": "test", "ACCESS_LOG_PATH": str(path), **config}
+    )
+    return app, path
+
+
+def _get(client, url, **kwargs):
+    """Request ``url`` and close the response, as a WSGI server would."""
+    with client.get(url, **kwargs) as response:
+        return response.status_code, len(response.data)
+
+
+def _records(app, path):
+    app.extensions["access_log"].flush(timeout=5)
+    return [json.loads(line) for line in path.read_text("utf-8").splitlines()]
+
+
+class BlockedStream(io.StringIO):
+    """Stream whose first write waits until released (a slow log sink)."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.release.wait(5)
+        return super().write(text)
+
+
+class TestAccessLog:
+    """Test suite for JSON access log lines."""
+
+    def test_request_fields(self, tmp_path):
+        """Each request logs route, host, status, latency, cache and bytes."""
+        app, path = _logged_app(tmp_path)
+        client = app.test_client()
+        _, size = _get(client, "/techstack?x=1", headers={"User-Agent": 'a "b"'})
+        _get(client, "/techstack")
+        _get(client, "/missing")
+
+        first, second, missing = _records(app, path)
+        assert first["route"] == "routes.techstack"
+        assert first["host"] == "localhost"
+        assert first["cache"] == "MISS"
+        assert second["cache"] == "HIT"
+        assert first["severity"] == "INFO"
+        request = first["httpRequest"]
+        assert request["requestMethod"] == "GET"
+        assert request["requestUrl"] == "/techstack?x=1"
+        assert request["status"] == 200
+        assert request["responseSize"] == str(size)
+        assert request["userAgent"] == 'a "b"'
+        assert request["latency"].endswith("s")
+        assert missing["httpRequest"]["status"] == 404
+        assert missing["severity"] == "WARNING"
+        assert missing["cache"] == "-"
+
+    def test_remote_ip_is_the_forwarded_client(self, tmp_path):
+        """``remoteIp`` is the proxy-appended client, not the proxy itself."""
+        app, path = _logged_app(tmp_path)
+        forwarded = {"X-Forwarded-For": "1.1.1.1, 203.0.113.7"}
+        _get(app.test_client(), "/", headers=forwarded)
+        assert _records(app, path)[0]["httpRequest"]["remoteIp"] == "203.0.113.7"
+
+    def test_rate_limited_requests_are_logged(self, tmp_path):
+        """429s from the rate limiter carry the route they were aimed at."""
+        app, path = _logged_app(tmp_path, RATE_LIMIT_IP_BURST=1)
+        client = app.test_client()
+        _get(client, "/education")
+        assert _get(client, "/education")[0] == 429
+        assert _records(app, path)[-1]["route"] == "routes.education"
+
+    def test_disabled_under_testing_without_path(self):
+        """Test apps do not start a writer unless a log file is configured."""
+        app = create_app({"TESTING": True})
+        assert "access_log" not in app.extensions
+
+
+class TestAccessLogWriter:
+    """Test suite for the bounded queue and overload policies."""
+
+    def test_drop_when_queue_is_full(self):
+        """A full queue drops records instead of blocking the caller."""
+        stream = BlockedStream()
+        writer = AccessLogWriter(stream, queue_size=2)
+        for number in range(6):
+            writer.submit(str(number))
+        stream.release.set()
+        writer.flush(timeout=5)
+        stats = writer.stats()
+        assert stats["dropped"] >= 3
+        assert stats["written"] + stats["dropped"] == 6
+
+    def test_sample_keeps_errors(self):
+        """Sampling thins successes past the high-water mark but keeps errors."""
+        stream = BlockedStream()
+        writer = AccessLogWriter(
+            stream, queue_size=100, overflow="sample", sample_every=10
+        )
+        for number in range(80):
+            writer.submit(f"ok {number}")
+        writer.submit("error", error=True)
+        stream.release.set()
+        writer.flush(timeout=5)
+        lines = stream.getvalue().splitlines()
+        assert "error" in lines
+        assert writer.sampled_out > 20
+        assert len(lines) + writer.sampled_out == 81
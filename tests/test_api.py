@@ -0,0 +1,132 @@
+"""
+Unit tests for the read-only API blueprint.
+"""
+
+import gzip
+
+
+class TestSlideApi:
+    """Test suite for lazily loaded carousel slides."""
+
+    def test_carousel_page_ships_only_first_slide(self, client):
+        """The page renders the first slide and placeholders for the rest."""
+        response = client.get("/achievements")
+        assert b"LinkedIn Onix GenAI Post" in response.data
+        assert b"I underwent intense chemotherapy" not in response.data
+        assert response.data.count(b"data-slide-src=") == 3
+        assert b"/api/slides/achievementsCarousel/1?format=html" in response.data
+
+    def test_lazy_slides_have_placeholder_and_noscript_link(self, client):
+        """Unloaded slides show their title and link to the fragment."""
+        html = client.get("/achievements").get_data(as_text=True)
+        assert "Donkey Sanctuary 5K" in html
+        assert html.count("slide-spinner") >= 3
+        assert (
+            '<noscript><a href="/api/slides/achievementsCarousel/2?format=html"' in html
+        )
+
+    def test_slide_json(self, client):
+        """Slides are served as JSON from the precomputed slide models."""
+        response = client.get("/api/slides/irlCarousel/2")
+        assert response.status_code == 200
+        assert response.json["index"] == 2
+        assert response.json["total"] == 3
+        assert response.json["slide"]["title"] == "Pacman Tattoo"
+
+    def test_slide_html_fragment(self, client):
+        """The HTML format returns the rendered slide body only."""
+        response = client.get("/api/slides/achievementsCarousel/2?format=html")
+        assert response.status_code == 200
+        assert b"Donkey Sanctuary 5K" in response.data
+        assert b"<html" not in response.data
+
+    def test_unknown_slides_return_json_404(self, client):
+        """Unknown carousels and out-of-range indexes return JSON 404s."""
+        assert client.get("/api/slides/missingCarousel/0").status_code == 404
+        response = client.get("/api/slides/irlCarousel/99")
+        assert response.status_code == 404
+        assert response.json == {"error": "not_found"}
+
+    def test_api_enforces_allowed_domains(self, client):
+        """The API is hidden on hosts outside the allow list."""
+        response = client.get(
+            "/api/slides/irlCarousel/0", headers={"Host": "portfolio-abc.a.run.app"}
+        )
+        assert response.status_code == 404
+
+
+class TestContentApiV1:
+    """Test suite for the versioned content API."""
+
+    def test_index_lists_collections_and_cards(self, client):
+        """The index links every collection and card model."""
+        response = client.get("/api/v1/")
+        assert response.status_code == 200
+        assert response.json["version"] == "v1"
+        assert response.json["collections"]["technologies"] == "/api/v1/technologies"
+        assert (
+            response.json["cards"]["certifications"] == "/api/v1/cards/certifications"
+        )
+
+    def test_collection_matches_constants(self, client):
+        """Collections expose the content constants unchanged."""
+        from app.data.constants import TECHNOLOGIES
+
+        response = client.get("/api/v1/technologies")
+        assert response.status_code == 200
+        assert response.json == {"technologies": TECHNOLOGIES}
+
+    def test_card_models(self, client):
+        """Card endpoints expose the derived card models of each page."""
+        response = client.get("/api/v1/cards/techstack")
+        assert set(response.json["techstack"]) == {"frontend", "backend", "infra"}
+        assert client.get("/api/v1/cards/unknown").status_code == 404
+
+    def test_etag_revalidation(self, client):
+        """A matching If-None-Match returns 304 without a body."""
+        first = client.get("/api/v1/certifications")
+        assert first.headers["ETag"]
+        second = client.get(
+            "/api/v1/certifications", headers={"If-None-Match": first.headers["ETag"]}
+        )
+        assert second.status_code == 304
+        assert second.data == b""
+
+    def test_precompressed_gzip(self, client):
+        """Clients accepting gzip receive the precompressed body."""
+        identity = client.get("/api/v1/technologies")
+        response = client.get(
+            "/api/v1/technologies", headers={"Accept-Encoding": "gzip"}
+        )
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert gzip.decompress(response.data) == identity.data
+
+    def test_each_encoding_has_its_own_etag(self, client):
+        """The gzip body's strong ETag differs and only revalidates gzip."""
+        identity = client.get("/api/v1/technologies")
+        gzipped = client.get(
+            "/api/v1/technologies", headers={"Accept-Encoding": "gzip"}
+        )
+        assert gzipped.headers["ETag"] == identity.headers["ETag"][:-1] + '-gzip"'
+        stale = client.get(
+            "/api/v1/technologies",
+            headers={"If-None-Match": gzipped.headers["ETag"]},
+        )
+        assert stale.status_code == 200
+        revalidated = client.get(
+            "/api/v1/technologies",
+            headers={
+                "Accept-Encoding": "gzip",
+                "If-None-Match": gzipped.headers["ETag"],
+            },
+        )
+        assert revalidated.status_code == 304
+
+    def test_payloads_are_serialized_once(self, app, client):
+        """Repeated requests reuse the cached payload object."""
+        cache = app.extensions["tenants"].default.cache("api_payloads")
+        client.get("/api/v1/institutions")
+        payload = cache[("collection", "institutions")]
+        client.get("/api/v1/institutions")
+        assert cache[("collection", "institutions")] is payload
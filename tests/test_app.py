@@ -2,6 +2,10 @@
 Unit tests for Flask application routes and core functionality.
 """
 
+import re
+
+import pytest
+
 
 class TestRoutes:
     """Test suite for the Flask portfolio application."""
@@ -67,6 +71,51 @@ class TestRoutes:
         assert b"404" in response.data or b"Not Found" in response.data
 
 
+class TestPreloadHeaders:
+    """Test suite for precomputed view models and critical asset preloading."""
+
+    def test_home_preloads_css_and_hero_image(self, client):
+        """Home page announces stylesheets and the hero image."""
+        link = client.get("/").headers["Link"]
+        assert "rel=preload; as=style" in link
+        assert "cartoonized-alan-smith.png>; rel=preload; as=image" in link
+
+    def test_carousel_preloads_first_slide(self, client):
+        """Carousel pages preload the first slide image only."""
+        link = client.get("/irl").headers["Link"]
+        assert "ingy-dot-net.jpg" in link
+        assert "valley-of-fire-wedding.jpg" not in link
+
+    @pytest.mark.parametrize(
+        "url, marker", [("/", "card-img-cover"), ("/achievements", "carousel-item")]
+    )
+    def test_hero_image_is_eager_and_matches_its_preload(self, client, url, marker):
+        """The hero loads eagerly at high priority, from the preloaded URLs."""
+        response = client.get(url)
+        html = response.get_data(as_text=True)
+        start = html.index(marker) - 200
+        hero = re.search(r"<img [^>]*>", html[start:]).group(0)
+        assert 'fetchpriority="high"' in hero
+        assert 'loading="lazy"' not in hero
+        src = re.search(r' src="([^"]+)"', hero).group(1)
+        assert f"<{src}>; rel=preload; as=image" in response.headers["Link"]
+        srcset = re.search(r' srcset="([^"]+)"', hero)
+        if srcset:
+            assert f'imagesrcset="{srcset.group(1)}"' in response.headers["Link"]
+
+    def test_error_pages_have_no_preload(self, client):
+        """Only successful page renders carry preload headers."""
+        assert "Link" not in client.get("/nonexistent-page").headers
+
+    def test_view_models_are_built_once(self, app, client):
+        """Repeated requests reuse the same precomputed view model."""
+        cache = app.extensions["tenants"].default.cache("view_models")
+        client.get("/education")
+        first = cache["education"]
+        client.get("/education")
+        assert cache["education"] is first
+
+
 class TestStaticAssets:
     """Test suite for static assets."""
 
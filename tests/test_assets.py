@@ -0,0 +1,219 @@
+"""
+Unit tests for the static asset build pipeline and runtime manifest.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from app.build.css import (
+    collect_selectors,
+    extract_critical,
+    minify_css,
+    parse_css,
+    serialize_css,
+)
+from app.build.media import build_media_index, svg_metadata
+from app.build.vendor import scan_used_selectors
+from app.core.assets import AssetManifest
+from app.core.media import init_media
+
+
+@pytest.fixture
+def built_app(app, tmp_path):
+    """App whose static folder is a temporary copy, so builds stay isolated."""
+    static_copy = tmp_path / "static"
+    shutil.copytree(app.static_folder, static_copy)
+    app.static_folder = str(static_copy)
+    return app
+
+
+class TestCssBuild:
+    """Test suite for CSS minification and critical CSS extraction."""
+
+    def test_minify_css_strips_comments_and_whitespace(self):
+        """Comments, redundant whitespace and trailing semicolons are removed."""
+        css = "/* header */\n.a  ,  .b {\n  color: #fff;  /* note */\n  margin: 0 auto;\n}\n"
+        assert minify_css(css) == ".a,.b{color:#fff;margin:0 auto}"
+
+    def test_extract_critical_keeps_only_used_selectors(self):
+        """Rules for unused classes are dropped and selector lists narrowed."""
+        css = minify_css(
+            ".used,.unused{color:red}.other{color:blue}"
+            "@media (min-width:768px){.used{margin:0}.other{margin:1px}}"
+            ".fade{animation:fadeIn 1s}@keyframes fadeIn{from{opacity:0}}"
+            "@keyframes unusedAnim{from{opacity:0}}"
+        )
+        used = collect_selectors(['<div class="used fade">'])
+        result = serialize_css(extract_critical(parse_css(css), used))
+        assert ".used{color:red}" in result
+        assert ".other" not in result
+        assert "@media (min-width:768px){.used{margin:0}}" in result
+        assert "@keyframes fadeIn" in result
+        assert "unusedAnim" not in result
+
+    def test_build_css_command_writes_manifest(self, built_app, runner):
+        """The build command writes a hashed bundle and critical CSS per layout."""
+        result = runner.invoke(args=["build", "css"])
+        assert result.exit_code == 0, result.output
+
+        manifest = AssetManifest.load(built_app.static_folder)
+        assert manifest.loaded
+        assert manifest.resolve("css/bundle.css").startswith("dist/css/bundle.")
+        assert {"card_grid", "carousel", "horizontal_card", "landing"} <= set(
+            manifest.critical
+        )
+
+
+class TestVendorBuild:
+    """Test suite for self-hosted, subset vendor assets."""
+
+    @pytest.fixture
+    def vendor_source(self, tmp_path):
+        """Minimal pinned vendor sources standing in for the CDN files."""
+        source = tmp_path / "vendor"
+        (source / "webfonts").mkdir(parents=True)
+        (source / "bootstrap.min.css").write_text(
+            ".navbar{display:flex}.unused-widget{color:red}"
+            "@media (min-width:768px){.col-md-6{flex:0 0 auto}}"
+        )
+        (source / "bootstrap.bundle.min.js").write_text(
+            "!function(){}();\n//# sourceMappingURL=bootstrap.bundle.min.js.map"
+        )
+        (source / "all.min.css").write_text(
+            '.fas{font-family:"Font Awesome 6 Free";font-weight:900}'
+            '.fa-trophy:before{content:"\\f091"}.fa-unused:before{content:"\\f000"}'
+            '@font-face{font-family:"Font Awesome 6 Free";font-weight:900;'
+            'src:url(../webfonts/fa-solid-900.woff2) format("woff2")}'
+            '@font-face{font-family:"Font Awesome 6 Brands";'
+            'src:url(../webfonts/fa-brands-400.woff2) format("woff2")}'
+        )
+        (source / "webfonts" / "fa-solid-900.woff2").write_bytes(b"solid")
+        (source / "webfonts" / "fa-brands-400.woff2").write_bytes(b"brands")
+        return source
+
+    def test_build_vendor_subsets_css_and_fonts(self, built_app, runner, vendor_source):
+        """Only used classes, icons and icon styles end up in the output."""
+        result = runner.invoke(args=["build", "vendor", "--source", str(vendor_source)])
+        assert result.exit_code == 0, result.output
+
+        manifest = AssetManifest.load(built_app.static_folder)
+        static = Path(built_app.static_folder)
+        bootstrap = (static / manifest.resolve("vendor/bootstrap.css")).read_text()
+        icons = (static / manifest.resolve("vendor/fontawesome.css")).read_text()
+        script = (static / manifest.resolve("vendor/bootstrap.bundle.js")).read_text()
+
+        assert ".navbar{display:flex}" in bootstrap
+        assert ".col-md-6" in bootstrap
+        assert "unused-widget" not in bootstrap
+        assert ".fa-trophy:before" in icons
+        assert "fa-unused" not in icons
+        assert "webfonts/fa-solid-900." in icons
+        assert "Brands" not in icons
+        assert "sourceMappingURL" not in script
+
+    def test_scan_keeps_classes_added_by_site_scripts(self, tmp_path):
+        """Classes that only the site scripts add are still counted as used."""
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "page.html").write_text('<div class="navbar"></div>')
+        (tmp_path / "static" / "js").mkdir(parents=True)
+        (tmp_path / "static" / "js" / "scripts.js").write_text(
+            "item.classList.add('slide-loaded');"
+        )
+
+        used = scan_used_selectors(tmp_path)
+        assert {"navbar", "slide-loaded"} <= used["classes"]
+
+    def test_built_pages_use_self_hosted_vendor_assets(
+        self, built_app, runner, vendor_source
+    ):
+        """Pages stop referencing third-party CDNs once vendor assets exist."""
+        runner.invoke(args=["build", "vendor", "--source", str(vendor_source)])
+        built_app.extensions["assets"] = AssetManifest.load(built_app.static_folder)
+
+        response = built_app.test_client().get("/irl")
+        assert b"cdn.jsdelivr.net" not in response.data
+        assert b"cdnjs.cloudflare.com" not in response.data
+        assert b"/static/dist/vendor/bootstrap.bundle." in response.data
+
+
+class TestMediaIndex:
+    """Test suite for the build-time image metadata index."""
+
+    def test_svg_sizes_from_attributes_or_viewbox(self, tmp_path):
+        """SVG dimensions come from width/height, else from the viewBox."""
+        sized = tmp_path / "sized.svg"
+        sized.write_text('<svg xmlns="x" width="40px" height="20"></svg>')
+        boxed = tmp_path / "boxed.svg"
+        boxed.write_text('<svg viewBox="0 0 630 315"><path/></svg>')
+        unsized = tmp_path / "unsized.svg"
+        unsized.write_text("<svg><path/></svg>")
+        assert svg_metadata(sized) == {"width": 40, "height": 20}
+        assert svg_metadata(boxed) == {"width": 630, "height": 315}
+        assert svg_metadata(unsized) is None
+
+    def test_index_has_placeholders_for_opaque_images_only(self, app):
+        """Photos get a color and placeholder; transparent logos only a size."""
+        pytest.importorskip("PIL")
+        index = build_media_index(app.static_folder)
+        photo = index["images/content/pacman-tattoo.jpg"]
+        assert photo["width"] > 0 and photo["height"] > 0
+        assert photo["color"].startswith("#") and len(photo["color"]) == 7
+        assert photo["placeholder"].startswith("data:image/jpeg;base64,")
+        assert len(photo["placeholder"]) < 2048
+        assert set(index["images/logos/logo-linkedin.png"]) == {"width", "height"}
+
+    def test_pages_render_indexed_dimensions(self, built_app, runner):
+        """Built metadata reaches carousel slides and card logos."""
+        result = runner.invoke(args=["build", "media"])
+        assert result.exit_code == 0, result.output
+        built_app.extensions["assets"] = AssetManifest.load(built_app.static_folder)
+        init_media(built_app)
+        media = built_app.extensions["assets"].media
+        client = built_app.test_client()
+
+        irl = client.get("/irl").get_data(as_text=True)
+        photo = media.get("images/content/ingy-dot-net.jpg")
+        if photo is not None:  # Pillow installed
+            assert f'width="{photo["width"]}" height="{photo["height"]}"' in irl
+            assert photo["placeholder"] in irl
+
+        techstack = client.get("/techstack").get_data(as_text=True)
+        logos = [path for path in media if path.startswith("images/logos/")]
+        assert any(
+            f'src="/static/{path}" alt=' in techstack
+            and f'width="{media[path]["width"]}"' in techstack
+            for path in logos
+        )
+
+    def test_unbuilt_pages_have_no_placeholders(self, client):
+        """Without the index, sizes come from image headers; no placeholders."""
+        assert b"data:image/jpeg;base64" not in client.get("/irl").data
+
+
+class TestAssetHelpers:
+    """Test suite for runtime asset helpers in templates."""
+
+    def test_unbuilt_pages_link_stylesheets(self, client):
+        """Without a build, pages fall back to the individual stylesheets."""
+        response = client.get("/")
+        assert b"css/style.css" in response.data
+        assert b"css/cards.css" in response.data
+        assert b"cdn.jsdelivr.net" in response.data
+
+    def test_built_pages_inline_critical_css(self, built_app, runner):
+        """After a build, pages inline critical CSS and preload the bundle."""
+        runner.invoke(args=["build", "css"])
+        built_app.extensions["assets"] = AssetManifest.load(built_app.static_folder)
+        client = built_app.test_client()
+
+        response = client.get("/techstack")
+        assert b"<style>" in response.data
+        assert b'rel="preload"' in response.data
+        assert b"/static/dist/css/bundle." in response.data
+
+        bundle = built_app.extensions["assets"].resolve("css/bundle.css")
+        asset = client.get(f"/static/{bundle}")
+        assert "immutable" in asset.headers["Cache-Control"]
+        asset.close()
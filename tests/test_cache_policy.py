@@ -0,0 +1,109 @@
+"""
+Unit tests for per-route edge cache headers and surrogate-key purging.
+"""
+
+import json
+import shutil
+
+from app.core.cache_policy import CachePolicy, purge_keys, route_policies
+from app.data.content_store import DEFAULT_CONTENT_DIR
+
+
+class TestCacheHeaders:
+    """Test suite for headers emitted from route cache policies."""
+
+    def test_pages_are_cacheable_at_the_edge(self, client):
+        """HTML pages carry shared-cache TTLs and stale directives."""
+        response = client.get("/techstack")
+        cache_control = response.headers["Cache-Control"]
+        assert "public" in cache_control
+        assert "s-maxage=3600" in cache_control
+        assert "stale-while-revalidate=86400" in cache_control
+        assert "stale-if-error=604800" in cache_control
+        assert response.headers["Surrogate-Control"].startswith("max-age=3600")
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+    def test_surrogate_keys_follow_content_collections(self, client):
+        """Keys name the tenant and every collection the page renders."""
+        keys = client.get("/education").headers["Surrogate-Key"].split()
+        assert keys == [
+            "default",
+            "default/education_programs",
+            "default/institutions",
+            "default/social_links",
+        ]
+
+    def test_carousel_pages_share_keys(self, client):
+        """Both carousel pages are keyed by everything a carousel renders."""
+        achievements = client.get("/achievements").headers["Surrogate-Key"]
+        assert client.get("/irl").headers["Surrogate-Key"] == achievements
+        assert "default/external_urls" in achievements.split()
+
+    def test_api_responses_are_tagged(self, client):
+        """API payloads are keyed by the collection they serve, without layout."""
+        response = client.get("/api/v1/technologies")
+        assert response.headers["Surrogate-Key"] == "default default/technologies"
+        assert response.headers["Cache-Control"].startswith("public, max-age=300")
+        cards = client.get("/api/v1/cards/education").headers["Surrogate-Key"]
+        assert cards.split() == [
+            "default",
+            "default/education_programs",
+            "default/institutions",
+        ]
+
+    def test_health_and_errors_are_not_cached(self, client):
+        """Health checks are no-store; error pages get no edge policy."""
+        assert client.get("/health").headers["Cache-Control"] == "no-store"
+        response = client.get("/nonexistent-page")
+        assert "Surrogate-Key" not in response.headers
+
+    def test_policy_defaults(self):
+        """Policies render browser and surrogate directives from their fields."""
+        policy = CachePolicy(("technologies",), max_age=0, s_maxage=10)
+        assert policy.cache_control.startswith("public, max-age=0, s-maxage=10")
+        assert policy.surrogate_keys("t") == ["t", "t/technologies", "t/social_links"]
+        policy = CachePolicy(("technologies",), layout=False)
+        assert policy.surrogate_keys("t") == ["t", "t/technologies"]
+
+
+class TestPurge:
+    """Test suite for computing purge keys from a content diff."""
+
+    def test_purge_keys_cover_affected_routes(self, app):
+        """Only routes rendering a changed collection are affected."""
+        keys, endpoints = purge_keys(
+            "default", ["technologies", "contact"], route_policies(app)
+        )
+        assert keys == ["default/technologies"]
+        assert endpoints == [
+            "api.search",
+            "api.search_suggest",
+            "api_v1.cards",
+            "api_v1.collection",
+            "routes.search",
+            "routes.techstack",
+        ]
+
+    def test_purge_command_diffs_content(self, app, tmp_path):
+        """``flask cache purge`` reports keys for the collections that changed."""
+        old = tmp_path / "content"
+        shutil.copytree(DEFAULT_CONTENT_DIR, old)
+        certs = old / "certifications.toml"
+        certs.write_text(
+            certs.read_text("utf-8").replace("HashiCorp", "Hashicorp"), "utf-8"
+        )
+        result = app.test_cli_runner().invoke(
+            args=["cache", "purge", "--old", str(old)]
+        )
+        assert result.exit_code == 0
+        assert json.loads(result.output) == {
+            "keys": ["default/certifications"],
+            "endpoints": [
+                "api.search",
+                "api.search_suggest",
+                "api_v1.cards",
+                "api_v1.collection",
+                "routes.certifications",
+                "routes.search",
+            ],
+        }
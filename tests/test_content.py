@@ -0,0 +1,189 @@
+"""
+Unit tests for the externalized content store and its hot reload.
+"""
+
+import json
+import os
+import shutil
+import time
+
+import pytest
+
+from app import create_app
+from app.data.content_store import (
+    DEFAULT_CONTENT_DIR,
+    SNAPSHOT_NAME,
+    ContentError,
+    load_binary_snapshot,
+    load_content,
+    load_default_content,
+    load_snapshot,
+    source_digest,
+    write_binary_snapshot,
+)
+
+
+@pytest.fixture
+def content_dir(tmp_path):
+    """Writable copy of the bundled content directory."""
+    path = tmp_path / "content"
+    shutil.copytree(DEFAULT_CONTENT_DIR, path)
+    return path
+
+
+@pytest.fixture
+def content_app(content_dir):
+    """App instance that reads its content from ``content_dir``."""
+    return create_app(
+        {"TESTING": True, "SECRET_KEY": "test", "CONTENT_DIR": str(content_dir)}
+    )
+
+
+def _edit(path, old, new):
+    """Replace text in a content file and make sure its mtime moves."""
+    stat = path.stat()
+    path.write_text(path.read_text("utf-8").replace(old, new), "utf-8")
+    mtime = max(stat.st_mtime_ns, time.time_ns()) + 1_000_000_000
+    os.utime(path, ns=(stat.st_atime_ns, mtime))
+
+
+class TestContentLoading:
+    """Test suite for parsing and validating content files."""
+
+    def test_bundled_content_builds_typed_indexes(self):
+        """The bundled content validates and indexes technologies by category."""
+        content = load_default_content()
+        assert content.certifications["gcp_architect"].short_title == (
+            "Professional Cloud Architect"
+        )
+        frontend = content.technologies_by_category["frontend"]
+        assert [tech.key for tech in frontend][:2] == ["html5", "css3"]
+        slide = content.carousels["achievements"][1]
+        assert [source.text for source in slide.sources1] == [
+            "Canadian Cancer Society",
+            "Alberta Health Services",
+        ]
+
+    def test_json_files_are_merged(self, content_dir):
+        """Collections may live in JSON files next to the TOML ones."""
+        (content_dir / "social_links.toml").unlink()
+        social = load_default_content().raw["social_links"]
+        (content_dir / "social_links.json").write_text(
+            json.dumps({"social_links": social}), "utf-8"
+        )
+        assert load_snapshot(content_dir).raw["social_links"] == social
+
+    @pytest.mark.parametrize(
+        "filename, old, new, message",
+        [
+            (
+                "certifications.toml",
+                'short_title = "Terraform',
+                'nickname = "T',
+                "missing",
+            ),
+            (
+                "education.toml",
+                '"seneca_polytechnic"',
+                '"nowhere"',
+                "unknown institution",
+            ),
+            ("carousels.toml", '["donkey_sanctuary"]', '["missing"]', "unknown source"),
+            ("technologies.toml", 'category = "infra"', 'category = "ops"', "category"),
+        ],
+    )
+    def test_invalid_content_raises(self, content_dir, filename, old, new, message):
+        """Missing fields and broken references are reported with their location."""
+        _edit(content_dir / filename, old, new)
+        with pytest.raises(ContentError, match=message):
+            load_snapshot(content_dir)
+
+
+class TestContentHotReload:
+    """Test suite for snapshot swapping on content changes."""
+
+    def test_unchanged_files_do_not_reload(self, content_app):
+        """Polling without changes keeps the current snapshot."""
+        store = content_app.extensions["content"]
+        snapshot = store.snapshot
+        assert store.reload_if_changed() is False
+        assert store.snapshot is snapshot
+
+    def test_reload_swaps_snapshot_and_invalidates_views(
+        self, content_app, content_dir
+    ):
+        """Edited content shows up on the next request without a restart."""
+        client = content_app.test_client()
+        assert b"Professional Cloud Architect" in client.get("/certifications").data
+        view_models = content_app.extensions["tenants"].default.cache("view_models")
+        assert "certifications" in view_models
+
+        _edit(
+            content_dir / "certifications.toml",
+            'title = "Google Cloud Professional Cloud Architect"',
+            'title = "Google Cloud Professional Cloud Architect (Renewed)"',
+        )
+        store = content_app.extensions["content"]
+        old_version = store.snapshot.version
+        assert store.reload_if_changed() is True
+        assert store.snapshot.version != old_version
+        assert "certifications" not in view_models
+        assert b"Cloud Architect (Renewed)" in client.get("/certifications").data
+
+    def test_invalid_edit_keeps_previous_snapshot(self, content_app, content_dir):
+        """A broken edit is logged and the last good snapshot keeps serving."""
+        store = content_app.extensions["content"]
+        snapshot = store.snapshot
+        _edit(content_dir / "site.toml", "[home_card]", "[home_card")
+        assert store.reload_if_changed() is False
+        assert store.snapshot is snapshot
+        assert content_app.test_client().get("/").status_code == 200
+
+
+class TestBinarySnapshot:
+    """Test suite for the compiled content snapshot."""
+
+    def test_round_trip_matches_sources(self, content_dir):
+        """The binary snapshot decodes to the same content and version."""
+        target, built = write_binary_snapshot(content_dir)
+        loaded = load_binary_snapshot(target)
+        assert loaded.raw == load_snapshot(content_dir).raw
+        assert loaded.version == built.version
+        assert loaded.carousels == built.carousels
+
+    def test_fresh_snapshot_is_preferred(self, content_dir, monkeypatch):
+        """Startup skips parsing the sources when the snapshot is current."""
+        write_binary_snapshot(content_dir)
+        monkeypatch.setattr(
+            "app.data.content_store.load_snapshot",
+            lambda path: pytest.fail("sources should not be parsed"),
+        )
+        assert load_content(content_dir).version == load_default_content().version
+
+    def test_stale_or_corrupt_snapshot_falls_back(self, content_dir):
+        """Edited sources or a damaged file fall back to the source files."""
+        target, _ = write_binary_snapshot(content_dir)
+        _edit(content_dir / "site.toml", "Welcome to My Portfolio", "Hello")
+        assert load_content(content_dir).home_card.card_title == "Hello"
+
+        target.write_bytes(b"PFCS-garbage")
+        with pytest.raises(ContentError):
+            load_binary_snapshot(target)
+        assert load_content(content_dir).home_card.card_title == "Hello"
+
+    def test_snapshot_from_other_sources_is_ignored(self, content_dir):
+        """A newer snapshot still loses to sources it was not built from."""
+        target, _ = write_binary_snapshot(content_dir)
+        _edit(content_dir / "site.toml", "Welcome to My Portfolio", "Hello")
+        os.utime(target, ns=(0, (content_dir / "site.toml").stat().st_mtime_ns + 1))
+
+        with pytest.raises(ContentError, match="other source files"):
+            load_binary_snapshot(target, source_digest(content_dir))
+        assert load_content(content_dir).home_card.card_title == "Hello"
+
+    def test_build_content_command(self, content_app, content_dir):
+        """``flask build content`` writes the snapshot next to the sources."""
+        result = content_app.test_cli_runner().invoke(args=["build", "content"])
+        assert result.exit_code == 0
+        assert "version" in result.output
+        assert (content_dir / SNAPSHOT_NAME).exists()
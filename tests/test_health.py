@@ -0,0 +1,80 @@
+"""
+Unit tests for the liveness and readiness probes.
+"""
+
+from app.core.health import (
+    LIVEZ_RESPONSE,
+    Readiness,
+    check_caches,
+    compile_templates,
+)
+
+TOKEN = {"X-Health-Token": "test-health-token"}
+
+
+class TestProbes:
+    """Test suite for /livez, /readyz and /health."""
+
+    def test_livez_is_answered_before_flask(self, app, client):
+        """Liveness is constant bytes, even for hosts Flask would reject."""
+        response = client.get("/livez", headers={"Host": "unknown.example"})
+        assert response.status_code == 200
+        assert response.data == b"ok\n"
+        assert response.headers["Cache-Control"] == "no-store"
+        assert LIVEZ_RESPONSE[2] == [b"ok\n"]
+
+    def test_readyz_reports_checks(self, client):
+        """A started app is ready and lists each check with a detail."""
+        response = client.get("/readyz", headers=TOKEN)
+        assert response.status_code == 200
+        checks = response.json["checks"]
+        assert set(checks) == {"templates", "content", "static_manifest", "caches"}
+        assert all(check["ok"] for check in checks.values())
+        assert checks["content"]["detail"].startswith("version ")
+
+    def test_readyz_is_503_until_every_check_passes(self, app, client):
+        """A failing or pending check makes the instance unready."""
+        app.extensions["readiness"].report("caches", False, "warming")
+        response = client.get("/readyz", headers=TOKEN)
+        assert response.status_code == 503
+        assert response.json["checks"]["caches"] == {"ok": False, "detail": "warming"}
+        assert client.get("/health").json["status"] == "starting"
+
+    def test_details_need_the_token(self, app, client):
+        """Without the token, probes only learn whether the instance is ready."""
+        app.extensions["readiness"].report("caches", False, "boom at /secret")
+        for headers in ({}, {"X-Health-Token": "wrong"}):
+            response = client.get("/readyz", headers=headers)
+            assert response.status_code == 503
+            assert response.data == b"not ready\n"
+        health = client.get("/health").json
+        assert health["checks"]["caches"] == "failing"
+        assert "render_cache" not in health
+        assert b"boom at /secret" in client.get("/health", headers=TOKEN).data
+
+    def test_caches_wait_for_warmup_when_enabled(self, app):
+        """The caches check only passes by itself when no warmup will run."""
+        readiness = Readiness(("caches",))
+        app.testing = False
+        check_caches(app, readiness)
+        assert readiness.checks["caches"] == {
+            "ok": False,
+            "detail": "waiting for warmup",
+        }
+        app.config["WARMUP_ON_START"] = False
+        check_caches(app, readiness)
+        assert readiness.ready
+
+    def test_pending_checks(self):
+        """Checks that were never reported are pending, not ready."""
+        readiness = Readiness(("templates",))
+        assert not readiness.ready
+        assert readiness.response[0] == "503 Service Unavailable"
+        readiness.report("templates", True)
+        assert readiness.response[0] == "200 OK"
+
+    def test_every_template_compiles(self, app):
+        """All templates compile (what /readyz checks outside of tests)."""
+        compiled, errors = compile_templates(app)
+        assert errors == []
+        assert compiled > 0
@@ -0,0 +1,190 @@
+"""
+Unit tests for the /img resize endpoint and its disk cache.
+"""
+
+import os
+import threading
+import time
+from io import BytesIO
+
+import pytest
+
+from app import create_app
+from app.core.images import DiskLRU
+
+Image = pytest.importorskip("PIL.Image")
+
+PHOTO = "/img/320/content/pacman-tattoo.jpg"
+LOGO = "/img/64/logos/logo-linkedin.png"
+
+
+@pytest.fixture
+def image_app(tmp_path):
+    return create_app(
+        {"TESTING": True, "SECRET_KEY": "test", "IMAGE_CACHE_DIR": str(tmp_path)}
+    )
+
+
+class TestResizeEndpoint:
+    """Test suite for resizing and format negotiation."""
+
+    @pytest.mark.parametrize(
+        "accept, mimetype",
+        [
+            ("image/avif,image/webp,*/*;q=0.8", "image/avif"),
+            ("image/webp,*/*;q=0.8", "image/webp"),
+            ("*/*", "image/jpeg"),
+        ],
+    )
+    def test_format_follows_accept(self, image_app, accept, mimetype):
+        """The best explicitly accepted format wins; JPEG is the fallback."""
+        if mimetype not in image_app.extensions["images"].formats:
+            pytest.skip(f"Pillow built without {mimetype}")
+        response = image_app.test_client().get(PHOTO, headers={"Accept": accept})
+        assert response.status_code == 200
+        assert response.mimetype == mimetype
+        assert "Accept" in response.headers["Vary"]
+        assert response.headers["ETag"]
+
+    def test_resized_width(self, image_app):
+        """Variants are resized to the requested width, never upscaled."""
+        client = image_app.test_client()
+        image = Image.open(BytesIO(client.get(PHOTO).data))
+        assert image.width == 320
+        original = Image.open(image_app.static_folder + "/images/logos/logo-alan.png")
+        wide = client.get("/img/2560/logos/logo-alan.png")
+        assert Image.open(BytesIO(wide.data)).width == original.width
+
+    def test_transparent_sources_fall_back_to_png(self, image_app):
+        """Without WebP/AVIF support in Accept, alpha images are sent as PNG."""
+        response = image_app.test_client().get(LOGO, headers={"Accept": "*/*"})
+        assert response.mimetype == "image/png"
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "/img/128/../../app/__init__.py",
+            "/img/128/logos/logo-js.svg",
+            "/img/128/content/missing.jpg",
+            "/img/0/content/pacman-tattoo.jpg",
+            "/img/99999/content/pacman-tattoo.jpg",
+        ],
+    )
+    def test_unservable_requests_404(self, image_app, url):
+        """Paths outside static/images, non-raster files and bad widths 404."""
+        assert image_app.test_client().get(url).status_code == 404
+
+    def test_widths_snap_to_breakpoints(self, image_app):
+        """Widths between breakpoints redirect up instead of being encoded."""
+        response = image_app.test_client().get("/img/300/content/pacman-tattoo.jpg")
+        assert response.status_code == 301
+        assert response.location.endswith(PHOTO)
+        assert image_app.extensions["images"].encodes == 0
+
+    def test_uncacheable_variants_are_still_served(self, image_app, monkeypatch):
+        """A failed cache write is a miss, not a server error."""
+        resizer = image_app.extensions["images"]
+
+        def replace(src, dst):
+            raise FileNotFoundError(src)
+
+        monkeypatch.setattr("app.core.images.os.replace", replace)
+        response = image_app.test_client().get(PHOTO)
+        assert response.status_code == 200
+        assert Image.open(BytesIO(response.data)).width == 320
+        assert resizer.stats()["failed_writes"] == 1
+
+    def test_variants_are_encoded_once(self, image_app):
+        """Repeated and concurrent requests share one encode."""
+        resizer = image_app.extensions["images"]
+        encode = resizer._encode
+
+        def slow_encode(*args):
+            time.sleep(0.2)
+            return encode(*args)
+
+        resizer._encode = slow_encode
+        threads = [
+            threading.Thread(target=image_app.test_client().get, args=(PHOTO,))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        image_app.test_client().get(PHOTO)
+        stats = resizer.stats()
+        assert stats["encodes"] == 1
+        assert stats["coalesced"] == 3
+        assert stats["hits"] == 1
+
+
+class TestSrcset:
+    """Test suite for linking pages to the resized variants."""
+
+    @pytest.mark.parametrize(
+        "url, image",
+        [
+            ("/", "content/cartoonized-alan-smith.png"),
+            ("/achievements", "content/linkedin-onix-genai-post.png"),
+        ],
+    )
+    def test_pages_link_resized_variants(self, image_app, url, image):
+        """Content images list an /img/ variant per breakpoint below their width."""
+        html = image_app.test_client().get(url).get_data(as_text=True)
+        assert f"/img/320/{image} 320w, /img/480/{image} 480w" in html
+        assert f"/static/images/{image} " in html
+        assert 'sizes="' in html
+
+    def test_no_variants_past_the_original_width(self, image_app):
+        """The original closes the srcset; no breakpoint would upscale it."""
+        from app.core.images import srcset
+        from app.core.media import media_registry
+
+        with image_app.test_request_context():
+            item = media_registry().get("images/content/cartoonized-alan-smith.png")
+            candidates = srcset(item).split(", ")
+        assert candidates[-2] == ("/img/960/content/cartoonized-alan-smith.png 960w")
+        assert candidates[-1] == (
+            "/static/images/content/cartoonized-alan-smith.png 1024w"
+        )
+
+
+class TestDiskLRU:
+    """Test suite for the byte-bounded variant cache."""
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """The oldest unused file is removed once the budget is exceeded."""
+        cache = DiskLRU(tmp_path, budget=250)
+        cache.put("a", b"a" * 100)
+        cache.put("b", b"b" * 100)
+        os.utime(tmp_path / "a", (1, 1))
+        os.utime(tmp_path / "b", (2, 2))
+        assert cache.get("a") is not None
+        cache.put("c", b"c" * 100)
+        assert cache.get("b") is None
+        assert not (tmp_path / "b").exists()
+        assert cache.size == 200
+
+    def test_survives_restarts(self, tmp_path):
+        """A new instance picks up existing files and drops stale temp files."""
+        DiskLRU(tmp_path).put("a", b"x" * 10)
+        (tmp_path / ".partial").write_bytes(b"junk")
+        (tmp_path / ".writing").write_bytes(b"junk")
+        os.utime(tmp_path / ".partial", (0, 0))
+        cache = DiskLRU(tmp_path)
+        assert cache.get("a") == tmp_path / "a"
+        assert cache.size == 10
+        assert not (tmp_path / ".partial").exists()
+        assert (tmp_path / ".writing").exists()
+
+    def test_budget_is_shared_through_the_directory(self, tmp_path):
+        """Two instances on one directory (two workers) enforce one budget."""
+        first = DiskLRU(tmp_path, budget=250)
+        second = DiskLRU(tmp_path, budget=250)
+        first.put("a", b"a" * 100)
+        os.utime(tmp_path / "a", (1, 1))
+        second.put("b", b"b" * 100)
+        first.put("c", b"c" * 100)
+        assert second.get("a") is None
+        assert first.size == second.size == 200
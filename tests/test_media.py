@@ -0,0 +1,287 @@
+"""
+Unit tests for the startup media registry and the video build step.
+"""
+
+import struct
+from pathlib import Path
+
+import pytest
+
+from app import create_app
+from app.build.media import mp4_metadata
+from app.build.video import (
+    GIF_MIN_BYTES,
+    master_playlist,
+    rendition_ladder,
+    transcode,
+    video_entry,
+)
+from app.core.media import CARD_BACKGROUND, CONTENT_ROOTS, MediaRegistry, media_registry
+from app.core.template_factory import ComponentFactory
+from app.utils.template_helpers import create_media_vars
+
+
+def _box(kind, payload):
+    return struct.pack(">I4s", 8 + len(payload), kind) + payload
+
+
+def _mp4(seconds=12, width=1280, height=720):
+    """Minimal ISO media file: ftyp, mdat, then moov with mvhd and a tkhd."""
+    mvhd = _box(b"mvhd", bytes(12) + struct.pack(">II", 1000, seconds * 1000))
+    tkhd = _box(b"tkhd", bytes(76) + struct.pack(">II", width << 16, height << 16))
+    moov = _box(b"moov", mvhd + _box(b"trak", tkhd))
+    return _box(b"ftyp", b"isom") + _box(b"mdat", bytes(64)) + moov
+
+
+@pytest.fixture
+def static(tmp_path):
+    (tmp_path / "videos/content").mkdir(parents=True)
+    (tmp_path / "videos/content/clip.mp4").write_bytes(_mp4())
+    (tmp_path / "images/content").mkdir(parents=True)
+    (tmp_path / "images/content/clip.jpg").write_bytes(b"not really a jpeg")
+    (tmp_path / "images/logos").mkdir()
+    (tmp_path / "images/logos/mark.svg").write_text('<svg viewBox="0 0 10 20"/>')
+    (tmp_path / "dist").mkdir()
+    (tmp_path / "dist/bundle.abc.png").write_bytes(b"x")
+    (tmp_path / "css").mkdir()
+    (tmp_path / "css/style.css").write_text("body{}")
+    return tmp_path
+
+
+class TestMediaRegistry:
+    """Test suite for scanning and looking up static media."""
+
+    def test_scan_indexes_media_only(self, static):
+        """Images and videos are indexed; stylesheets and dist/ are not."""
+        registry = MediaRegistry.scan(static)
+        assert set(registry.items) == {
+            "videos/content/clip.mp4",
+            "images/content/clip.jpg",
+            "images/logos/mark.svg",
+        }
+        logo = registry.get("images/logos/mark.svg")
+        assert (logo.kind, logo.mimetype) == ("image", "image/svg+xml")
+        assert logo.meta == {"width": 10, "height": 20}
+
+    def test_video_duration_and_size(self, static):
+        """MP4 duration and frame size are read from the moov box."""
+        assert mp4_metadata(static / "videos/content/clip.mp4") == {
+            "duration": 12.0,
+            "width": 1280,
+            "height": 720,
+        }
+        video = MediaRegistry.scan(static).get("videos/content/clip.mp4")
+        assert video.kind == "video"
+        assert video.duration == 12.0
+        assert video.url == "/static/videos/content/clip.mp4"
+
+    def test_find_by_url_and_content_roots(self, static):
+        """Names resolve directly, by URL, or relative to the kind's root."""
+        registry = MediaRegistry.scan(static)
+        video = registry.get("videos/content/clip.mp4")
+        assert registry.find("/static/videos/content/clip.mp4") is video
+        assert registry.find("clip.mp4", CONTENT_ROOTS) is video
+        assert registry.find("../logos/mark.svg", CONTENT_ROOTS).name == (
+            "images/logos/mark.svg"
+        )
+        assert registry.find("clip.mp4") is None
+
+    def test_siblings_are_variants(self, static):
+        """Files sharing a stem in one folder are listed as variants."""
+        (static / "images/content/clip.webp").write_bytes(b"webp")
+        jpeg = MediaRegistry.scan(static).get("images/content/clip.jpg")
+        assert jpeg.variants == {"image/webp": "/static/images/content/clip.webp"}
+
+    def test_missing_files_get_a_guessed_item(self, static):
+        """Unknown names still get a URL in the folder for their kind."""
+        registry = MediaRegistry.scan(static)
+        missing = registry.resolve("bell.mp4", CONTENT_ROOTS)
+        assert missing.url == "/static/videos/content/bell.mp4"
+        assert missing.kind == "video"
+        assert not missing.exists
+        assert missing.meta is None
+        assert registry.resolve("bell.mp4", CONTENT_ROOTS) is missing
+
+    def test_manifest_index_takes_precedence(self, static):
+        """Build-time metadata replaces header probing."""
+        index = {"images/content/clip.jpg": {"width": 4, "height": 3}}
+        jpeg = MediaRegistry.scan(static, index=index).get("images/content/clip.jpg")
+        assert jpeg.meta == {"width": 4, "height": 3}
+
+
+class TestMediaConsumers:
+    """Test suite for view models and factories reading the registry."""
+
+    def test_slides_carry_registry_type_and_url(self, app):
+        """Carousel slides take their URL and type from the registry.
+
+        A slide without media (the APL slide, until its video is added) has
+        neither, so the page does not request a missing file.
+        """
+        from app.data.carousel_factory import get_achievement_slides
+
+        with app.test_request_context():
+            slides = get_achievement_slides()
+        text_only = next(slide for slide in slides if slide["src"] is None)
+        assert text_only["media_type"] is None
+        logo = next(slide for slide in slides if "logo-york-u" in (slide["src"] or ""))
+        # Size-limited src; the original closes the srcset (without Pillow,
+        # src is the original itself)
+        assert logo["src"].endswith("logos/logo-york-u.png")
+        original = "/static/images/logos/logo-york-u.png"
+        assert original in (logo.get("srcset") or logo["src"])
+        assert logo["media_type"] == "image"
+
+    def test_urls_follow_the_application_root(self):
+        """Registry URLs come from url_for, so a mounted app gets its prefix."""
+        app = create_app({"TESTING": True, "APPLICATION_ROOT": "/portfolio"})
+        registry = app.extensions["media"]
+        logo = registry.get("images/logos/logo-york-u.png")
+        assert logo.url == "/portfolio/static/images/logos/logo-york-u.png"
+        guessed = registry.resolve("images/content/missing.jpg")
+        assert guessed.url == "/portfolio/static/images/content/missing.jpg"
+
+    def test_media_config_uses_registry(self, app):
+        """ComponentFactory.media_config no longer sniffs the extension."""
+        with app.app_context():
+            video = ComponentFactory.media_config("/static/videos/content/a.webm")
+            image = ComponentFactory.media_config(
+                "/static/images/content/pacman-tattoo.jpg"
+            )
+        assert video["type"] == "video"
+        assert image["type"] == "image"
+
+    def test_media_config_agrees_with_the_carousel(self, app, static):
+        """A transcoded GIF is a video in media_config, as on a slide."""
+        (static / "images/content/heavy.gif").write_bytes(b"GIF89a")
+        video = {"images/content/heavy.gif": video_entry("dist/g", [], gif=True)}
+        app.extensions["media"] = MediaRegistry.scan(static, video=video)
+        config = ComponentFactory.media_config("images/content/heavy.gif")
+        assert config["type"] == "video"
+
+    def test_home_card_image_url_comes_from_the_registry(self, app, client):
+        """The home card links the registry URL, without url_for per render."""
+        from app.core.images import sized_src
+        from app.data.all_data import get_home_card
+
+        with app.test_request_context():
+            card = get_home_card()
+            item = media_registry().get("images/content/cartoonized-alan-smith.png")
+            url = sized_src(item)
+        assert card["image_src"] == url
+        assert url.endswith("content/cartoonized-alan-smith.png")
+        assert f'src="{url}"'.encode() in client.get("/").data
+
+
+class TestVideoBuild:
+    """Test suite for the ffmpeg transcoding build step."""
+
+    def test_rendition_ladder_never_upscales(self):
+        """Sources get the renditions up to their own height."""
+        assert [h for h, _ in rendition_ladder(1080)] == [360, 720, 1080]
+        assert [h for h, _ in rendition_ladder(480)] == [360]
+        assert [h for h, _ in rendition_ladder(240)] == [360]
+        assert [h for h, _ in rendition_ladder(None)] == [360, 720]
+
+    def test_sources_prefer_hls_then_mp4_by_screen(self):
+        """HLS comes first, then a small-screen MP4 and the 720p default."""
+        entry = video_entry("dist/media/v.1", rendition_ladder(1080))
+        assert [source["src"] for source in entry["sources"]] == [
+            "dist/media/v.1/master.m3u8",
+            "dist/media/v.1/360p.mp4",
+            "dist/media/v.1/720p.mp4",
+        ]
+        assert entry["sources"][1]["media"] == "(max-width: 640px)"
+        assert entry["poster"] == "dist/media/v.1/poster.jpg"
+        small = video_entry("p", rendition_ladder(360))
+        assert [source["src"] for source in small["sources"]] == [
+            "p/master.m3u8",
+            "p/360p.mp4",
+        ]
+
+    def test_master_playlist_lists_renditions(self):
+        """The master playlist points at one media playlist per rendition."""
+        playlist = master_playlist(rendition_ladder(720), 16 / 9)
+        assert playlist.startswith("#EXTM3U\n")
+        assert "BANDWIDTH=896000,RESOLUTION=640x360\n360p.m3u8" in playlist
+        assert "RESOLUTION=1280x720\n720p.m3u8" in playlist
+
+    def test_transcode_writes_outputs_once(self, static):
+        """Outputs land in a source-hashed folder; reruns skip them."""
+        (static / "images/content/heavy.gif").write_bytes(b"G" * GIF_MIN_BYTES)
+        commands = []
+
+        def run(command, **kwargs):
+            commands.append(command)
+            Path(command[-1]).write_bytes(b"out")
+
+        entries = transcode(static, "ffmpeg", run=run, log=lambda line: None)
+        assert set(entries) == {
+            "videos/content/clip.mp4",
+            "images/content/heavy.gif",
+        }
+        video = entries["videos/content/clip.mp4"]
+        folder = static / video["hls"].rpartition("/")[0]
+        assert {path.name for path in folder.iterdir()} >= {
+            "poster.jpg",
+            "preview.mp4",
+            "360p.mp4",
+            "720p.mp4",
+            "master.m3u8",
+        }
+        assert "1080p.mp4" not in {path.name for path in folder.iterdir()}
+        gif = entries["images/content/heavy.gif"]
+        assert gif["sources"][0]["src"].endswith("/loop.mp4")
+
+        count = len(commands)
+        assert transcode(static, "ffmpeg", run=run, log=lambda line: None) == entries
+        assert len(commands) == count
+
+    def test_build_video_needs_ffmpeg(self, runner):
+        """Without ffmpeg the command fails with a clear message."""
+        result = runner.invoke(args=["build", "video", "--ffmpeg", "no-such-ffmpeg"])
+        assert result.exit_code != 0
+        assert "no-such-ffmpeg not found" in result.output
+
+    def test_registry_and_markup_use_transcoded_outputs(self, app, static):
+        """Posters and previews reach the video element; GIFs play as video."""
+        (static / "images/content/heavy.gif").write_bytes(b"GIF89a")
+        video = {
+            "videos/content/clip.mp4": video_entry("dist/v", rendition_ladder(720)),
+            "images/content/heavy.gif": video_entry("dist/g", [], gif=True),
+        }
+        registry = MediaRegistry.scan(static, video=video)
+        clip = registry.get("videos/content/clip.mp4")
+        assert clip.poster == "/static/dist/v/poster.jpg"
+        assert clip.sources[0]["src"] == "/static/dist/v/master.m3u8"
+        assert registry.get("images/content/heavy.gif").media_type == "video"
+
+        macros = app.jinja_env.get_template("components/common/media.html").module
+        with app.test_request_context():
+            html = macros.media(
+                **create_media_vars(
+                    clip.media_type,
+                    clip.url,
+                    poster=clip.poster,
+                    preview=clip.preview,
+                    sources=list(clip.sources),
+                )
+            )
+        assert 'poster="/static/dist/v/poster.jpg"' in html
+        assert '<source src="/static/dist/v/preview.mp4" type="video/mp4">' in html
+        assert "data-full-sources='[" in html
+        assert "master.m3u8" in html
+
+    def test_cards_play_the_transcoded_background(self, app, client):
+        """Card grids get a hover loop once the background GIF is transcoded."""
+        assert b"card-background-video" not in client.get("/techstack").data
+
+        video = {CARD_BACKGROUND: video_entry("dist/media/cards", [], gif=True)}
+        app.extensions["media"] = MediaRegistry.scan(app.static_folder, video=video)
+        app.extensions["tenants"].default.invalidate()
+        html = client.get("/techstack").data.decode()
+        assert html.count('<video class="card-background-video"') > 1
+        assert '<source src="/static/dist/media/cards/loop.mp4" type="video/mp4">' in (
+            html
+        )
+        assert "has-background-video" in html
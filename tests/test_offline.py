@@ -0,0 +1,87 @@
+"""
+Unit tests for the generated service worker and web app manifest.
+"""
+
+import json
+import re
+from pathlib import Path
+
+from app.core.assets import AssetManifest
+from app.core.offline import cache_version
+
+
+def _constant(script, name):
+    return json.loads(re.search(rf"var {name} = (.*);", script).group(1))
+
+
+class TestServiceWorker:
+    """Test suite for /sw.js."""
+
+    def test_precaches_pages_and_hashed_assets(self, app, client):
+        """Pages come from the route map, assets from the build manifest."""
+        app.extensions["assets"] = AssetManifest(
+            {"assets": {"css/bundle.css": "dist/css/bundle.1a2b3c4d.css"}}
+        )
+        response = client.get("/sw.js")
+        assert response.mimetype == "text/javascript"
+        assert response.headers["Cache-Control"] == "no-cache"
+        script = response.get_data(as_text=True)
+        pages = _constant(script, "PRECACHE_PAGES")
+        assert {"/", "/techstack", "/certifications"} <= set(pages)
+        assert "/health" not in pages and "/sw.js" not in pages
+        assert "/search" not in pages
+        assert _constant(script, "UNCACHED_PAGES") == ["/search"]
+        assert _constant(script, "PRECACHE_ASSETS") == [
+            "/static/dist/css/bundle.1a2b3c4d.css"
+        ]
+        assert _constant(script, "HASHED_PREFIX") == "/static/dist/"
+        assert "staleWhileRevalidate(event)" in script
+        revalidated = client.get(
+            "/sw.js", headers={"If-None-Match": response.headers["ETag"]}
+        )
+        assert revalidated.status_code == 304
+
+    def test_version_follows_content_and_assets(self):
+        """A content edit or a new hashed asset renames the caches."""
+        pages = ["/", "/techstack"]
+        version = cache_version("c1", pages, ["/static/dist/a.1.css"])
+        assert version == cache_version("c1", pages, ["/static/dist/a.1.css"])
+        assert version != cache_version("c2", pages, ["/static/dist/a.1.css"])
+        assert version != cache_version("c1", pages, ["/static/dist/a.2.css"])
+
+    def test_disabled_worker_unregisters(self, app, client):
+        """SERVICE_WORKER = false serves a worker that removes itself."""
+        app.config["SERVICE_WORKER"] = False
+        script = client.get("/sw.js").get_data(as_text=True)
+        assert "registration.unregister()" in script
+        assert "PRECACHE_PAGES" not in script
+        assert "data-service-worker" not in client.get("/connect").get_data(
+            as_text=True
+        )
+
+    def test_pages_register_worker_and_manifest(self, client):
+        """Pages link the manifest and tell scripts.js where the worker is."""
+        html = client.get("/connect").get_data(as_text=True)
+        assert '<link rel="manifest" href="/site.webmanifest">' in html
+        assert 'data-service-worker="/sw.js"' in html
+
+
+class TestWebManifest:
+    """Test suite for /site.webmanifest."""
+
+    def test_manifest_fields_and_icons(self, app, client):
+        """The manifest names the app and points at existing icons."""
+        response = client.get("/site.webmanifest")
+        assert response.mimetype == "application/manifest+json"
+        manifest = json.loads(response.data)
+        assert manifest["name"] == app.config["APP_NAME"]
+        assert (manifest["start_url"], manifest["display"]) == ("/", "standalone")
+        assert [icon["sizes"] for icon in manifest["icons"]] == ["192x192", "512x512"]
+        for icon in manifest["icons"]:
+            path = icon["src"].removeprefix(app.static_url_path + "/")
+            assert (Path(app.static_folder) / path).is_file()
+
+    def test_unknown_hosts_get_404(self, client):
+        """Like the pages, the files are only served to known tenants."""
+        response = client.get("/sw.js", headers={"Host": "unknown.example"})
+        assert response.status_code == 404
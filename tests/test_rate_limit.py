@@ -0,0 +1,158 @@
+"""
+Unit tests for the rate limiting and load shedding middleware.
+"""
+
+import threading
+
+import pytest
+
+from app import create_app
+from app.core.rate_limit import SharedTokenBuckets, TokenBuckets
+
+
+def _limited_app(**config):
+    return create_app({"TESTING": True, "SECRET_KEY": "test", **config})
+
+
+class TestTokenBuckets:
+    """Test suite for the in-process and shared token buckets."""
+
+    @pytest.mark.parametrize("shared", [False, True])
+    def test_burst_then_refill(self, tmp_path, shared):
+        """A bucket allows ``burst`` requests, then refills at ``rate``."""
+        buckets = (
+            SharedTokenBuckets(str(tmp_path / "buckets"), slots=64)
+            if shared
+            else TokenBuckets()
+        )
+        assert [buckets.take("ip:a", 2.0, 3, 100.0) for _ in range(3)] == [0.0] * 3
+        assert buckets.take("ip:a", 2.0, 3, 100.0) == pytest.approx(0.5)
+        assert buckets.take("ip:b", 2.0, 3, 100.0) == 0.0
+        assert buckets.take("ip:a", 2.0, 3, 100.5) == 0.0
+
+    def test_shared_buckets_are_visible_across_instances(self, tmp_path):
+        """Two mappings of one file (two workers) draw from the same bucket."""
+        path = str(tmp_path / "buckets")
+        first = SharedTokenBuckets(path, slots=64)
+        second = SharedTokenBuckets(path, slots=64)
+        assert first.take("ip:a", 1.0, 1, 10.0) == 0.0
+        assert second.take("ip:a", 1.0, 1, 10.0) > 0
+
+    def test_idle_buckets_are_evicted(self):
+        """Keys idle for a full wheel turn are dropped."""
+        buckets = TokenBuckets(idle=60.0, slots=6)
+        buckets.take("ip:a", 1.0, 5, 0.0)
+        buckets.take("ip:b", 1.0, 5, 30.0)
+        assert len(buckets) == 2
+        buckets.take("ip:b", 1.0, 5, 65.0)
+        assert len(buckets) == 1
+        buckets.take("ip:c", 1.0, 5, 1000.0)
+        assert len(buckets) == 1
+
+
+class TestRateLimitMiddleware:
+    """Test suite for 429 and 503 responses from the WSGI middleware."""
+
+    def test_client_over_limit_gets_429(self):
+        """A client past its burst gets 429 with Retry-After; others do not."""
+        app = _limited_app(RATE_LIMIT_PER_IP=0.5, RATE_LIMIT_IP_BURST=2)
+        client = app.test_client()
+        assert client.get("/").status_code == 200
+        assert client.get("/").status_code == 200
+        response = client.get("/")
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "2"
+        other = client.get("/", environ_base={"REMOTE_ADDR": "10.0.0.2"})
+        assert other.status_code == 200
+        assert app.extensions["rate_limit"].stats()["limited"] == 1
+
+    def test_forwarded_client_address_is_used(self):
+        """The proxy-appended X-Forwarded-For entry identifies the client."""
+        app = _limited_app(RATE_LIMIT_PER_IP=0.5, RATE_LIMIT_IP_BURST=1)
+        client = app.test_client()
+        spoofed = {"X-Forwarded-For": "1.1.1.1, 203.0.113.7"}
+        assert client.get("/", headers=spoofed).status_code == 200
+        spoofed = {"X-Forwarded-For": "2.2.2.2, 203.0.113.7"}
+        assert client.get("/", headers=spoofed).status_code == 429
+
+    def test_cdn_client_address_header_wins(self):
+        """A configured CDN header separates visitors behind one edge."""
+        app = _limited_app(
+            RATE_LIMIT_PER_IP=0.5,
+            RATE_LIMIT_IP_BURST=1,
+            RATE_LIMIT_CLIENT_IP_HEADER="Fastly-Client-IP",
+        )
+        client = app.test_client()
+        edge = {"X-Forwarded-For": "198.51.100.1"}
+        assert (
+            client.get("/", headers={**edge, "Fastly-Client-IP": "1.1.1.1"}).status_code
+            == 200
+        )
+        assert (
+            client.get("/", headers={**edge, "Fastly-Client-IP": "2.2.2.2"}).status_code
+            == 200
+        )
+        assert (
+            client.get("/", headers={**edge, "Fastly-Client-IP": "1.1.1.1"}).status_code
+            == 429
+        )
+
+    def test_page_sub_resources_use_the_asset_bucket(self):
+        """Slides, the service worker and the manifest spare the page budget."""
+        app = _limited_app(
+            RATE_LIMIT_PER_IP=0.5,
+            RATE_LIMIT_IP_BURST=1,
+            RATE_LIMIT_PER_ASSET=0.5,
+            RATE_LIMIT_ASSET_BURST=3,
+        )
+        client = app.test_client()
+        assert client.get("/sw.js").status_code == 200
+        assert client.get("/site.webmanifest").status_code == 200
+        assert client.get("/api/slides/achievementsCarousel/1").status_code == 200
+        assert client.get("/").status_code == 200
+        assert client.get("/sw.js").status_code == 429
+
+    def test_route_limit_and_exempt_endpoints(self):
+        """Each client has a bucket per route; health checks are never limited."""
+        app = _limited_app(RATE_LIMIT_PER_ROUTE=0.5, RATE_LIMIT_ROUTE_BURST=1)
+        client = app.test_client()
+        assert client.get("/techstack").status_code == 200
+        assert client.get("/techstack").status_code == 429
+        assert client.get("/education").status_code == 200
+        other = client.get("/techstack", environ_base={"REMOTE_ADDR": "10.0.0.2"})
+        assert other.status_code == 200
+        assert all(client.get("/health").status_code == 200 for _ in range(3))
+
+    def test_overload_is_shed_with_503(self):
+        """Requests beyond the in-flight cap get an immediate 503."""
+        app = _limited_app(RATE_LIMIT_MAX_IN_FLIGHT=1)
+        entered, release = threading.Event(), threading.Event()
+
+        @app.route("/slow")
+        def slow():
+            entered.set()
+            release.wait(5)
+            return "done"
+
+        results = []
+
+        def request_slow():
+            with app.test_client().get("/slow") as slow_response:
+                results.append(slow_response.status_code)
+
+        worker = threading.Thread(target=request_slow)
+        worker.start()
+        assert entered.wait(5)
+        response = app.test_client().get("/")
+        release.set()
+        worker.join(5)
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+        assert results == [200]
+        limiter = app.extensions["rate_limit"]
+        assert limiter.stats() == {"in_flight": 0, "limited": 0, "shed": 1}
+
+    def test_disabled(self):
+        """``RATE_LIMIT_ENABLED = false`` leaves the WSGI app unwrapped."""
+        app = _limited_app(RATE_LIMIT_ENABLED=False)
+        assert "rate_limit" not in app.extensions
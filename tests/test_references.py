@@ -0,0 +1,178 @@
+"""
+Unit tests for the static asset reference graph build step.
+"""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from app.build import references
+from app.build.references import ReferenceGraph, build_reference_graph, static_name
+from app.data.content_store import DEFAULT_CONTENT_DIR, current_content
+
+
+@pytest.fixture
+def built_app(app, tmp_path):
+    """App whose static folder is a temporary copy, so pruning stays isolated."""
+    static_copy = tmp_path / "static"
+    shutil.copytree(app.static_folder, static_copy)
+    app.static_folder = str(static_copy)
+    return app
+
+
+def _graph(app):
+    return build_reference_graph(app, current_content(), app.extensions["media"])
+
+
+class TestReferenceGraph:
+    """Test suite for reference extraction and the graph queries."""
+
+    def test_static_name_normalizes_paths(self):
+        """URLs and stylesheet-relative paths map to static-relative names."""
+        assert static_name("/static/images/a.png") == "images/a.png"
+        assert static_name("../images/a.png", "css") == "images/a.png"
+        assert static_name("images/logos") is None
+        assert static_name("data:image/png;base64,AAAA", "css") is None
+        assert static_name("https://example.com/images/a.png") is None
+
+    def test_app_graph_covers_every_source_kind(self, app):
+        """Templates, stylesheets, Python modules and content all add edges."""
+        graph = _graph(app)
+        assert graph.dangling() == {}
+        assert (
+            "css/style.css"
+            in graph.edges["templates/components/common/header/head.html"]
+        )
+        assert graph.edges["static/css/cards.css"] == {
+            "images/content/card-backgrounds.gif"
+        }
+        assert graph.edges["data/404_error.py"] == {"images/errors/404.png"}
+        assert "images/favicons/favicon.svg" in graph.edges["core/preload.py"]
+        assert graph.unresolved() == {}
+        assert graph.edges["content:home_card"] == {
+            "images/content/cartoonized-alan-smith.png"
+        }
+        unused = graph.unreferenced()
+        assert "images/content/carousel-layout copy.png" in unused
+        assert "images/content/donkey-santuary-5k-alan-og.jpg" in unused
+        assert "images/content/dcard-backgrounds.gif" in unused
+        assert "images/content/donkey-santuary-5k-alan.jpg" not in unused
+        assert "images/favicons/web-app-manifest-512x512.png" not in unused
+
+    def test_patterns_keep_matching_files(self, tmp_path):
+        """``{}`` placeholders match within one folder; no match is unresolved."""
+        for name in (
+            "images/icon-192.png",
+            "images/icon-512.png",
+            "images/x/icon-1.png",
+        ):
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).write_bytes(b"1234")
+        graph = ReferenceGraph(
+            tmp_path,
+            [
+                ("core/a.py", "images/icon-{size}.png"),
+                ("core/b.py", "images/logo-{}.svg"),
+            ],
+        )
+        assert graph.patterns["images/icon-{size}.png"] == [
+            "images/icon-192.png",
+            "images/icon-512.png",
+        ]
+        assert graph.dangling() == {}
+        assert graph.unresolved() == {"images/logo-{}.svg": ["core/b.py"]}
+        assert graph.unreferenced() == ["images/x/icon-1.png"]
+        with pytest.raises(ValueError):
+            graph.prune()
+        assert (tmp_path / "images/x/icon-1.png").exists()
+
+    def test_dangling_siblings_and_prune(self, tmp_path):
+        """Missing files list their sources; variants survive a prune."""
+        for name in ("images/a.jpg", "images/a.webp", "images/old/b.png", ".keep"):
+            (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / name).write_bytes(b"1234")
+        (tmp_path / "dist").mkdir()
+        (tmp_path / "dist/c.png").write_bytes(b"x")
+        graph = ReferenceGraph(
+            tmp_path,
+            [
+                ("page.html", "images/a.jpg"),
+                ("page.html", "videos/v.mp4"),
+                ("data/x.py", "videos/v.mp4"),
+            ],
+        )
+        assert graph.dangling() == {"videos/v.mp4": ["data/x.py", "page.html"]}
+        assert graph.unreferenced() == ["images/old/b.png"]
+        assert graph.prune() == [("images/old/b.png", 4)]
+        assert not (tmp_path / "images/old").exists()
+        assert (tmp_path / "images/a.webp").exists()
+        assert (tmp_path / "dist/c.png").exists() and (tmp_path / ".keep").exists()
+
+
+class TestBuildRefsCommand:
+    """Test suite for ``flask build refs``."""
+
+    def test_missing_file_fails_the_build(self, built_app, runner):
+        """A reference to a deleted file exits non-zero and names its source."""
+        (Path(built_app.static_folder) / "images/errors/404.png").unlink()
+        result = runner.invoke(args=["build", "refs"])
+        assert result.exit_code != 0
+        assert "missing images/errors/404.png <- data/404_error.py" in result.output
+
+    def test_prune_refuses_unresolved_patterns(self, built_app, runner, monkeypatch):
+        """A pattern matching no file stops ``--prune`` before it deletes."""
+        python_references = references.python_references
+
+        def with_pattern(app_root):
+            yield from python_references(app_root)
+            yield "core/icons.py", "images/icons/icon-{size}.png"
+
+        monkeypatch.setattr(references, "python_references", with_pattern)
+        result = runner.invoke(args=["build", "refs", "--prune"])
+        assert result.exit_code != 0
+        assert "unresolved images/icons/icon-{size}.png <- core/icons.py" in (
+            result.output
+        )
+        static = Path(built_app.static_folder)
+        assert (static / "images/content/carousel-layout copy.png").exists()
+
+    def test_prune_strips_unreferenced_files(self, built_app, runner, client):
+        """``--prune`` deletes unused files; the pages still render."""
+        static = Path(built_app.static_folder)
+        result = runner.invoke(args=["build", "refs", "--prune"])
+        assert result.exit_code == 0, result.output
+        assert "removed: images/content/carousel-layout.png" in result.output
+        assert not (static / "images/content/carousel-layout copy.png").exists()
+        assert (static / "images/content/card-backgrounds.gif").exists()
+        assert _graph(built_app).unreferenced() == []
+        assert client.get("/achievements").status_code == 200
+
+    def test_prune_keeps_files_tenant_content_references(
+        self, built_app, runner, tmp_path
+    ):
+        """Media only a tenant's content names survives ``--prune``."""
+        tenant = tmp_path / "tenants" / "alice.example.com"
+        shutil.copytree(DEFAULT_CONTENT_DIR, tenant)
+        site = tenant / "site.toml"
+        site.write_text(
+            site.read_text("utf-8").replace(
+                "cartoonized-alan-smith.png", "carousel-layout.png"
+            ),
+            "utf-8",
+        )
+        built_app.config["TENANTS_DIR"] = str(tenant.parent)
+        result = runner.invoke(args=["build", "refs", "--prune"])
+        assert result.exit_code == 0, result.output
+        static = Path(built_app.static_folder)
+        assert (static / "images/content/carousel-layout.png").exists()
+        assert not (static / "images/content/carousel-layout copy.png").exists()
+
+    def test_prune_refuses_missing_tenants_dir(self, built_app, runner, tmp_path):
+        """Tenant content that is not there at build time blocks ``--prune``."""
+        built_app.config["TENANTS_DIR"] = str(tmp_path / "mounted-at-runtime")
+        result = runner.invoke(args=["build", "refs", "--prune"])
+        assert result.exit_code != 0
+        assert "not pruning" in result.output
+        static = Path(built_app.static_folder)
+        assert (static / "images/content/carousel-layout copy.png").exists()
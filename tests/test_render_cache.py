@@ -0,0 +1,204 @@
+"""
+Unit tests for the stale-while-revalidate page render cache.
+"""
+
+import gzip
+import threading
+
+import pytest
+
+from app.core.http_cache import CachedPayload
+from app.core.render_cache import CachedRender, PageCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def tenant(app):
+    return app.extensions["tenants"].default
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return PageCache(ttl=10, stale=100, clock=clock)
+
+
+class TestPageCache:
+    """Test suite for TTL, stale serving and single-flight behaviour."""
+
+    def test_fresh_entries_are_hits(self, cache, tenant):
+        """A fresh entry is served without calling the renderer."""
+        calls = []
+        render = lambda: calls.append(1) or "page"  # noqa: E731
+        assert cache.get(tenant, "k", render) == "page"
+        assert cache.get(tenant, "k", render) == "page"
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_stale_entries_refresh_once_in_background(self, cache, tenant, clock):
+        """Stale pages are served immediately while one refresh runs."""
+        cache.get(tenant, "k", lambda: "v1")
+        clock.now += 20
+        release = threading.Event()
+        refreshes = []
+
+        def refresh():
+            release.wait(5)
+            refreshes.append(1)
+            return "v2"
+
+        assert cache.get(tenant, "k", None, refresh) == "v1"
+        assert cache.get(tenant, "k", None, refresh) == "v1"
+        release.set()
+        cache.drain(5)
+        assert refreshes == [1]
+        assert cache.get(tenant, "k", None) == "v2"
+        stats = cache.stats()
+        assert (stats["stale"], stats["refreshes"], stats["refreshing"]) == (2, 1, 0)
+
+    def test_refresh_is_built_only_when_scheduled(self, cache, tenant, clock):
+        """Hits and misses never build the background refresh callable."""
+        built = []
+
+        def make_refresh():
+            built.append(1)
+            return lambda: "v2"
+
+        assert cache.lookup(tenant, "k", make_refresh) is None
+        cache.get(tenant, "k", lambda: "v1")
+        assert cache.lookup(tenant, "k", make_refresh).body == "v1"
+        assert built == []
+        clock.now += 20
+        assert cache.lookup(tenant, "k", make_refresh).body == "v1"
+        cache.drain(5)
+        assert built == [1]
+
+    def test_expired_entries_render_inline(self, cache, tenant, clock):
+        """Past the stale window the page is rendered in the request."""
+        cache.get(tenant, "k", lambda: "v1")
+        clock.now += 200
+        assert cache.get(tenant, "k", lambda: "v2") == "v2"
+
+    def test_refresh_errors_keep_stale_page(self, cache, tenant, clock):
+        """A failing background render is counted and the stale page kept."""
+        cache.get(tenant, "k", lambda: "v1")
+        clock.now += 20
+
+        def broken():
+            raise RuntimeError("template error")
+
+        assert cache.get(tenant, "k", broken) == "v1"
+        cache.drain(5)
+        assert cache.stats()["errors"] == 1
+        assert cache.get(tenant, "k", broken) == "v1"
+
+    def test_concurrent_misses_are_coalesced(self, cache, tenant):
+        """Concurrent misses for one key wait on a single render."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def render():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "page"
+
+        results = []
+        leader = threading.Thread(
+            target=lambda: results.append(cache.get(tenant, "k", render))
+        )
+        leader.start()
+        started.wait(5)
+        waiters = [
+            threading.Thread(
+                target=lambda: results.append(cache.get(tenant, "k", render))
+            )
+            for _ in range(4)
+        ]
+        for thread in waiters:
+            thread.start()
+        while cache.stats()["coalesced"] < 4:
+            threading.Event().wait(0.01)
+        release.set()
+        for thread in [leader, *waiters]:
+            thread.join(5)
+        assert results == ["page"] * 5
+        assert calls == [1]
+
+    def test_leader_errors_propagate(self, cache, tenant):
+        """A failed render raises and caches nothing."""
+
+        def broken():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            cache.get(tenant, "k", broken)
+        assert cache.get(tenant, "k", lambda: "ok") == "ok"
+
+    def test_streams_are_cached_once_complete(self, cache, tenant):
+        """A stream caches its body at the end; a concurrent one does not wait."""
+        chunks = cache.stream(tenant, "k", lambda: (chunk for chunk in "ab"))
+        assert next(chunks) == "a"
+        assert list(cache.stream(tenant, "k", lambda: (chunk for chunk in "x"))) == [
+            "x"
+        ]
+        assert cache.lookup(tenant, "k", None) is None
+        assert list(chunks) == ["b"]
+        assert cache.get(tenant, "k", None) == "ab"
+        assert cache.stats()["misses"] == 2
+
+    def test_dropped_streams_cache_nothing(self, cache, tenant):
+        """Closing a stream early (client gone) leaves the page uncached."""
+        chunks = cache.stream(tenant, "k", lambda: (chunk for chunk in "ab"))
+        chunks.close()
+        assert cache.get(tenant, "k", lambda: "rendered") == "rendered"
+
+    def test_pages_use_fast_compression(self):
+        """Pages compress at a fast level; built-once payloads at the maximum."""
+        body = "<p>portfolio</p>" * 200
+        page = CachedRender(body, 0).payload.encodings["gzip"]
+        payload = CachedPayload(body.encode("utf-8"), "text/html")
+        assert gzip.decompress(page) == body.encode("utf-8")
+        # gzip XFL header byte: 2 = maximum compression, 0 = default levels
+        assert page[8] == 0
+        assert payload.encodings["gzip"][8] == 2
+
+
+class TestRoutePageCache:
+    """Test suite for page routes rendered through the cache."""
+
+    def test_routes_reuse_rendered_pages(self, app, client):
+        """The second request for a page is a cache hit with the same body."""
+        first = client.get("/connect")
+        second = client.get("/connect")
+        assert first.data == second.data
+        assert app.extensions["page_cache"].stats()["hits"] >= 1
+        assert "Link" in second.headers
+
+    def test_pages_are_keyed_by_path(self, app, client):
+        """Paths sharing a template get separate entries (nav active state)."""
+        client.get("/")
+        client.get("/home")
+        pages = app.extensions["tenants"].default.cache("pages")
+        assert ("/", "pages/home.html") in pages
+        assert ("/home", "pages/home.html") in pages
+
+    def test_health_reports_cache_stats(self, client):
+        """The health endpoint exposes the render cache counters."""
+        client.get("/connect")
+        headers = {"X-Health-Token": "test-health-token"}
+        stats = client.get("/health", headers=headers).json["render_cache"]
+        assert stats["misses"] >= 1
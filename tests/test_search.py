@@ -0,0 +1,146 @@
+"""
+Unit tests for the site search index, page and API.
+"""
+
+from app.data.search import PrefixTrie, SearchIndex, tokenize
+
+
+def _index(cache_size=4):
+    return SearchIndex(
+        [
+            {
+                "title": "Python",
+                "text": "Backend language",
+                "section": "Tech",
+                "url": "/a",
+            },
+            {
+                "title": "Docker",
+                "text": "Python images",
+                "section": "Tech",
+                "url": "/b",
+            },
+            {"title": "Pytest", "subtitle": "Testing", "section": "Tech", "url": "/c"},
+            {"title": "Café Crème", "section": "IRL", "url": "/d"},
+        ],
+        cache_size,
+    )
+
+
+class TestSearchIndex:
+    """Test suite for tokenization, matching and ranking."""
+
+    def test_tokenize_folds_accents_and_drops_stop_words(self):
+        """Terms are lowercase ASCII; common words are not indexed."""
+        assert tokenize("The Café and the Crème!") == ["cafe", "creme"]
+
+    def test_title_matches_rank_first(self):
+        """A title hit outweighs the same word in the body text."""
+        titles = [result["title"] for result in _index().search("python ")]
+        assert titles == ["Python", "Docker"]
+
+    def test_every_term_must_match(self):
+        """Queries are AND; stop words are ignored."""
+        index = _index()
+        assert [r["title"] for r in index.search("python images ")] == ["Docker"]
+        assert [r["title"] for r in index.search("the docker ")] == ["Docker"]
+        assert index.search("python cafe ") == ()
+        assert index.search("the ") == ()
+
+    def test_last_word_matches_as_prefix_while_typing(self):
+        """``py`` finds both Python and Pytest until a space ends the word."""
+        index = _index()
+        assert {r["title"] for r in index.search("py", prefix=True)} == {
+            "Python",
+            "Docker",
+            "Pytest",
+        }
+        assert index.search("py ", prefix=True) == ()
+        assert [r["title"] for r in index.search("cre", prefix=True)] == ["Café Crème"]
+
+    def test_submitted_searches_match_whole_words(self):
+        """Without ``prefix`` the last word is not completed."""
+        index = _index()
+        assert index.search("py") == ()
+        assert [r["title"] for r in index.search("pytest")] == ["Pytest"]
+
+    def test_prefix_matches_every_completion(self):
+        """Prefix matches are not limited to the trie's top completions."""
+        documents = [
+            {"title": f"Word{number:02d}", "section": "S", "url": "/"}
+            for number in range(20)
+        ]
+        index = SearchIndex(documents)
+        assert len(index.prefix_terms("word")) == 20
+        assert len(index.search("wor", prefix=True)) == 20
+
+    def test_query_cache_is_bounded(self):
+        """The least recently used query is evicted past the cache size."""
+        index = _index(cache_size=2)
+        first = index.search("python")
+        assert index.search("python") is first
+        assert index.search("python", prefix=True) is not first
+        index.search("docker")
+        index.search("pytest")
+        assert len(index._cache) == 2
+        assert index.search("python") is not first
+
+
+class TestAutocomplete:
+    """Test suite for the prefix trie and suggestions."""
+
+    def test_trie_keeps_most_frequent_completions(self):
+        """Each node lists its completions by frequency, capped at ``size``."""
+        trie = PrefixTrie({"python": 5, "pytest": 2, "pydantic": 2, "java": 1}, size=2)
+        assert trie.complete("py") == ("python", "pydantic")
+        assert trie.complete("pyt") == ("python", "pytest")
+        assert trie.complete("x") == ()
+
+    def test_suggestions_complete_the_query(self):
+        """Earlier words are kept and narrow the completions."""
+        index = _index()
+        assert set(index.suggest("py")) == {"python", "pytest"}
+        assert index.suggest("docker py") == ("docker python",)
+        assert index.suggest("py ") == ()
+
+
+class TestSearchRoutes:
+    """Test suite for /search and /api/search."""
+
+    def test_search_page_lists_results(self, client):
+        """Results link to the page that shows the item."""
+        response = client.get("/search?q=google+cloud")
+        assert response.status_code == 200
+        html = response.get_data(as_text=True)
+        assert "Google Cloud Associate Cloud Engineer" in html
+        assert 'href="/certifications"' in html
+        assert 'data-suggest-src="/api/search/suggest"' in html
+
+    def test_search_page_does_not_complete_words(self, client):
+        """A submitted ``goo`` is a word of its own, not a prefix of ``google``."""
+        html = client.get("/search?q=goo").get_data(as_text=True)
+        assert "Google Cloud" not in html
+        assert "Google Cloud" in client.get("/search?q=google").get_data(as_text=True)
+
+    def test_empty_query_renders_form_only(self, client):
+        """Without a query the page is just the search box."""
+        html = client.get("/search").get_data(as_text=True)
+        assert 'role="search"' in html
+        assert "list-group-item" not in html
+
+    def test_nav_links_to_search(self, client):
+        """Every page's navbar offers search."""
+        assert 'href="/search"' in client.get("/connect").get_data(as_text=True)
+
+    def test_api_search_and_suggest(self, client):
+        """The API returns result dicts and whole-query suggestions."""
+        data = client.get("/api/search?q=google+cloud&limit=2").get_json()
+        assert data["query"] == "google cloud"
+        assert len(data["results"]) == 2
+        assert {"title", "snippet", "section", "url", "href"} <= set(data["results"][0])
+        typing = client.get("/api/search?q=google+clo&prefix=1").get_json()
+        assert typing["results"]
+        assert client.get("/api/search?q=google+clo").get_json()["results"] == []
+        suggestions = client.get("/api/search/suggest?q=google+c").get_json()
+        assert suggestions["suggestions"][0] == "google cloud"
+        assert all(s.startswith("google c") for s in suggestions["suggestions"])
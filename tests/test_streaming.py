@@ -0,0 +1,65 @@
+"""
+Unit tests for streamed page renders.
+"""
+
+import zlib
+
+import pytest
+
+
+@pytest.fixture
+def streaming(app):
+    """The app with streaming on (TESTING turns it off)."""
+    app.testing = False
+    return app
+
+
+def _chunks(client, path, **headers):
+    with client.get(path, headers=headers) as response:
+        return response, list(response.response)
+
+
+class TestStreamedPages:
+    """Test suite for early flushes, compression and cache fallback."""
+
+    def test_head_and_navbar_flush_before_content(self, streaming, client):
+        """The first chunk ends after the navbar; the cards come later."""
+        response, chunks = _chunks(client, "/techstack")
+        assert "Content-Length" not in response.headers
+        assert "ETag" not in response.headers
+        assert len(chunks) >= 3
+        assert b"</head>" in chunks[0] and b"</nav>" in chunks[0]
+        assert b"card-logo" not in chunks[0]
+        assert b"card-logo" in b"".join(chunks[1:])
+        assert b"".join(chunks).rstrip().endswith(b"</html>")
+
+    def test_gzip_chunks_decode_as_they_arrive(self, streaming, client):
+        """Each gzip chunk is sync-flushed, so the head decodes on its own."""
+        response, chunks = _chunks(client, "/techstack", **{"Accept-Encoding": "gzip"})
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.vary
+        decoder = zlib.decompressobj(31)
+        assert b"</nav>" in decoder.decompress(chunks[0])
+        body = decoder.decompress(b"".join(chunks[1:])) + decoder.flush()
+        assert body.rstrip().endswith(b"</html>")
+
+    def test_cached_pages_are_buffered_with_etag(self, streaming, client):
+        """After the streamed miss the page is served whole, with an ETag."""
+        _, chunks = _chunks(client, "/certifications")
+        cached = client.get("/certifications")
+        assert "Content-Length" in cached.headers
+        assert cached.data == b"".join(chunks)
+        assert cached.headers["Cache-Control"].startswith("public, max-age=60")
+        revalidated = client.get(
+            "/certifications", headers={"If-None-Match": cached.headers["ETag"]}
+        )
+        assert revalidated.status_code == 304
+        compressed = client.get("/certifications", headers={"Accept-Encoding": "gzip"})
+        assert compressed.headers["Content-Encoding"] == "gzip"
+
+    def test_stream_pages_off_renders_buffered(self, streaming, client):
+        """``STREAM_PAGES = false`` renders misses in one piece."""
+        streaming.config["STREAM_PAGES"] = False
+        response = client.get("/techstack")
+        assert "Content-Length" in response.headers
+        assert "ETag" in response.headers
@@ -0,0 +1,87 @@
+"""
+Unit tests for compile-time template minification.
+"""
+
+import pytest
+from jinja2 import DictLoader, Environment
+
+from app import create_app
+from app.core.template_minify import HtmlMinifyExtension, minify_html
+
+
+def render(source, template="page.html", **context):
+    env = Environment(
+        loader=DictLoader({template: source}), extensions=[HtmlMinifyExtension]
+    )
+    return env.get_template(template).render(**context)
+
+
+class TestMinifyHtml:
+    """Test suite for the source rewrite."""
+
+    def test_indentation_and_comments_are_stripped(self):
+        """Indentation, space runs and comments go; line count stays."""
+        source = "<div>\n    <!-- note\n spans -->\n    <p>a    b</p>\n  </div>\n"
+        minified = minify_html(source)
+        assert minified == "<div>\n\n\n<p>a b</p>\n</div>\n"
+        assert minified.count("\n") == source.count("\n")
+
+    @pytest.mark.parametrize("tag", ["pre", "textarea", "script", "style"])
+    def test_whitespace_sensitive_elements_are_preserved(self, tag):
+        """Bodies of pre/textarea/script/style are left as written."""
+        body = f"<{tag} class='x'>\n    keep   this\n  <!-- too -->\n</{tag}>"
+        assert minify_html(f"<div>\n    {body}\n  </div>") == f"<div>\n{body}\n</div>"
+
+    def test_jinja_tags_are_untouched(self):
+        """Expressions, raw blocks and comments holding tags survive."""
+        source = (
+            "<p title=\"{{ '  spaced  ' }}\">x</p>\n"
+            "<!-- {{ counter() }} -->\n"
+            "{% raw %}  {{ literal }}  {% endraw %}\n"
+            "<!--[if IE]><p>old</p><![endif]-->"
+        )
+        assert minify_html(source) == source
+
+    def test_tag_only_lines_render_nothing(self):
+        """A line holding only statement tags does not leave a blank line."""
+        source = (
+            "<ul>\n  {% for i in items %}\n    <li>{{ i }}</li>\n  {% endfor %}\n</ul>"
+        )
+        assert render(source, items=[1, 2]) == "<ul>\n<li>1</li>\n<li>2</li>\n</ul>"
+
+    def test_lines_with_expressions_keep_their_break(self):
+        """A trailing tag after an expression does not glue the next line on."""
+        for tail in ("{# note #}", "{% if true %}{% endif %}"):
+            source = f"Hello\n{{{{ name }}}}{tail}\nWorld"
+            assert render(source, name="Alice") == "Hello\nAlice\nWorld"
+
+    def test_inline_words_stay_separated(self):
+        """Whitespace between words and inline tags collapses, never vanishes."""
+        source = "<p>\n  Hello\n  {% if name %}\n  {{ name }}\n  {% endif %}\n  !</p>"
+        assert render(source, name="Ada") == "<p>\nHello\nAda\n!</p>"
+        assert render(source, name="") == "<p>\nHello\n!</p>"
+
+    def test_non_html_templates_pass_through(self):
+        """Only .html templates are rewritten."""
+        source = "line   one\n    line two\n"
+        assert render(source, template="robots.txt") == source.rstrip("\n")
+
+
+class TestTemplateMinifyConfig:
+    """Test suite for the app integration."""
+
+    def test_pages_are_smaller(self):
+        """Rendered pages shrink when MINIFY_TEMPLATES is on (the default)."""
+        sizes = {}
+        for enabled in (True, False):
+            app = create_app(
+                {"TESTING": True, "SECRET_KEY": "test", "MINIFY_TEMPLATES": enabled}
+            )
+            sizes[enabled] = len(app.test_client().get("/techstack").data)
+        assert sizes[True] < sizes[False] * 0.9
+
+    def test_minified_pages_keep_content(self, client):
+        """Minified markup is indentation-free and keeps the page content."""
+        html = client.get("/education").get_data(as_text=True)
+        assert "\n    <" not in html
+        assert "EDUCATION" in html
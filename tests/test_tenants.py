@@ -0,0 +1,207 @@
+"""
+Unit tests for Host-based tenant resolution and the shared render cache.
+"""
+
+import shutil
+import threading
+
+import pytest
+
+from app import create_app
+from app.core import tenants
+from app.core.tenants import RenderCache, resolve_tenant
+from app.data.all_data import get_shared_data
+from app.data.card_factory import get_common_sources
+from app.data.content_store import DEFAULT_CONTENT_DIR, ContentError, ContentStore
+
+
+def _add_tenant(tenants_dir, host, title):
+    """Create a tenant content directory whose home card has ``title``."""
+    path = tenants_dir / host
+    shutil.copytree(DEFAULT_CONTENT_DIR, path)
+    site = path / "site.toml"
+    site.write_text(
+        site.read_text("utf-8").replace("Welcome to My Portfolio", title), "utf-8"
+    )
+    return path
+
+
+@pytest.fixture
+def tenants_dir(tmp_path):
+    path = tmp_path / "tenants"
+    path.mkdir()
+    _add_tenant(path, "alice.example.com", "Alice Portfolio")
+    _add_tenant(path, "bob.example.com", "Bob Portfolio")
+    (path / "www.alice.example.com").symlink_to(path / "alice.example.com")
+    return path
+
+
+@pytest.fixture
+def tenants_app(tenants_dir):
+    return create_app(
+        {"TESTING": True, "SECRET_KEY": "test", "TENANTS_DIR": str(tenants_dir)}
+    )
+
+
+class TestTenantResolution:
+    """Test suite for serving content by Host header."""
+
+    def test_tenants_load_lazily_on_first_request(self, tenants_app):
+        """Tenant content is loaded by the first request for its host."""
+        registry = tenants_app.extensions["tenants"]
+        assert registry.loaded == []
+        client = tenants_app.test_client()
+        response = client.get("/", headers={"Host": "alice.example.com"})
+        assert b"Alice Portfolio" in response.data
+        assert [tenant.key for tenant in registry.loaded] == [
+            str((registry.tenants_dir / "alice.example.com").resolve())
+        ]
+
+    def test_default_hosts_keep_default_content(self, tenants_app):
+        """Configured hosts still serve the default content."""
+        client = tenants_app.test_client()
+        client.get("/", headers={"Host": "alice.example.com"})
+        response = client.get("/", headers={"Host": "localhost"})
+        assert b"Welcome to My Portfolio" in response.data
+
+    def test_aliases_share_one_tenant(self, tenants_app):
+        """Hosts pointing at the same directory share snapshot and caches."""
+        client = tenants_app.test_client()
+        client.get("/", headers={"Host": "alice.example.com"})
+        response = client.get("/", headers={"Host": "www.alice.example.com:8080"})
+        assert b"Alice Portfolio" in response.data
+        assert len(tenants_app.extensions["tenants"].loaded) == 1
+
+    def test_unknown_hosts_return_404(self, tenants_app):
+        """Hosts without a tenant directory are hidden behind a 404."""
+        client = tenants_app.test_client()
+        response = client.get("/", headers={"Host": "portfolio-abc.a.run.app"})
+        assert response.status_code == 404
+
+    @pytest.mark.parametrize("host", ["..", "alice.example.com/..", "", "-a.com"])
+    def test_malformed_hosts_never_touch_the_filesystem(self, tenants_app, host):
+        """Only well-formed hostnames are looked up in the tenants directory."""
+        assert tenants_app.extensions["tenants"].resolve(host) is None
+
+    def test_unknown_hosts_are_remembered(self, tenants_app, tenants_dir):
+        """A miss is cached until its TTL passes, then looked up again."""
+        registry = tenants_app.extensions["tenants"]
+        assert registry.resolve("carol.example.com") is None
+        _add_tenant(tenants_dir, "carol.example.com", "Carol Portfolio")
+        assert registry.resolve("carol.example.com") is None
+        registry._unknown["carol.example.com"] = 0.0  # expire the entry
+        assert registry.resolve("carol.example.com") is not None
+
+    def test_broken_tenants_are_remembered(self, tenants_app, tenants_dir):
+        """A tenant that fails to load is not re-parsed until its TTL passes."""
+        registry = tenants_app.extensions["tenants"]
+        site = tenants_dir / "bob.example.com" / "site.toml"
+        good = site.read_text("utf-8")
+        site.write_text(good.replace("[home_card]", "[home_card"), "utf-8")
+        with pytest.raises(ValueError):
+            registry.resolve("bob.example.com")
+
+        site.write_text(good, "utf-8")
+        with pytest.raises(ContentError):
+            registry.resolve("bob.example.com")
+        key = str((tenants_dir / "bob.example.com").resolve())
+        registry._broken[key] = (0.0, "expired")  # expire the entry
+        assert registry.resolve("bob.example.com") is not None
+
+    def test_slow_tenant_loads_once_without_blocking_others(
+        self, tenants_app, monkeypatch
+    ):
+        """Requests for a loading tenant wait for it; other hosts do not."""
+        registry = tenants_app.extensions["tenants"]
+        started, release = threading.Event(), threading.Event()
+        loads = []
+
+        def slow_store(path):
+            loads.append(path.name)
+            if path.name == "alice.example.com":
+                started.set()
+                release.wait(5)
+            return ContentStore(path)
+
+        monkeypatch.setattr(tenants, "ContentStore", slow_store)
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(registry.resolve("alice.example.com"))
+            )
+            for _ in range(2)
+        ]
+        for thread in threads:
+            thread.start()
+        assert started.wait(5)
+        assert registry.resolve("bob.example.com") is not None
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        assert results[0] is results[1] is not None
+        assert sorted(loads) == ["alice.example.com", "bob.example.com"]
+
+    def test_links_and_metadata_come_from_tenant_content(
+        self, tenants_app, tenants_dir
+    ):
+        """Footer links, shared data and citations never leak across tenants."""
+        links = tenants_dir / "bob.example.com" / "social_links.toml"
+        links.write_text(
+            links.read_text("utf-8").replace("SmithAndGiggles", "bob-builds"), "utf-8"
+        )
+        client = tenants_app.test_client()
+        bob = client.get("/", headers={"Host": "bob.example.com"})
+        assert b"https://github.com/bob-builds" in bob.data
+        default = client.get("/", headers={"Host": "localhost"})
+        assert b"https://github.com/bob-builds" not in default.data
+        with tenants_app.test_request_context(headers={"Host": "bob.example.com"}):
+            resolve_tenant()
+            shared = get_shared_data()
+            assert shared["external_links"]["github_profile"].endswith("bob-builds")
+            assert shared["meta_data"]["author"] == "Alan Smith"
+            assert get_common_sources()["mayo_clinic_picc"]["href"].startswith(
+                "https://www.mayoclinic.org/"
+            )
+
+    def test_least_recently_used_tenant_is_unloaded(self, tenants_dir):
+        """Only ``MAX_TENANTS`` tenants stay loaded; their caches go with them."""
+        app = create_app(
+            {"TESTING": True, "TENANTS_DIR": str(tenants_dir), "MAX_TENANTS": 1}
+        )
+        registry = app.extensions["tenants"]
+        client = app.test_client()
+        client.get("/", headers={"Host": "alice.example.com"})
+        alice = registry.loaded[0]
+        assert "home" in alice.cache("view_models")
+
+        response = client.get("/", headers={"Host": "bob.example.com"})
+        assert b"Bob Portfolio" in response.data
+        assert registry.loaded != [alice]
+        assert "home" not in alice.cache("view_models")
+
+
+class TestRenderCache:
+    """Test suite for the byte-bounded render cache shared by tenants."""
+
+    def test_budget_evicts_least_recently_used(self):
+        """Entries beyond the byte budget evict the oldest across tenants."""
+        cache = RenderCache(budget=300)
+        cache.set(("a", "pages", 1), "x" * 100)
+        cache.set(("b", "pages", 1), "y" * 100)
+        cache.get(("a", "pages", 1))
+        cache.set(("c", "pages", 1), "z" * 100)
+        assert cache.get(("b", "pages", 1)) is None
+        assert cache.get(("a", "pages", 1)) == "x" * 100
+        assert cache.size <= cache.budget
+        assert cache.stats()["evictions"] == 1
+
+    def test_drop_tenant_and_oversized_values(self):
+        """Tenant entries are dropped together; oversized values are not kept."""
+        cache = RenderCache(budget=1000)
+        cache.set(("a", "pages", 1), "x")
+        cache.set(("a", "api", 2), "y")
+        cache.set(("b", "pages", 1), "z")
+        cache.drop_tenant("a")
+        assert len(cache) == 1
+        cache.set(("b", "pages", 2), "w" * 2000)
+        assert cache.get(("b", "pages", 2)) is None
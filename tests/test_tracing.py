@@ -0,0 +1,109 @@
+"""
+Unit tests for request tracing and OTLP/JSON export.
+"""
+
+import json
+
+import pytest
+
+from app import create_app
+
+PARENT = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+
+@pytest.fixture
+def traced_app(tmp_path):
+    def factory(sample_rate=1.0):
+        path = tmp_path / "traces.jsonl"
+        app = create_app(
+            {
+                "TESTING": True,
+                "SECRET_KEY": "test",
+                "TRACING_EXPORT_PATH": str(path),
+                "TRACING_SAMPLE_RATE": sample_rate,
+            }
+        )
+        return app, path
+
+    return factory
+
+
+def _spans(app, path):
+    app.extensions["tracing"].writer.flush(timeout=5)
+    if not path.exists():
+        return []
+    return [
+        span
+        for line in path.read_text("utf-8").splitlines()
+        for span in json.loads(line)["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    ]
+
+
+class TestTracing:
+    """Test suite for request spans, propagation and sampling."""
+
+    def test_request_phases_are_spanned(self, traced_app):
+        """A sampled page request spans host check, data, context and render."""
+        app, path = traced_app()
+        response = app.test_client().get("/techstack")
+        spans = {span["name"]: span for span in _spans(app, path)}
+
+        root = spans["GET /techstack"]
+        assert root["kind"] == 2
+        assert root["parentSpanId"] == ""
+        for name in (
+            "tenant.resolve",
+            "view_model.build",
+            "render",
+            "context_processor.nav_links",
+            "context_processor.footer_links",
+        ):
+            assert spans[name]["traceId"] == root["traceId"]
+        assert spans["tenant.resolve"]["parentSpanId"] == root["spanId"]
+        assert spans["context_processor.nav_links"]["parentSpanId"] == (
+            spans["render"]["spanId"]
+        )
+        status = {"key": "http.response.status_code", "value": {"intValue": "200"}}
+        assert status in root["attributes"]
+        assert "traceresponse" not in response.headers  # CDN-cacheable page
+
+    def test_uncacheable_responses_carry_traceresponse(self, traced_app):
+        """Only responses no shared cache stores return their trace id."""
+        app, path = traced_app()
+        response = app.test_client().get("/health")
+        root = _spans(app, path)[-1]
+        assert response.headers["traceresponse"] == (
+            f"00-{root['traceId']}-{root['spanId']}-01"
+        )
+
+    def test_traceparent_continues_the_callers_trace(self, traced_app):
+        """A sampled request joins the trace of an incoming traceparent."""
+        app, path = traced_app()
+        app.test_client().get("/", headers={"traceparent": PARENT})
+        root = _spans(app, path)[-1]
+        assert root["traceId"] == PARENT.split("-")[1]
+        assert root["parentSpanId"] == PARENT.split("-")[2]
+
+    def test_clients_cannot_force_sampling(self, traced_app):
+        """The sampled flag is only followed from trusted proxies."""
+        app, path = traced_app(sample_rate=0.0)
+        app.test_client().get("/", headers={"traceparent": PARENT})
+        assert _spans(app, path) == []
+
+        app.extensions["tracing"].trust_parent = True
+        app.test_client().get("/", headers={"traceparent": PARENT})
+        assert _spans(app, path)[-1]["traceId"] == PARENT.split("-")[1]
+
+    def test_unsampled_requests_export_nothing(self, traced_app):
+        """Rate 0 and a not-sampled parent flag both skip tracing."""
+        app, path = traced_app(sample_rate=0.0)
+        client = app.test_client()
+        response = client.get("/")
+        client.get("/", headers={"traceparent": PARENT[:-2] + "00"})
+        assert "traceresponse" not in response.headers
+        assert _spans(app, path) == []
+
+    def test_disabled_without_export_path(self):
+        """Tracing hooks are only installed when an export path is set."""
+        app = create_app({"TESTING": True})
+        assert "tracing" not in app.extensions
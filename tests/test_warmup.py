@@ -0,0 +1,101 @@
+"""
+Unit tests for the startup cache warmer.
+"""
+
+from app.core.warmup import (
+    init_warmup,
+    page_urls,
+    retry_failures,
+    tenant_hosts,
+    warm_caches,
+)
+
+TOKEN = {"X-Health-Token": "test-health-token"}
+
+
+class TestWarmup:
+    """Test suite for pre-rendering pages and payloads before serving."""
+
+    def test_page_urls_skip_uncacheable_and_parameterized_routes(self, app):
+        """Only cacheable, argument-free pages of the routes blueprint warm."""
+        urls = page_urls(app)
+        assert "/techstack" in urls and "/" in urls
+        assert "/health" not in urls
+        assert not any(url.startswith(("/api", "/static")) for url in urls)
+
+    def test_aliases_of_one_tenant_warm_once(self, app):
+        """Hosts that share the default content are warmed through one host."""
+        assert tenant_hosts(app) == ["portfolio.me2u.space"]
+
+    def test_warm_caches_fills_pages_and_payloads(self, app, client):
+        """After warming, visitors hit the page cache and cached payloads."""
+        report = warm_caches(app)
+        assert report["failures"] == []
+        assert report["requests"] == len(page_urls(app)) + 1 + 5 + 5
+
+        page_cache = app.extensions["page_cache"]
+        misses = page_cache.stats()["misses"]
+        client.get("/techstack")
+        assert page_cache.stats()["misses"] == misses
+        payloads = app.extensions["tenants"].default.cache("api_payloads")
+        assert ("collection", "technologies") in payloads
+        assert app.extensions["rate_limit"].stats()["limited"] == 0
+
+    def test_readiness_waits_for_warmup(self, app, client):
+        """The caches check reports the warm time once warmup has run."""
+        app.testing = False
+        report = init_warmup(app)
+        readyz = client.get("/readyz", headers=TOKEN).json
+        assert readyz["ready"] is True
+        assert readyz["checks"]["caches"]["detail"] == (
+            f"{report['requests']} URLs warmed in {report['seconds']}s"
+        )
+
+    def test_failures_keep_the_instance_unready(self, app, client, monkeypatch):
+        """A page that fails to render during warmup fails readiness."""
+        app.testing = False
+        app.config["WARMUP_RETRY_INTERVAL"] = 0
+        monkeypatch.setattr(
+            "app.core.warmup.page_urls", lambda app: ["/techstack", "/boom"]
+        )
+
+        @app.route("/boom")
+        def boom():
+            raise RuntimeError("boom")
+
+        init_warmup(app)
+        response = client.get("/readyz", headers=TOKEN)
+        assert response.status_code == 503
+        assert "/boom 500" in response.json["checks"]["caches"]["detail"]
+
+    def test_failed_urls_are_retried(self, app, client, monkeypatch):
+        """A transient failure turns ready once its URL warms on a retry."""
+        app.testing = False
+        app.config["WARMUP_RETRY_INTERVAL"] = 0
+        monkeypatch.setattr("app.core.warmup.page_urls", lambda app: ["/flaky"])
+        calls = []
+
+        @app.route("/flaky")
+        def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("not yet")
+            return "ok"
+
+        report = init_warmup(app)
+        assert [url for _, url in report["failed"]] == ["/flaky"]
+        assert client.get("/readyz").status_code == 503
+        assert retry_failures(app, report, 0) == 1
+        assert client.get("/readyz").status_code == 200
+
+    def test_cli_commands_skip_warmup(self, app):
+        """Loading the app for a ``flask`` command does not warm the caches."""
+        app.testing = False
+
+        @app.cli.command("probe-warmup")
+        def probe_warmup():
+            print(init_warmup(app))
+
+        result = app.test_cli_runner().invoke(args=["probe-warmup"])
+        assert result.output == "None\n"
+        assert "warmup" not in app.extensions